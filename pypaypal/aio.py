@@ -0,0 +1,494 @@
+"""Module with asyncio http session handling.
+
+   Async sessions need the optional aiohttp dependency:
+
+        pip install pypaypal[async]
+"""
+import asyncio
+
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+except ImportError: # pragma: no cover
+    aiohttp = None
+
+from pypaypal.throttling import RateLimiter
+from pypaypal.codec import _NOT_PARSED, JsonCodec, StdlibCodec, default_codec, encode_body
+from pypaypal.errors import IdentityError, ExpiredSessionError
+
+from pypaypal.http import (
+    AuthType,
+    parse_url,
+    SessionMode,
+    PayPalToken,
+    RetryPolicy,
+    SessionStatus,
+    TransportOptions,
+    LEGACY_LIVE_API_BASE_URL,
+    LEGACY_SANDBOX_API_BASE_URL
+)
+
+def _require_aiohttp():
+    """Checks that the optional aiohttp dependency is installed
+
+    Raises:
+        ImportError: If aiohttp is not available
+    """
+    if aiohttp is None:
+        raise ImportError('Async sessions require aiohttp, install it with: pip install pypaypal[async]')
+
+def _create_async_transport(options: TransportOptions) -> 'aiohttp.ClientSession':
+    """Creates a pooled asyncio transport with the given settings
+
+    Arguments:
+        options {TransportOptions} -- connection pool settings
+
+    Returns:
+        aiohttp.ClientSession -- A client session with a pooled connector
+    """
+    _require_aiohttp()
+    connector = aiohttp.TCPConnector(
+        limit=options.pool_connections * options.pool_maxsize,
+        limit_per_host=options.pool_maxsize,
+        force_close=not options.keep_alive
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+def _query_params(params: dict) -> dict:
+    """Adapts query string parameters to the asyncio transport,
+       dropping null entries and rendering booleans as the requests library does.
+
+    Arguments:
+        params {dict} -- query string parameters
+
+    Returns:
+        dict -- transport safe parameters
+    """
+    if not params:
+        return None
+    return { k: str(v) if isinstance(v, bool) else v for k,v in params.items() if v != None }
+
+class AsyncResponse:
+    """Buffered http response for asyncio requests.
+
+       Exposes the same members the clients read from a requests response
+       (status_code, headers, content, text & json) so the entity parsing
+       is shared between the blocking and the asyncio clients.
+    """
+    def __init__(self, status_code: int, headers: dict, content: bytes, url: str = None, reason: str = None, codec: JsonCodec = None):
+        self.url = url
+        self.reason = reason
+        self.content = content
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self._codec = codec or StdlibCodec()
+        self._json = _NOT_PARSED
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8') if self.content else ''
+
+    def json(self, **kwargs):
+        """Parses the response body (once), the parsed body
+           is shared between every call so it shouldn't be modified.
+
+        Returns:
+            The parsed json body
+        """
+        if self._json is _NOT_PARSED:
+            self._json = self._codec.loads(self.content)
+        return self._json
+
+    def __repr__(self):
+        return f'<AsyncResponse [{self.status_code}]>'
+
+async def _send(transport: 'aiohttp.ClientSession', method: str, url: str, codec: JsonCodec = None, **kwargs) -> AsyncResponse:
+    """Performs a request and buffers the response
+
+    Arguments:
+        transport {aiohttp.ClientSession} -- the asyncio transport
+        method {str} -- http method
+        url {str} -- request URL
+
+    Keyword Arguments:
+        codec {JsonCodec} -- codec for the response body (default: {None})
+
+    Returns:
+        AsyncResponse -- The buffered response
+    """
+    if 'params' in kwargs:
+        kwargs['params'] = _query_params(kwargs['params'])
+
+    async with transport.request(method, url, **kwargs) as response:
+        content = await response.read()
+        return AsyncResponse(response.status, response.headers, content, str(response.url), response.reason, codec)
+
+async def _authenticate(client_id: str, secret: str, mode: SessionMode, transport: 'aiohttp.ClientSession') -> PayPalToken:
+    """Basic authentication that returns a PayPalToken
+
+    Arguments:
+        client_id {str} -- paypal client id
+        secret {str} -- paypal client secret
+        mode {SessionMode} -- Desired session mode (LIVE or SANDBOX)
+        transport {aiohttp.ClientSession} -- the asyncio transport
+
+    Raises:
+        IdentityError: If the user fails to authenticate
+
+    Returns:
+        PayPalToken -- An immutable object with the token information
+    """
+    base = LEGACY_LIVE_API_BASE_URL if mode == SessionMode.LIVE else LEGACY_SANDBOX_API_BASE_URL
+    url = parse_url(base, '/oauth2/token')
+    body = { 'grant_type' : 'client_credentials' }
+
+    headers = {
+        'Accept': 'application/json',
+        'Content-Type': 'application/x-www-form-urlencoded'
+    }
+
+    response = await _send(transport, 'POST', url, data=body, auth=aiohttp.BasicAuth(client_id, secret), headers=headers)
+
+    if response.status_code != 200:
+        raise IdentityError(response)
+
+    return PayPalToken.serialize(response.json())
+
+class AsyncPayPalSession:
+    """PayPal session for asyncio applications.
+
+        Handles the three session types of the blocking sessions:
+
+        TOKEN: requests with a token that expires with the session.
+        BASIC: basic auth requests, using the token while it's valid.
+        REFRESHABLE: token requests refreshing the token through basic auth
+        up to an optional refresh limit.
+
+        A single session can keep many requests in flight on one event loop,
+        all of them sharing a pooled keep-alive connector.
+    """
+    def __init__(
+            self, auth_type: AuthType, session_mode: SessionMode, token: PayPalToken,
+            client: str = None, secret: str = None, refresh_limit: int = None,
+            transport_options: TransportOptions = None, transport: 'aiohttp.ClientSession' = None,
+            retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, codec: JsonCodec = None
+        ):
+        """Constructor
+
+        Arguments:
+            auth_type {AuthType} -- The instance session type
+            session_mode {SessionMode} -- The instance session mode
+            token {PayPalToken} -- The instance initial access token
+
+        Keyword Arguments:
+            client {str} -- paypal client id, required for BASIC & REFRESHABLE sessions (default: {None})
+            secret {str} -- paypal client secret, required for BASIC & REFRESHABLE sessions (default: {None})
+            refresh_limit {int} -- max amount of token refreshes, unlimited if None (default: {None})
+            transport_options {TransportOptions} -- connection pool settings (default: {None})
+            transport {aiohttp.ClientSession} -- an already open transport to be reused (default: {None})
+            retry_policy {RetryPolicy} -- retry settings for transient failures (default: {None})
+            rate_limiter {RateLimiter} -- client side rate limits by API family (default: {None})
+            codec {JsonCodec} -- json codec for bodies & responses, the fastest available if None (default: {None})
+        """
+        _require_aiohttp()
+        self._client = client
+        self._secret = secret
+        self._paypal_token = token
+        self._transport = transport
+        self._refresh_limit = refresh_limit
+        self._refresh_lock = asyncio.Lock()
+        self._transport_options = transport_options or TransportOptions()
+        self.auth_type = auth_type
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.codec = codec or default_codec()
+        self.session_mode = session_mode
+        self.status = SessionStatus.ACTIVE
+
+    def _get_transport(self) -> 'aiohttp.ClientSession':
+        """Gets the pooled transport, creating it inside the running loop on first use
+
+        Returns:
+            aiohttp.ClientSession -- the session transport
+        """
+        if self._transport is None:
+            self._transport = _create_async_transport(self._transport_options)
+        return self._transport
+
+    async def _check_token(self) -> PayPalToken:
+        if self.status != SessionStatus.ACTIVE and self.status != SessionStatus.EXPIRED:
+            raise ExpiredSessionError(self)
+
+        if self.auth_type == AuthType.BASIC:
+            if self._paypal_token != None and self._paypal_token.is_expired():
+                self._paypal_token = None
+            return self._paypal_token
+
+        if self.status == SessionStatus.ACTIVE and (self._paypal_token == None or self._paypal_token.is_expired()):
+            self.status = SessionStatus.EXPIRED
+
+        if self.status == SessionStatus.EXPIRED and self.auth_type == AuthType.REFRESHABLE:
+            async with self._refresh_lock:
+                # Another task might have refreshed the token while this one waited
+                if self.status == SessionStatus.EXPIRED and (self._refresh_limit == None or self._refresh_limit > 0):
+                    if self._refresh_limit != None:
+                        self._refresh_limit -= 1
+                    self._paypal_token = await _authenticate(self._client, self._secret, self.session_mode, self._get_transport())
+                    self.status = SessionStatus.ACTIVE
+
+        if self.status != SessionStatus.ACTIVE:
+            raise ExpiredSessionError(self)
+
+        return self._paypal_token
+
+    def _prepare_headers(self, token: PayPalToken, custom_headers:dict=None) -> dict:
+        """Gets the headers to be used on every request
+
+        Arguments:
+            token {PayPalToken} -- access token
+
+        Keyword Arguments:
+            custom_headers {dict} -- custom headers (default: {None})
+
+        Returns:
+            dict -- a merged dictionary with basic and custom headers
+        """
+        headers = { 'Content-Type': 'application/json' }
+
+        if token:
+            headers['Authorization'] = f'{token.token_type} {token.access_token}'
+
+        return { **headers, **custom_headers } if custom_headers else headers
+
+    async def _request(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """Performs an authorized request through the session pooled transport
+
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+
+        Raises:
+            ExpiredSessionError: If the session is in an invalid state
+            IdentityError: If a basic auth request is unauthorized
+
+        Returns:
+            AsyncResponse -- The buffered response
+        """
+        token = await self._check_token()
+        kwargs['headers'] = self._prepare_headers(token, kwargs.get('headers'))
+
+        if token == None:
+            kwargs['auth'] = aiohttp.BasicAuth(self._client, self._secret)
+
+        if kwargs.get('data') != None:
+            kwargs['data'] = encode_body(self.codec, kwargs['data'])
+
+        response = await self._send_with_retries(method, url, **kwargs)
+
+        if self.auth_type == AuthType.BASIC and response.status_code == 401:
+            raise IdentityError(response)
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """Sends a single request, waiting for the rate limiter if the session has one
+
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+
+        Returns:
+            AsyncResponse -- The buffered response
+        """
+        if self.rate_limiter == None:
+            return await _send(self._get_transport(), method, url, self.codec, **kwargs)
+
+        async with self.rate_limiter.acquire_async(url):
+            return await _send(self._get_transport(), method, url, self.codec, **kwargs)
+
+    async def _send_with_retries(self, method: str, url: str, **kwargs) -> AsyncResponse:
+        """Sends a request retrying transient failures if the session has a retry policy
+
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+
+        Returns:
+            AsyncResponse -- The buffered response
+        """
+        policy = self.retry_policy
+
+        if policy == None:
+            return await self._send(method, url, **kwargs)
+
+        kwargs['headers'] = policy.prepare_headers(method, kwargs.get('headers'))
+        retryable = policy.can_retry(method, kwargs['headers'])
+        retry_exceptions = policy.retry_exceptions + (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        attempt = 1
+
+        while True:
+            try:
+                response = await self._send(method, url, **kwargs)
+            except retry_exceptions:
+                if not retryable or attempt >= policy.max_attempts:
+                    raise
+                await asyncio.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+
+            if not retryable or not policy.should_retry(attempt, response):
+                return response
+
+            await asyncio.sleep(policy.delay(attempt, response))
+            attempt += 1
+
+    async def get(self, url: str, params:dict=None, **kwargs) -> AsyncResponse:
+        """Secured get request
+
+        Arguments:
+            url {str} -- The request URL
+
+        Keyword Arguments:
+            params {dict} -- query string parameters (default: {None})
+
+        Raises:
+            ExpiredSessionError: If the session is in an invalid state
+
+        Returns:
+            AsyncResponse -- An http response
+        """
+        return await self._request('GET', url, params=params, **kwargs)
+
+    async def post(self, url: str, body, **kwargs) -> AsyncResponse:
+        """Secured post request
+
+        Arguments:
+            url {str} -- Request URL
+            body {[type]} -- Request body
+        """
+        return await self._request('POST', url, data=body, **kwargs)
+
+    async def put(self, url: str, body, **kwargs) -> AsyncResponse:
+        """Secured put request
+
+        Arguments:
+            url {str} -- Request URL
+            body {[type]} -- Request body
+        """
+        return await self._request('PUT', url, data=body, **kwargs)
+
+    async def patch(self, url: str, body, **kwargs) -> AsyncResponse:
+        """Secured patch request
+
+        Arguments:
+            url {str} -- Request URL
+            body {[type]} -- Request body
+        """
+        return await self._request('PATCH', url, data=body, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncResponse:
+        """Secured delete request
+
+        Arguments:
+            url {str} -- Request URL
+        """
+        return await self._request('DELETE', url, **kwargs)
+
+    async def _dispose(self):
+        """Disposes this instance closing the pooled transport
+        """
+        self._client = None
+        self._secret = None
+        self._refresh_limit = 0
+        self._paypal_token = None
+        self.status = SessionStatus.DISPOSED
+
+        if self._transport:
+            await self._transport.close()
+            self._transport = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self._dispose()
+
+    def __repr__(self):
+        return f'AsyncPayPalSession(auth_type={self.auth_type}, session_mode={self.session_mode}, status={self.status}, client={self._client})'
+
+    def __str__(self):
+        return self.__repr__()
+
+def session_from_token(
+        token: PayPalToken, mode: SessionMode, transport_options: TransportOptions = None, 
+        retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, codec: JsonCodec = None
+    ) -> AsyncPayPalSession:
+    """Creates an asyncio session from a given token
+
+    Arguments:
+        token {PayPalToken} -- A valid paypal token instance
+        mode {SessionMode} -- Desired session mode (LIVE or SANDBOX)
+
+    Keyword Arguments:
+        transport_options {TransportOptions} -- connection pool settings (default: {None})
+        retry_policy {RetryPolicy} -- retry settings for transient failures (default: {None})
+        rate_limiter {RateLimiter} -- client side rate limits by API family (default: {None})
+        codec {JsonCodec} -- json codec for bodies & responses, the fastest available if None (default: {None})
+
+    Returns:
+        AsyncPayPalSession -- A paypal session for all the api http requests
+    """
+    return AsyncPayPalSession(
+        AuthType.TOKEN, mode, token, transport_options=transport_options, 
+        retry_policy=retry_policy, rate_limiter=rate_limiter, codec=codec
+    )
+
+async def authenticate(client_id: str, secret: str, mode: SessionMode, auth_type: AuthType=AuthType.REFRESHABLE, **kwargs) -> AsyncPayPalSession:
+    """Creates an asyncio session for a given user. If a session handles any kind of
+       flags it can be received as a kwarg.
+
+       Supported flags -> 'refresh_limit' for refreshable sessions.
+                          'transport_options' (TransportOptions) for every session type.
+                          'retry_policy' (RetryPolicy) to retry transient failures for every session type.
+                          'rate_limiter' (RateLimiter) to throttle requests by API family for every session type.
+                          'codec' (JsonCodec) to encode bodies & parse responses for every session type.
+
+    Arguments:
+        client_id {str} -- paypal client id
+        secret {str} -- paypal client secret
+        mode {SessionMode} -- Desired session mode (LIVE or SANDBOX)
+        auth_type {AuthType} -- Desired session type (BASIC, TOKEN, REFRESHABLE)
+
+    Raises:
+        IdentityError: If the user fails to authenticate
+
+    Returns:
+        AsyncPayPalSession -- A paypal session for all the api http requests
+    """
+    _require_aiohttp()
+    options = kwargs.get('transport_options') or TransportOptions()
+    transport = _create_async_transport(options)
+
+    try:
+        token = await _authenticate(client_id, secret, mode, transport)
+    except:
+        await transport.close()
+        raise
+
+    if auth_type == AuthType.TOKEN:
+        return AsyncPayPalSession(
+            auth_type, mode, token, transport_options=options, 
+            transport=transport, retry_policy=kwargs.get('retry_policy'), rate_limiter=kwargs.get('rate_limiter'),
+            codec=kwargs.get('codec')
+        )
+
+    return AsyncPayPalSession(
+        auth_type, mode, token, client_id, secret, kwargs.get('refresh_limit'),
+        transport_options=options, transport=transport, 
+        retry_policy=kwargs.get('retry_policy'), rate_limiter=kwargs.get('rate_limiter'),
+        codec=kwargs.get('codec')
+    )
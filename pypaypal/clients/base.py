@@ -2,9 +2,16 @@
     Base module with common needs for every resource client
 """
 
-from typing import Type
+import asyncio
+import functools
+import itertools
+
+from collections import deque
+from typing import Any, Type, Callable, Iterator, Generator, NamedTuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from pypaypal.http import PayPalSession
+from pypaypal.errors import PageRequestError
 
 from pypaypal.entities.base import ( 
     T, 
@@ -12,13 +19,75 @@ from pypaypal.entities.base import (
     PaypalPage, 
     ResponseType,
     RequestMethod, 
-    PaypalApiResponse
+    PaypalApiResponse,
+    in_context,
+    parse_entities
 )
 
+
+class SessionCall(NamedTuple):
+    """A request to be performed by the session of the client running an api operation.
+    """
+    method: str
+    args: tuple
+    kwargs: dict
+
+    def perform(self, session: PayPalSession):
+        """Performs the request with a given session
+        
+        Arguments:
+            session {PayPalSession} -- The session (a coroutine is returned for async sessions)
+        """
+        return getattr(session, self.method)(*self.args, **self.kwargs)
+
+
+class _SessionCalls:
+    """
+        Mirrors the session request methods, building the session calls instead of performing them.
+    """
+    def get(self, *args, **kwargs) -> SessionCall:
+        return SessionCall('get', args, kwargs)
+
+    def post(self, *args, **kwargs) -> SessionCall:
+        return SessionCall('post', args, kwargs)
+
+    def put(self, *args, **kwargs) -> SessionCall:
+        return SessionCall('put', args, kwargs)
+
+    def patch(self, *args, **kwargs) -> SessionCall:
+        return SessionCall('patch', args, kwargs)
+
+    def delete(self, *args, **kwargs) -> SessionCall:
+        return SessionCall('delete', args, kwargs)
+
+
+def api_operation(operation: Callable) -> Callable:
+    """Decorator for the client methods calling the API. 
+
+       The method is written once as a generator yielding its session calls 
+       (e.g. api_response = yield self._request.get(url)) and returning its 
+       result, the client transport runs it: blocking clients perform the calls 
+       in place while asyncio clients return a coroutine awaiting them. That way 
+       the request building & response parsing is shared by both kinds of client.
+    
+    Arguments:
+        operation {Callable} -- The generator method
+
+    Returns:
+        Callable -- The client method
+    """
+    @functools.wraps(operation)
+    def run(self, *args, **kwargs):
+        return self._run(operation(self, *args, **kwargs))
+    return run
+
+
 class ClientBase:
     """
         Base client class for every resource client.
     """
+    _request = _SessionCalls()
+
     def __init__(self, base_url: str, session: PayPalSession):
         """Class ctor
         
@@ -29,6 +98,7 @@ class ClientBase:
         self._session = session
         self._base_url = base_url
     
+    @api_operation
     def _get_element_details(self, url: str, element_id: str, element_class: Type[T], response_type: ResponseType) -> PaypalApiResponse[T]:
         """Calls the API to get an element detail by it's id
         
@@ -39,18 +109,29 @@ class ClientBase:
         Returns:
             PaypalApiResponse[T] -- A response wrapper with the object & operation result
         """
+        api_response = yield self._request.get(url, headers = { 'Prefer': response_type.as_header_value() })
 
-    def _page_from_link(self, link: ActionLink, element_key: str, element_class: Type[T]) -> PaypalPage[T]:
+        if api_response.status_code != 200:
+            return PaypalApiResponse.error(api_response)
+
+        return PaypalApiResponse.success(api_response, element_class.serialize_from_json(api_response.json(), response_type))
+
+    @api_operation
+    def _page_from_link(self, link: ActionLink, element_key: str, element_class: Type[T], lazy: bool = False) -> PaypalPage[T]:
         """Performs an API call to get a page of elements
         
         Arguments:
             link {ActionLink} -- Page action link (HATEOAS)
             element_key {str} -- The key for the element lists inside the page json
             element_class {T} -- class reference of a PayPalEntity subclass
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
         Returns:
             PaypalPage[T] -- A page with the desired elements
         """
-        api_response = self._execute_action_link(link, None)
+        api_response = yield self._action_link_request(link, None)
 
         if api_response.status_code != 200:
             return PaypalPage(True, api_response, 0, 0, [], [])
@@ -58,11 +139,115 @@ class ClientBase:
         json_response = api_response.json()
         total_items = json_response.get('total_items', 0)
         total_pages = json_response.get('total_pages', 0)
-        elements = [ element_class.serialize_from_json(x) for x in json_response[element_key]]
+        elements = parse_entities(element_class, json_response[element_key], lazy=lazy)
         links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response['links']]
 
         return PaypalPage(False, api_response, total_items, total_pages, elements, links)
 
+    def _check_page(self, page: PaypalPage[T]) -> PaypalPage[T]:
+        """Checks that a page was successfully read
+        
+        Arguments:
+            page {PaypalPage[T]} -- The page to be checked
+
+        Raises:
+            PageRequestError: If the page has errors
+        
+        Returns:
+            PaypalPage[T] -- The checked page
+        """
+        if page.errors:
+            raise PageRequestError(page)
+        return page
+
+    def _iter_elements(
+            self, first_page: Callable[[], PaypalPage[T]], 
+            next_page: Callable[[ActionLink], PaypalPage[T]], prefetch: bool = False
+        ) -> Iterator[T]:
+        """Lazily streams the elements of a paged resource, keeping a single 
+           page in memory (two if the next one is being prefetched).
+        
+        Arguments:
+            first_page {Callable[[], PaypalPage[T]]} -- function reading the first page
+            next_page {Callable[[ActionLink], PaypalPage[T]]} -- function reading a page from its link
+        
+        Keyword Arguments:
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[T] -- The paged elements
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        
+        try:
+            page = first_page()
+
+            while page:
+                self._check_page(page)
+                link = page.next_page_link if page.elements else None
+                pending = executor.submit(in_context(next_page), link) if executor and link else None
+
+                yield from page.elements
+
+                page = pending.result() if pending else (next_page(link) if link else None)
+        finally:
+            if executor:
+                executor.shutdown(wait=False)
+
+    def _fan_out_pages(
+            self, first_page: Callable[[], PaypalPage[T]], page_reader: Callable[[int], PaypalPage[T]], 
+            max_workers: int = 4, ordered: bool = True
+        ) -> Iterator[PaypalPage[T]]:
+        """Reads every page of a paged resource, requesting the pages after the first one
+           concurrently. Requires the first page to have the total page count.
+        
+        Arguments:
+            first_page {Callable[[], PaypalPage[T]]} -- function reading the first page
+            page_reader {Callable[[int], PaypalPage[T]]} -- function reading a page by its index
+        
+        Keyword Arguments:
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PaypalPage[T]] -- The pages
+        """
+        page = self._check_page(first_page())
+        yield page
+
+        indexes = iter(range(2, (page.total_pages or 1) + 1))
+        pending = deque() if ordered else set()
+        add = pending.append if ordered else pending.add
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for index in itertools.islice(indexes, max_workers):
+                    add(executor.submit(in_context(page_reader), index))
+
+                while pending:
+                    if ordered:
+                        future = pending.popleft()
+                    else:
+                        future = next(iter(wait(pending, return_when=FIRST_COMPLETED).done))
+                        pending.remove(future)
+
+                    page = self._check_page(future.result())
+                    index = next(indexes, None)
+
+                    if index:
+                        add(executor.submit(in_context(page_reader), index))
+
+                    yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
     def _remove_null_entries(self, dictionary: dict):
         """Cleans a dictionary removing null entries and invalid keys
         
@@ -87,28 +272,185 @@ class ClientBase:
             if dictionary.get(k) == None or not k in valid_keys:
                 del dictionary[k]
 
-    def _execute_action_link(self, link: ActionLink, body: str, **kwargs):
-        """Executes an action link from a given entity
+    def _action_link_request(self, link: ActionLink, body: str, **kwargs) -> SessionCall:
+        """Builds the session call for an action link from a given entity
         
         Supported kwargs: 
             params for query string parameters in GET requests
-            every other kwarg supported by the requests library
+            every other kwarg supported by the session http library
 
         Arguments:
             link {ActionLink} -- The action link to be executed
             body {str} -- the action link body if needed
+
+        Returns:
+            SessionCall -- The call to be yielded from an api operation
         """
         url = link.href
         method = link.method
 
         if method == RequestMethod.POST:
-            return self._session.post(url, body, **kwargs)
+            return self._request.post(url, body, **kwargs)
         elif method == RequestMethod.PUT:
-            return self._session.put(url, body, **kwargs)
+            return self._request.put(url, body, **kwargs)
         elif method == RequestMethod.PATCH:
-            return self._session.patch(url, body, **kwargs)
+            return self._request.patch(url, body, **kwargs)
         elif method == RequestMethod.DELETE:
-            return self._session.delete(url, **kwargs)
+            return self._request.delete(url, **kwargs)
         else: 
             # Defaulting to get
-            return self._session.get(url, kwargs.pop('params',None), **kwargs)
\ No newline at end of file
+            return self._request.get(url, kwargs.pop('params',None), **kwargs)
+
+    @api_operation
+    def _execute_action_link(self, link: ActionLink, body: str, **kwargs):
+        """Executes an action link from a given entity
+        
+        Supported kwargs: 
+            params for query string parameters in GET requests
+            every other kwarg supported by the session http library
+
+        Arguments:
+            link {ActionLink} -- The action link to be executed
+            body {str} -- the action link body if needed
+        """
+        return (yield self._action_link_request(link, body, **kwargs))
+
+    def _run(self, operation: Generator[SessionCall, Any, T]) -> T:
+        """Runs an api operation performing its session calls with the blocking session
+        
+        Arguments:
+            operation {Generator[SessionCall, Any, T]} -- The api operation generator
+
+        Returns:
+            T -- The operation result
+        """
+        response, error = None, None
+
+        try:
+            while True:
+                call = operation.throw(error) if error else operation.send(response)
+                response, error = None, None
+
+                try:
+                    response = call.perform(self._session)
+                except Exception as e:
+                    error = e
+        except StopIteration as e:
+            return e.value
+
+
+class AsyncClientBase(ClientBase):
+    """
+        Base client class for every asyncio resource client.
+
+        Async clients extend their blocking counterparts over an AsyncPayPalSession, 
+        every api operation is inherited and returns a coroutine awaiting its session 
+        calls. Only the paging helpers (and the few methods driving them) are overridden, 
+        inherited iter_* methods return async iterators.
+    """
+    async def _run(self, operation: Generator[SessionCall, Any, T]) -> T:
+        """Runs an api operation awaiting its session calls with the async session
+        
+        Arguments:
+            operation {Generator[SessionCall, Any, T]} -- The api operation generator
+
+        Returns:
+            T -- The operation result
+        """
+        response, error = None, None
+
+        try:
+            while True:
+                call = operation.throw(error) if error else operation.send(response)
+                response, error = None, None
+
+                try:
+                    response = await call.perform(self._session)
+                except Exception as e:
+                    error = e
+        except StopIteration as e:
+            return e.value
+
+    async def _iter_elements(self, first_page: Callable, next_page: Callable, prefetch: bool = False):
+        """Lazily streams the elements of a paged resource, keeping a single 
+           page in memory (two if the next one is being prefetched).
+        
+        Arguments:
+            first_page {Callable} -- coroutine function reading the first page
+            next_page {Callable} -- coroutine function reading a page from its link
+        
+        Keyword Arguments:
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[T] -- The paged elements
+        """
+        pending = None
+        page = await first_page()
+
+        try:
+            while page:
+                self._check_page(page)
+                link = page.next_page_link if page.elements else None
+                pending = asyncio.ensure_future(next_page(link)) if prefetch and link else None
+
+                for element in page.elements:
+                    yield element
+
+                page = (await pending) if pending else ((await next_page(link)) if link else None)
+                pending = None
+        finally:
+            if pending and not pending.done():
+                pending.cancel()
+
+    async def _fan_out_pages(self, first_page: Callable, page_reader: Callable, max_workers: int = 4, ordered: bool = True):
+        """Reads every page of a paged resource, requesting the pages after the first one
+           concurrently. Requires the first page to have the total page count.
+        
+        Arguments:
+            first_page {Callable} -- coroutine function reading the first page
+            page_reader {Callable} -- coroutine function reading a page by its index
+        
+        Keyword Arguments:
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[PaypalPage[T]] -- The pages
+        """
+        page = self._check_page(await first_page())
+        yield page
+
+        indexes = iter(range(2, (page.total_pages or 1) + 1))
+        pending = deque() if ordered else set()
+        add = pending.append if ordered else pending.add
+
+        try:
+            for index in itertools.islice(indexes, max_workers):
+                add(asyncio.ensure_future(page_reader(index)))
+
+            while pending:
+                if ordered:
+                    task = pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                    pending.remove(task)
+
+                page = self._check_page(await task)
+                index = next(indexes, None)
+
+                if index:
+                    add(asyncio.ensure_future(page_reader(index)))
+
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
+
@@ -0,0 +1,631 @@
+"""
+    Bulk execution of single resource operations (order captures, authorization captures, 
+    referenced payout items, etc) with bounded concurrency over a pooled session, and chunked 
+    batch payouts & tracker uploads.
+
+    Every item gets a stable idempotency key (PayPal-Request-Id) derived from the run namespace,
+    the operation, the item id & the rest of its arguments so re-running an interrupted job replays 
+    PayPal's stored results instead of repeating the operations.
+"""
+
+import re
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import itertools
+
+from enum import Enum
+from datetime import date
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Iterable, Iterator, List, Mapping, NamedTuple, Tuple, Union
+
+from pypaypal.entities.base import PaypalApiResponse, in_context
+from pypaypal.clients.orders import OrderClient
+from pypaypal.clients.payouts import PayoutClient, MAX_PAYOUT_BATCH_SIZE
+from pypaypal.clients.rpayouts import ReferencedPayoutItemClient
+from pypaypal.clients.trackers import TrackersClient, TrackerInput, MAX_TRACKERS_BATCH_SIZE
+from pypaypal.clients.payments.authorizations import AuthorizationClient
+from pypaypal.entities.rpayouts import ExecutionType, ReferencedPayoutsItem
+from pypaypal.entities.payouts import PayoutHeader, PayoutItemDetail, SenderBatchHeader
+
+"""
+    Bulk item, either a resource id or the keyword arguments of the operation (with the id)
+"""
+BulkItem = Union[str, Mapping[str, object]]
+
+class BulkResult(NamedTuple):
+    """Outcome of a single bulk item
+    """
+    input: BulkItem
+    request_id: str
+    response: PaypalApiResponse = None
+    error: Exception = None
+    # Seconds spent in the operation call.
+    elapsed: float = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error == None and self.response != None and not self.response.has_errors
+
+class BulkSummary(NamedTuple):
+    """Bulk execution counters
+    """
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    errors: int = 0
+    elapsed: float = 0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second
+        """
+        return self.total / self.elapsed if self.elapsed else 0
+
+class BulkPayoutResult(NamedTuple):
+    """Outcome of a chunked batch payout, with a result per batch in submission order
+    """
+    results: List[BulkResult]
+
+    @property
+    def headers(self) -> List[PayoutHeader]:
+        """The batch headers, None for the batches that failed
+        """
+        return [ x.response.parsed_response if x.succeeded else None for x in self.results ]
+
+    @property
+    def failed(self) -> List[BulkResult]:
+        return [ x for x in self.results if not x.succeeded ]
+
+class TrackerError(NamedTuple):
+    """A rejected tracker
+    """
+    # The tracker or its properties as given, None if the error can't be related to a tracker.
+    tracker: TrackerInput
+    name: str
+    issue: str = None
+    description: str = None
+
+class TrackerUploadReport(NamedTuple):
+    """Outcome of a tracker upload
+    """
+    total: int = 0
+    added: int = 0
+    batches: int = 0
+    failed_batches: int = 0
+    errors: List[TrackerError] = None
+
+    @property
+    def rejected(self) -> int:
+        """Trackers not added, including the ones of the failed batches
+        """
+        return len([ x for x in self.errors or [] if x.tracker != None ])
+
+"""
+    Tracker index in the field path of the trackers batch error details (e.g. '/trackers/3/transaction_id')
+"""
+_TRACKER_FIELD = re.compile(r'^/?trackers/(\d+)')
+
+def _tracker_key(tracker: TrackerInput) -> str:
+    if isinstance(tracker, Mapping):
+        return '{}-{}'.format(tracker.get('transaction_id'), tracker.get('tracking_number'))
+    return '{}-{}'.format(tracker.transaction_id, tracker.tracking_number)
+
+def _tracker_batches(trackers: Iterable[TrackerInput], namespace: str, batch_size: int) -> Iterator[dict]:
+    """Splits a stream of trackers into add_trackers arguments, keyed by the trackers they carry 
+       so uploading the same file again replays the stored results
+    """
+    trackers = iter(trackers)
+
+    while True:
+        chunk = list(itertools.islice(trackers, batch_size))
+
+        if not chunk:
+            return
+
+        keys = ','.join(_tracker_key(x) for x in chunk)
+        yield { 'trackers': chunk, 'request_id': idempotency_key(namespace, 'add_trackers', keys) }
+
+def _tracker_errors(result: BulkResult) -> List[TrackerError]:
+    """Relates the errors of a trackers batch to the trackers of the batch
+    """
+    chunk = result.input['trackers']
+
+    if result.error != None:
+        return [ TrackerError(x, type(result.error).__name__, description=str(result.error)) for x in chunk ]
+    if result.response.has_errors:
+        detail = result.response.error_detail
+        name, message = (detail.name, detail.message) if detail else ('HTTP_{}'.format(result.response._raw_response.status_code), None)
+        return [ TrackerError(x, name, description=message) for x in chunk ]
+
+    errors = []
+
+    for error in result.response.parsed_response.errors:
+        for detail in error.additional_details or [ dict() ]:
+            index = _TRACKER_FIELD.match(detail.get('field') or '')
+            index = int(index.group(1)) if index else None
+            tracker = chunk[index] if index != None and index < len(chunk) else None
+            errors.append(TrackerError(tracker, error.name, detail.get('issue'), detail.get('description') or error.message))
+
+    return errors
+
+def _report_trackers(report: TrackerUploadReport, result: BulkResult) -> TrackerUploadReport:
+    """Adds the outcome of a trackers batch to an upload report
+    """
+    added = len(result.response.parsed_response.tracker_identifiers) if result.succeeded else 0
+    report.errors.extend(_tracker_errors(result))
+
+    return report._replace(
+        total=report.total + len(result.input['trackers']), added=report.added + added,
+        batches=report.batches + 1, failed_batches=report.failed_batches + (not result.succeeded)
+    )
+
+def _payout_batches(
+        sender_batch_header: SenderBatchHeader, items: Iterable[PayoutItemDetail], 
+        run_id: str, batch_size: int
+    ) -> Iterator[dict]:
+    """Splits a stream of payout items into create_batch_payout arguments, each batch has 
+       its own sender batch id (PayPal rejects reused ones) & an idempotency key from the run id & its index
+    """
+    items = iter(items)
+    h = sender_batch_header
+
+    for index in itertools.count():
+        chunk = list(itertools.islice(items, batch_size))
+
+        if not chunk:
+            return
+
+        yield {
+            'sender_batch_header': SenderBatchHeader(
+                '{}-{}'.format(h.sender_batch_id, index), h.recipient_type, h.email_subject, h.email_message, h.note
+            ),
+            'items': chunk,
+            'request_id': idempotency_key(run_id, 'create_batch_payout', str(index))
+        }
+
+def _referenced_payout_items(
+        items: Iterable[ReferencedPayoutsItem], namespace: str, 
+        partner_attribution_id: str, execution_type: ExecutionType
+    ) -> Iterator[dict]:
+    """Builds the create_referenced_payout_item arguments of every item, keyed by its reference 
+       (a reference is paid once) unless a request id is given along the item
+    """
+    for item in items:
+        kwargs = dict(item) if isinstance(item, Mapping) else { 'item': item }
+        reference = '{}:{}'.format(kwargs['item'].reference_type, kwargs['item'].reference_id)
+        kwargs.setdefault('request_id', idempotency_key(namespace, 'create_referenced_payout_item', reference))
+        kwargs.setdefault('partnerAttrId', partner_attribution_id)
+        kwargs.setdefault('execution_type', execution_type)
+        yield kwargs
+
+def _canonical(value: object) -> object:
+    """json fallback for the operation arguments hashed into the idempotency keys
+    """
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(x, sort_keys=True, default=_canonical) for x in value)
+    return str(value)
+
+def idempotency_key(namespace: str, operation: str, item_id: str, arguments: Mapping[str, object] = None) -> str:
+    """Builds a stable idempotency key for an operation on an item
+
+    Arguments:
+        namespace {str} -- the job namespace (e.g. 'settlement-2020-01-31')
+        operation {str} -- the operation name
+        item_id {str} -- the resource id
+
+    Keyword Arguments:
+        arguments {Mapping[str, object]} -- the rest of the operation arguments, hashed in their canonical json form so 
+                                            the same item with different arguments gets a different key (default: {None})
+
+    Returns:
+        str -- the key
+    """
+    name = '{}/{}/{}'.format(namespace, operation, item_id)
+
+    if arguments:
+        canonical = json.dumps(arguments, sort_keys=True, separators=(',', ':'), default=_canonical)
+        name = '{}/{}'.format(name, hashlib.sha256(canonical.encode('utf-8')).hexdigest())
+
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, name))
+
+class _BulkExecutorBase:
+    """Common item & summary handling for the bulk executors.
+    """
+    def __init__(self, max_workers: int = 16, *, namespace: str):
+        """Constructor
+
+        Keyword Arguments:
+            max_workers {int} -- max operations running at once, should not exceed the session pool size (default: {16})
+            namespace {str} -- idempotency key namespace of the run (e.g. 'settlement-2020-01-31'), 
+                               items keep their keys while it's the same so reuse it only to resume a run
+
+        Raises:
+            ValueError: If the namespace is empty
+        """
+        if not namespace:
+            raise ValueError('A namespace is required to build the idempotency keys of the run')
+
+        self.max_workers = max_workers
+        self.namespace = namespace
+        self._summary = BulkSummary()
+        self._started_at = None
+
+    @property
+    def summary(self) -> BulkSummary:
+        """Counters of the items processed so far
+        """
+        elapsed = time.monotonic() - self._started_at if self._started_at != None else 0
+        return self._summary._replace(elapsed=elapsed)
+
+    def _arguments(self, operation: Callable, item: BulkItem, id_arg: str) -> Tuple[str, dict]:
+        kwargs = { id_arg: item } if isinstance(item, str) else dict(item)
+        arguments = { k: v for k, v in kwargs.items() if k not in (id_arg, 'request_id') }
+        request_id = kwargs.get('request_id') or idempotency_key(self.namespace, operation.__name__, kwargs[id_arg], arguments)
+        kwargs['request_id'] = request_id
+        return request_id, kwargs
+
+    def _record(self, result: BulkResult) -> BulkResult:
+        s = self._summary
+        self._summary = s._replace(
+            total=s.total + 1, succeeded=s.succeeded + result.succeeded,
+            failed=s.failed + (not result.succeeded), errors=s.errors + (result.error != None)
+        )
+        return result
+
+    def _start(self):
+        if self._started_at == None:
+            self._started_at = time.monotonic()
+
+class BulkExecutor(_BulkExecutorBase):
+    """Runs a client operation for many items with a pool of threads.
+    """
+    def _call(self, operation: Callable[..., PaypalApiResponse], item: BulkItem, id_arg: str) -> BulkResult:
+        request_id = None
+
+        started_at = time.monotonic()
+
+        try:
+            request_id, kwargs = self._arguments(operation, item, id_arg)
+            response = operation(**kwargs)
+            return BulkResult(item, request_id, response, elapsed=time.monotonic() - started_at)
+        except Exception as e:
+            return BulkResult(item, request_id, error=e, elapsed=time.monotonic() - started_at)
+
+    def run(
+            self, operation: Callable[..., PaypalApiResponse], items: Iterable[BulkItem],
+            id_arg: str, ordered: bool = False
+        ) -> Iterator[BulkResult]:
+        """Runs an operation for every item, streaming the results. Items are read lazily
+           & failures (errors & exceptions) are isolated in their results.
+
+        Arguments:
+            operation {Callable[..., PaypalApiResponse]} -- the client operation (e.g. client.capture_payment_for_order)
+            items {Iterable[BulkItem]} -- resource ids or operation keyword arguments
+            id_arg {str} -- name of the operation resource id argument (e.g. 'order_id')
+
+        Keyword Arguments:
+            ordered {bool} -- yield the results in the items order or as they're done (default: {False})
+
+        Returns:
+            Iterator[BulkResult] -- the results
+        """
+        self._start()
+        items = iter(items)
+        pending = deque() if ordered else set()
+        add = pending.append if ordered else pending.add
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for item in itertools.islice(items, self.max_workers * 2):
+                    add(executor.submit(in_context(self._call), operation, item, id_arg))
+
+                while pending:
+                    if ordered:
+                        done = [ pending.popleft() ]
+                    else:
+                        done = wait(pending, return_when=FIRST_COMPLETED).done
+                        pending.difference_update(done)
+
+                    for future in done:
+                        item = next(items, None)
+
+                        if item != None:
+                            add(executor.submit(in_context(self._call), operation, item, id_arg))
+
+                        yield self._record(future.result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def capture_orders(self, client: OrderClient, items: Iterable[BulkItem], **kwargs) -> Iterator[BulkResult]:
+        """Captures the payment of many orders
+
+        Arguments:
+            client {OrderClient} -- the orders client
+            items {Iterable[BulkItem]} -- order ids or capture_payment_for_order keyword arguments
+
+        Returns:
+            Iterator[BulkResult] -- the results
+        """
+        return self.run(client.capture_payment_for_order, items, 'order_id', **kwargs)
+
+    def capture_authorizations(self, client: AuthorizationClient, items: Iterable[BulkItem], **kwargs) -> Iterator[BulkResult]:
+        """Captures many authorized payments
+
+        Arguments:
+            client {AuthorizationClient} -- the authorizations client
+            items {Iterable[BulkItem]} -- authorization ids or capture_authorized_payment keyword arguments
+
+        Returns:
+            Iterator[BulkResult] -- the results
+        """
+        return self.run(client.capture_authorized_payment, items, 'authorization_id', **kwargs)
+
+    def create_referenced_payout_items(
+            self, client: ReferencedPayoutItemClient, items: Iterable[ReferencedPayoutsItem], 
+            partner_attribution_id: str = None, execution_type: ExecutionType = ExecutionType.SYNC, **kwargs
+        ) -> Iterator[BulkResult]:
+        """Creates many referenced payout items, each one with an idempotency key from its reference
+
+        Arguments:
+            client {ReferencedPayoutItemClient} -- the referenced payout items client
+            items {Iterable[ReferencedPayoutsItem]} -- the items or create_referenced_payout_item keyword arguments
+
+        Keyword Arguments:
+            partner_attribution_id {str} -- paypal partner attribution id (default: {None})
+            execution_type {ExecutionType} -- how will the API process the items (default: {ExecutionType.SYNC})
+
+        Returns:
+            Iterator[BulkResult] -- the results, with the created item & its processing state if succeeded
+        """
+        items = _referenced_payout_items(items, self.namespace, partner_attribution_id, execution_type)
+        return self.run(client.create_referenced_payout_item, items, 'request_id', **kwargs)
+
+    def show_referenced_payout_items(
+            self, client: ReferencedPayoutItemClient, item_ids: Iterable[str], partner_attribution_id: str = None, **kwargs
+        ) -> Iterator[BulkResult]:
+        """Reads the details of many referenced payout items
+
+        Arguments:
+            client {ReferencedPayoutItemClient} -- the referenced payout items client
+            item_ids {Iterable[str]} -- the payout item ids
+
+        Keyword Arguments:
+            partner_attribution_id {str} -- paypal partner attribution id (default: {None})
+
+        Returns:
+            Iterator[BulkResult] -- the results
+        """
+        def show_referenced_payout_item_details(payout_item_id: str, request_id: str = None):
+            return client.show_referenced_payout_item_details(payout_item_id, partner_attribution_id)
+
+        return self.run(show_referenced_payout_item_details, item_ids, 'payout_item_id', **kwargs)
+
+    def create_batch_payouts(
+            self, client: PayoutClient, sender_batch_header: SenderBatchHeader, items: Iterable[PayoutItemDetail],
+            run_id: str, batch_size: int = MAX_PAYOUT_BATCH_SIZE
+        ) -> BulkPayoutResult:
+        """Splits a payout into batches the API accepts & submits them concurrently. Batches get the 
+           sender batch id suffixed by their index & a request id derived from the run id & their index, 
+           so submitting the same run again doesn't pay twice.
+
+        Arguments:
+            client {PayoutClient} -- the payouts client
+            sender_batch_header {SenderBatchHeader} -- the payout header
+            items {Iterable[PayoutItemDetail]} -- the payout items, read lazily
+            run_id {str} -- the payout run id (e.g. 'marketplace-2020-w05')
+
+        Keyword Arguments:
+            batch_size {int} -- max items per batch (default: {MAX_PAYOUT_BATCH_SIZE})
+
+        Returns:
+            BulkPayoutResult -- a result per batch
+        """
+        batches = _payout_batches(sender_batch_header, items, run_id, min(batch_size, MAX_PAYOUT_BATCH_SIZE))
+        return BulkPayoutResult(list(self.run(client.create_batch_payout, batches, 'request_id', ordered=True)))
+
+    def add_trackers(
+            self, client: TrackersClient, trackers: Iterable[TrackerInput], batch_size: int = MAX_TRACKERS_BATCH_SIZE
+        ) -> TrackerUploadReport:
+        """Uploads a stream of trackers (e.g. a csv.DictReader over a shipments file) in batches 
+           the API accepts, sending the batches concurrently
+
+        Arguments:
+            client {TrackersClient} -- the trackers client
+            trackers {Iterable[TrackerInput]} -- the trackers or mappings with their properties, read lazily
+
+        Keyword Arguments:
+            batch_size {int} -- max trackers per batch (default: {MAX_TRACKERS_BATCH_SIZE})
+
+        Returns:
+            TrackerUploadReport -- the upload counters & an error per rejected tracker
+        """
+        report = TrackerUploadReport(errors=[])
+        batches = _tracker_batches(trackers, self.namespace, min(batch_size, MAX_TRACKERS_BATCH_SIZE))
+
+        for result in self.run(client.add_trackers, batches, 'request_id'):
+            report = _report_trackers(report, result)
+
+        return report
+
+class AsyncBulkExecutor(_BulkExecutorBase):
+    """Runs an asyncio client operation for many items with bounded concurrency.
+    """
+    async def _call(self, operation: Callable[..., PaypalApiResponse], item: BulkItem, id_arg: str) -> BulkResult:
+        request_id = None
+
+        started_at = time.monotonic()
+
+        try:
+            request_id, kwargs = self._arguments(operation, item, id_arg)
+            response = await operation(**kwargs)
+            return BulkResult(item, request_id, response, elapsed=time.monotonic() - started_at)
+        except Exception as e:
+            return BulkResult(item, request_id, error=e, elapsed=time.monotonic() - started_at)
+
+    async def run(
+            self, operation: Callable[..., PaypalApiResponse], items: Iterable[BulkItem],
+            id_arg: str, ordered: bool = False
+        ):
+        """Runs an asyncio operation for every item, streaming the results. Items are read lazily
+           & failures (errors & exceptions) are isolated in their results.
+
+        Arguments:
+            operation {Callable[..., PaypalApiResponse]} -- the asyncio client operation (e.g. client.capture_payment_for_order)
+            items {Iterable[BulkItem]} -- resource ids or operation keyword arguments
+            id_arg {str} -- name of the operation resource id argument (e.g. 'order_id')
+
+        Keyword Arguments:
+            ordered {bool} -- yield the results in the items order or as they're done (default: {False})
+
+        Returns:
+            AsyncIterator[BulkResult] -- the results
+        """
+        self._start()
+        items = iter(items)
+        pending = deque() if ordered else set()
+        add = pending.append if ordered else pending.add
+
+        try:
+            for item in itertools.islice(items, self.max_workers):
+                add(asyncio.ensure_future(self._call(operation, item, id_arg)))
+
+            while pending:
+                if ordered:
+                    done = [ pending.popleft() ]
+                    await done[0]
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    pending.difference_update(done)
+
+                for task in done:
+                    item = next(items, None)
+
+                    if item != None:
+                        add(asyncio.ensure_future(self._call(operation, item, id_arg)))
+
+                    yield self._record(task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def capture_orders(self, client: OrderClient, items: Iterable[BulkItem], **kwargs):
+        """Captures the payment of many orders
+
+        Arguments:
+            client {AsyncOrderClient} -- the asyncio orders client
+            items {Iterable[BulkItem]} -- order ids or capture_payment_for_order keyword arguments
+
+        Returns:
+            AsyncIterator[BulkResult] -- the results
+        """
+        return self.run(client.capture_payment_for_order, items, 'order_id', **kwargs)
+
+    def capture_authorizations(self, client: AuthorizationClient, items: Iterable[BulkItem], **kwargs):
+        """Captures many authorized payments
+
+        Arguments:
+            client {AsyncAuthorizationClient} -- the asyncio authorizations client
+            items {Iterable[BulkItem]} -- authorization ids or capture_authorized_payment keyword arguments
+
+        Returns:
+            AsyncIterator[BulkResult] -- the results
+        """
+        return self.run(client.capture_authorized_payment, items, 'authorization_id', **kwargs)
+
+    def create_referenced_payout_items(
+            self, client: ReferencedPayoutItemClient, items: Iterable[ReferencedPayoutsItem], 
+            partner_attribution_id: str = None, execution_type: ExecutionType = ExecutionType.SYNC, **kwargs
+        ):
+        """Creates many referenced payout items, each one with an idempotency key from its reference
+
+        Arguments:
+            client {AsyncReferencedPayoutItemClient} -- the asyncio referenced payout items client
+            items {Iterable[ReferencedPayoutsItem]} -- the items or create_referenced_payout_item keyword arguments
+
+        Keyword Arguments:
+            partner_attribution_id {str} -- paypal partner attribution id (default: {None})
+            execution_type {ExecutionType} -- how will the API process the items (default: {ExecutionType.SYNC})
+
+        Returns:
+            AsyncIterator[BulkResult] -- the results, with the created item & its processing state if succeeded
+        """
+        items = _referenced_payout_items(items, self.namespace, partner_attribution_id, execution_type)
+        return self.run(client.create_referenced_payout_item, items, 'request_id', **kwargs)
+
+    def show_referenced_payout_items(
+            self, client: ReferencedPayoutItemClient, item_ids: Iterable[str], partner_attribution_id: str = None, **kwargs
+        ):
+        """Reads the details of many referenced payout items
+
+        Arguments:
+            client {AsyncReferencedPayoutItemClient} -- the asyncio referenced payout items client
+            item_ids {Iterable[str]} -- the payout item ids
+
+        Keyword Arguments:
+            partner_attribution_id {str} -- paypal partner attribution id (default: {None})
+
+        Returns:
+            AsyncIterator[BulkResult] -- the results
+        """
+        async def show_referenced_payout_item_details(payout_item_id: str, request_id: str = None):
+            return await client.show_referenced_payout_item_details(payout_item_id, partner_attribution_id)
+
+        return self.run(show_referenced_payout_item_details, item_ids, 'payout_item_id', **kwargs)
+
+    async def create_batch_payouts(
+            self, client: PayoutClient, sender_batch_header: SenderBatchHeader, items: Iterable[PayoutItemDetail],
+            run_id: str, batch_size: int = MAX_PAYOUT_BATCH_SIZE
+        ) -> BulkPayoutResult:
+        """Splits a payout into batches the API accepts & submits them concurrently. Batches get the 
+           sender batch id suffixed by their index & a request id derived from the run id & their index, 
+           so submitting the same run again doesn't pay twice.
+
+        Arguments:
+            client {AsyncPayoutClient} -- the asyncio payouts client
+            sender_batch_header {SenderBatchHeader} -- the payout header
+            items {Iterable[PayoutItemDetail]} -- the payout items, read lazily
+            run_id {str} -- the payout run id (e.g. 'marketplace-2020-w05')
+
+        Keyword Arguments:
+            batch_size {int} -- max items per batch (default: {MAX_PAYOUT_BATCH_SIZE})
+
+        Returns:
+            BulkPayoutResult -- a result per batch
+        """
+        batches = _payout_batches(sender_batch_header, items, run_id, min(batch_size, MAX_PAYOUT_BATCH_SIZE))
+        return BulkPayoutResult([ x async for x in self.run(client.create_batch_payout, batches, 'request_id', ordered=True) ])
+
+    async def add_trackers(
+            self, client: TrackersClient, trackers: Iterable[TrackerInput], batch_size: int = MAX_TRACKERS_BATCH_SIZE
+        ) -> TrackerUploadReport:
+        """Uploads a stream of trackers (e.g. a csv.DictReader over a shipments file) in batches 
+           the API accepts, sending the batches concurrently
+
+        Arguments:
+            client {AsyncTrackersClient} -- the asyncio trackers client
+            trackers {Iterable[TrackerInput]} -- the trackers or mappings with their properties, read lazily
+
+        Keyword Arguments:
+            batch_size {int} -- max trackers per batch (default: {MAX_TRACKERS_BATCH_SIZE})
+
+        Returns:
+            TrackerUploadReport -- the upload counters & an error per rejected tracker
+        """
+        report = TrackerUploadReport(errors=[])
+        batches = _tracker_batches(trackers, self.namespace, min(batch_size, MAX_TRACKERS_BATCH_SIZE))
+
+        async for result in self.run(client.add_trackers, batches, 'request_id'):
+            report = _report_trackers(report, result)
+
+        return report
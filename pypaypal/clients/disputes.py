@@ -7,13 +7,13 @@
 import json
 
 from datetime import datetime
-from typing import Type, TypeVar, List
+from typing import Type, TypeVar, List, Iterator
 
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 from pypaypal.entities.dispute import Dispute, DisputeUpdateRequest, DisputeEvidence
 
 from pypaypal.entities.base import ( 
@@ -22,7 +22,8 @@ from pypaypal.entities.base import (
     PaypalPage, 
     PaypalApiBulkResponse, 
     Money, 
-    PaypalPortableAddress 
+    PaypalPortableAddress,
+    parse_entities
 )
 
 from pypaypal.http import ( 
@@ -64,7 +65,8 @@ class DisputeClient(ClientBase):
         super().__init__(url, session)
         self.sandbox_exclusive = None if session.session_mode.is_live() else _SandboxExclusiveDisputeClient(url, session)
 
-    def list_disputes(self, start_time: datetime, page_size:int=2) -> PaypalPage[Dispute]:
+    @api_operation
+    def list_disputes(self, start_time: datetime, page_size:int=2, lazy: bool = False) -> PaypalPage[Dispute]:
         """Performs an API call to lists disputes
         
         Arguments:
@@ -72,6 +74,7 @@ class DisputeClient(ClientBase):
         
         Keyword Arguments:
             page_size {int} -- size of the page (default: {2})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Dispute] -- Page with a lists of disputes
@@ -79,28 +82,54 @@ class DisputeClient(ClientBase):
         url = self._base_url
         params = { 'page_size' : page_size, 'start_time': start_time.strftime('%Y-%m-%dT%H:%M:%S.000Z') }
 
-        api_response = self._session.get(url, params)
+        api_response = yield self._request.get(url, params)
 
         if api_response.status_code != 200:
             return PaypalPage(True, api_response, 0, 0, [], [])
         
         json_response = api_response.json()
-        items = [ Dispute.serialize_from_json(x) for x in json_response['items']]
+        items = parse_entities(Dispute, json_response['items'], lazy=lazy)
         links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response['links']]
 
         return PaypalPage(False, api_response, json_response.get('total_items'), json_response.get('total_pages'), items, links)
 
-    def list_disputes_from_link(self, link: ActionLink) -> PaypalPage[Dispute]:
+    def list_disputes_from_link(self, link: ActionLink, lazy: bool = False) -> PaypalPage[Dispute]:
         """Performs an API call to lists disputes inside a page
         
         Arguments:
             link {ActionLink} -- page link
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
                 
         Returns:
             PaypalPage[Dispute] -- Page with a lists of disputes
         """
-        return self._page_from_link(link, 'items', Dispute)
+        return self._page_from_link(link, 'items', Dispute, lazy)
     
+    def iter_disputes(self, start_time: datetime, page_size: int = 10, prefetch: bool = False, lazy: bool = False) -> Iterator[Dispute]:
+        """Lazily lists the disputes page by page
+        
+        Arguments:
+            start_time {datetime} -- Start date
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[Dispute] -- The disputes
+        """
+        return self._iter_elements(
+            lambda: self.list_disputes(start_time, page_size, lazy), 
+            lambda link: self.list_disputes_from_link(link, lazy), prefetch
+        )
+
+    @api_operation
     def partial_dispute_update(self, dispute_id: str, update_request: DisputeUpdateRequest) -> PaypalApiResponse[Dispute]:
         """Calls the Paypal API to  Partially update a dispute, by ID.            
             Right now it's only possible to update the communication_detail value.
@@ -115,7 +144,7 @@ class DisputeClient(ClientBase):
         url = parse_url(self._base_url, dispute_id)
         body = { 'op': update_request.operation, 'path': update_request.path, 'value': update_request.value }
 
-        api_response = self._session.patch(url, json.dumps(body))
+        api_response = yield self._request.patch(url, body)
 
         return PaypalApiResponse(api_response.status_code != 204, api_response)
 
@@ -133,6 +162,7 @@ class DisputeClient(ClientBase):
         """        
         return self._get_element_details(parse_url(self._base_url, dispute_id), dispute_id, Dispute, response_type)
 
+    @api_operation
     def dispute_details_from_entity(self, dispute: Dispute, response_type: ResponseType=ResponseType.MINIMAL) -> PaypalApiResponse[Dispute]:
         """Performs an API call to show the details for a dispute, by ID. 
         
@@ -147,13 +177,14 @@ class DisputeClient(ClientBase):
         """        
         url = dispute.read_link
         headers = { 'Prefer': response_type.as_header_value() }
-        api_response = self._execute_action_link(url, None, headers = headers)
+        api_response = yield self._action_link_request(url, None, headers = headers)
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Dispute.serialize_from_json(api_response.json(), response_type))
     
+    @api_operation
     def _execute_basic_dispute_action(self, url: str, body: dict) -> PaypalApiBulkResponse[ActionLink]:
         """Executes a standard simple dispute action
         
@@ -164,13 +195,14 @@ class DisputeClient(ClientBase):
         Returns:
             PaypalApiBulkResponse[ActionLink] -- action links related to the dispute
         """
-        response = self._session.post(url, json.dumps(body))
+        response = yield self._request.post(url, body)
 
         if response.status_code != 200:
             return PaypalApiBulkResponse(True, response)
         
         return PaypalApiBulkResponse(False, response, ActionLink.serialize_from_json(response['links']))
 
+    @api_operation
     def _execute_evidence_multipart_request(self, url: str, json_part: dict, files: MIMEApplication) -> PaypalApiBulkResponse[ActionLink]:
         """Calls the API to provide evidence on a multipart request
         
@@ -198,7 +230,7 @@ class DisputeClient(ClientBase):
 
         body = multipart.as_string()
         headers = dict(multipart.items())
-        response = self._session.post(url, body, headers = headers)
+        response = yield self._request.post(url, body, headers = headers)
 
         if response.status_code != 200:
             return PaypalApiBulkResponse(True, response)
@@ -396,4 +428,8 @@ class DisputeClient(ClientBase):
             T -- an instance of Dispute client with the right configuration by session mode
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(base_url, session)
\ No newline at end of file
+        return cls(base_url, session)
+
+class AsyncDisputeClient(AsyncClientBase, DisputeClient):
+    """Asyncio disputes resource group client class
+    """
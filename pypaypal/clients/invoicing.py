@@ -4,10 +4,11 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/invoicing/v2/
 """
 
-import json
-from typing import Type, TypeVar, List
+import itertools
 
-from pypaypal.clients.base import ClientBase
+from typing import Type, TypeVar, List, Iterator
+
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation
 from pypaypal.errors import PaypalRequestError
 
 from pypaypal.entities.invoicing.template import Template, InvoiceListRequestField
@@ -20,7 +21,8 @@ from pypaypal.entities.base import (
     ResponseType,
     PaypalApiResponse,
     PayPalErrorDetail,
-    PaypalApiBulkResponse
+    PaypalApiBulkResponse,
+    parse_entities
 )
 
 from pypaypal.http import ( 
@@ -51,6 +53,7 @@ class InvoiceClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
     
+    @api_operation
     def generate_invoice_number(self, invoice_number: str = None) -> str:
         """Calls the paypal API to generate the next invoice number that is available to the merchant.
         
@@ -63,14 +66,15 @@ class InvoiceClient(ClientBase):
         Raises:
             PaypalRequestError -- If there's an error with the API request
         """
-        body = json.dumps( { 'invoice_number': invoice_number }) if invoice_number else None
-        api_response = self._session.post(parse_url(self._base_url, 'generate-next-invoice-number'), body)
+        body = { 'invoice_number': invoice_number } if invoice_number else None
+        api_response = yield self._request.post(parse_url(self._base_url, 'generate-next-invoice-number'), body)
 
         if api_response.status_code != 200:
             raise PaypalRequestError(PayPalErrorDetail.serialize_from_json(api_response.json()))
         
         return api_response.json()['invoice_number']
 
+    @api_operation
     def create_draft_invoice(self, invoice: Invoice) -> PaypalApiResponse:
         """Calls the paypal API to generate an invoice draft.
         
@@ -80,14 +84,15 @@ class InvoiceClient(ClientBase):
         Returns:
             PaypalApiResponse -- The paypal API response
         """
-        response = self._session.post(parse_url(self._base_url, 'invoices'), json.dumps(invoice.to_dict()))
+        response = yield self._request.post(parse_url(self._base_url, 'invoices'), invoice.to_dict())
 
         if response.status_code != 201:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
-    def list_invoices(self, page: int = 1, page_size: int = 10, total_required: bool = True, fields: List[str] = []) -> PaypalPage[Invoice]:
+    @api_operation
+    def list_invoices(self, page: int = 1, page_size: int = 10, total_required: bool = True, fields: List[str] = [], lazy: bool = False) -> PaypalPage[Invoice]:
         """Calls the paypal API to get an invoice page.
         
         Arguments:
@@ -95,6 +100,7 @@ class InvoiceClient(ClientBase):
             page_size {int} -- page size 
             total_required {bool} -- total count required
             fields {List[str]} -- fields to be searched
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
 
         Returns:
             PaypalPage -- The paged elements in paypal API paged response 
@@ -104,17 +110,61 @@ class InvoiceClient(ClientBase):
         if fields:
             query_params['fields'] = ','.join(fields)
 
-        response = self._session.get(parse_url(self._base_url, 'invoices'), query_params)
+        response = yield self._request.get(parse_url(self._base_url, 'invoices'), query_params)
 
         if response.status_code != 200:
             return PaypalPage.error(response)
         
         json_response = response.json()
-        items = [ Invoice.serialize_from_json(x) for x in json_response.get('items', [])]
+        items = parse_entities(Invoice, json_response.get('items', []), lazy=lazy)
         links = [ ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response.get('links', []) ]
 
         return PaypalPage.success(response, json_response.get('total_items'), json_response.get('total_pages'), items, links)
 
+    def iter_invoices(self, page_size: int = 10, fields: List[str] = [], prefetch: bool = False, lazy: bool = False) -> Iterator[Invoice]:
+        """Lazily lists the invoices page by page
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            fields {List[str]} -- fields to be searched (default: {[]})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[Invoice] -- The invoices
+        """
+        return self._iter_elements(
+            lambda: self.list_invoices(1, page_size, True, fields, lazy),
+            lambda link: self._page_from_link(link, 'items', Invoice, lazy), prefetch
+        )
+
+    def iter_invoice_pages(
+            self, page_size: int = 10, fields: List[str] = [], max_workers: int = 4, ordered: bool = True, lazy: bool = False
+        ) -> Iterator[PaypalPage[Invoice]]:
+        """Reads every invoice page, requesting the pages after the first one concurrently
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            fields {List[str]} -- fields to be searched (default: {[]})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PaypalPage[Invoice]] -- The invoice pages
+        """
+        return self._fan_out_pages(
+            lambda: self.list_invoices(1, page_size, True, fields, lazy),
+            lambda page: self.list_invoices(page, page_size, True, fields, lazy), max_workers, ordered
+        )
+
+    @api_operation
     def delete_invoice(self, invoice_id: str) -> PaypalApiResponse:
         """Calls the paypal API to delete a draft or scheduled invoice, by ID.
            only invoices in the draft or scheduled state can be deleted. 
@@ -129,13 +179,14 @@ class InvoiceClient(ClientBase):
             PaypalApiResponse -- Api operation response status containing the response
         """
 
-        response = self._session.delete(parse_url(self._base_url, 'invoices', invoice_id))
+        response = yield self._request.delete(parse_url(self._base_url, 'invoices', invoice_id))
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
+    @api_operation
     def fully_update_invoice(self, invoice_id: str, invoice: Invoice, send_to_recipient: bool = True, send_to_invoicer: bool = True) -> PaypalApiResponse[Invoice]:
         """Calls the paypal API to fully update an invoice. This call does not support partial updates
         
@@ -152,9 +203,9 @@ class InvoiceClient(ClientBase):
         """
         params = { 'send_to_recipient': send_to_recipient, 'send_to_invoicer': send_to_invoicer }
 
-        response = self._session.put(
+        response = yield self._request.put(
             parse_url(self._base_url, 'invoices', invoice_id),
-            json.dumps(invoice.to_dict()),
+            invoice.to_dict(),
             params = params
         )
 
@@ -171,6 +222,7 @@ class InvoiceClient(ClientBase):
         return PaypalApiResponse.success(response)
 
 
+    @api_operation
     def show_invoice_details(self, invoice_id: str) -> PaypalApiResponse[Invoice]:
         """Calls the paypal API to show details for an invoice.
         
@@ -180,13 +232,14 @@ class InvoiceClient(ClientBase):
         Returns:
             PaypalApiResponse -- Api operation response status with parsed objects within
         """
-        response = self._session.get(parse_url(self._base_url, 'invoices', invoice_id))
+        response = yield self._request.get(parse_url(self._base_url, 'invoices', invoice_id))
 
         if response.status_code != 200:
             return PaypalApiResponse.error(response)
 
         return PaypalApiResponse.success(response, Invoice.serialize_from_json(response.json()))
 
+    @api_operation
     def cancel_sent_invoice(
         self, invoice_id: str, subject: str, note: str, send_to_invoicer: bool,
         send_to_recipient: bool, additional_recipients: List[str] = []) -> PaypalApiResponse[Invoice]:
@@ -207,23 +260,24 @@ class InvoiceClient(ClientBase):
         """
         url = parse_url(self._base_url, 'invoices', invoice_id, 'cancel')
 
-        body = json.dumps({
+        body = {
             'subject': subject,
             'note': note,
             'send_to_invoicer': send_to_invoicer,
             'send_to_recipient': send_to_recipient
-        })
+        }
 
         if additional_recipients:
             body['additional_recipients'] = [{'email_address': x} for x in additional_recipients]
 
-        response = self._session.post(url, body)
+        response = yield self._request.post(url, body)
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
+    @api_operation
     def generate_qr_code(self, invoice_id: str, width: int = 500, height: int = 500, action: str = 'pay') -> PaypalApiResponse:
         """ Calls the paypal API to generate a QR code for an invoice. 
             The QR code is a PNG image in Base64-encoded format that corresponds to the invoice ID. 
@@ -244,14 +298,15 @@ class InvoiceClient(ClientBase):
             PaypalApiResponse -- Api operation response status containing the response
         """
         url = parse_url(self._base_url, 'invoices', invoice_id, 'generate-qr-code')
-        body = json.dumps({ 'width': width, 'height': height, 'action': action })
-        response = self._session.post(url, body)
+        body = { 'width': width, 'height': height, 'action': action }
+        response = yield self._request.post(url, body)
 
         if response.status_code != 200:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)        
 
+    @api_operation
     def record_invoice_payment(self, invoice_id: str, payment_detail: PaymentDetail) -> PaypalApiResponse:
         """ Calls the API to record a payment for the invoice.
             If no payment is due, the invoice is marked as PAID. 
@@ -265,15 +320,16 @@ class InvoiceClient(ClientBase):
             PaypalApiResponse -- Api operation response status containing the response
         """
         url = parse_url(self._base_url, 'invoices', invoice_id, 'payments')
-        body = json.dumps({ k : v for k,v in payment_detail.to_dict().items() if v != None })
+        body = { k : v for k,v in payment_detail.to_dict().items() if v != None }
 
-        response = self._session.post(url, body)
+        response = yield self._request.post(url, body)
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)        
 
+    @api_operation
     def delete_external_payment(self, invoice_id: str, transaction_id: str)  -> PaypalApiResponse:
         """ Deletes an external payment, by invoice ID and transaction ID.
         
@@ -284,13 +340,14 @@ class InvoiceClient(ClientBase):
         Returns:
             PaypalApiResponse -- Api operation response status containing the response
         """
-        response = self._session.delete(parse_url(self._base_url, 'invoices', invoice_id, 'payments', transaction_id))
+        response = yield self._request.delete(parse_url(self._base_url, 'invoices', invoice_id, 'payments', transaction_id))
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
+    @api_operation
     def record_invoice_refund(self, invoice_id: str, refund_detail: RefundDetail)  -> PaypalApiResponse:
         """Calls the API to record a refund for the invoice.
            If all payments are refunded, the invoice is marked as REFUNDED. 
@@ -304,15 +361,16 @@ class InvoiceClient(ClientBase):
             PaypalApiResponse -- Api operation response status containing the response
         """
         url = parse_url(self._base_url, 'invoices', invoice_id, 'refunds')
-        body = json.dumps({ k : v for k,v in refund_detail.to_dict().items() if v != None })
+        body = { k : v for k,v in refund_detail.to_dict().items() if v != None }
 
-        response = self._session.post(url, body)
+        response = yield self._request.post(url, body)
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)        
         
+    @api_operation
     def delete_external_refund(self, invoice_id: str, transaction_id: str)  -> PaypalApiResponse:
         """  Deletes an external refund, by invoice ID and transaction ID.
         
@@ -323,13 +381,14 @@ class InvoiceClient(ClientBase):
         Returns:
             PaypalApiResponse -- Api operation response status containing the response
         """
-        response = self._session.delete(parse_url(self._base_url, 'invoices', invoice_id, 'refunds', transaction_id))
+        response = yield self._request.delete(parse_url(self._base_url, 'invoices', invoice_id, 'refunds', transaction_id))
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
+    @api_operation
     def send_invoice_reminder(
         self, invoice_id: str, subject: str, note: str, send_to_invoicer: bool,
         send_to_recipient: bool, additional_recipients: List[str] = []) -> PaypalApiResponse[Invoice]:
@@ -351,23 +410,24 @@ class InvoiceClient(ClientBase):
         """
         url = parse_url(self._base_url, 'invoices', invoice_id, 'remind')
 
-        body = json.dumps({
+        body = {
             'subject': subject,
             'note': note,
             'send_to_invoicer': send_to_invoicer,
             'send_to_recipient': send_to_recipient
-        })
+        }
 
         if additional_recipients:
             body['additional_recipients'] = [{'email_address': x} for x in additional_recipients]
 
-        response = self._session.post(url, body)
+        response = yield self._request.post(url, body)
 
         if response.status_code != 204:
             return PaypalApiResponse.error(response)
         
         return PaypalApiResponse.success(response)
 
+    @api_operation
     def send_invoice(
         self, invoice_id: str, subject: str, note: str, send_to_invoicer: bool,
         send_to_recipient: bool, additional_recipients: List[str] = [], paypal_request_id: str = None) -> PaypalApiResponse[Invoice]:
@@ -395,20 +455,20 @@ class InvoiceClient(ClientBase):
         response = None
         url = parse_url(self._base_url, 'invoices', invoice_id, 'send')
 
-        body = json.dumps({
+        body = {
             'subject': subject,
             'note': note,
             'send_to_invoicer': send_to_invoicer,
             'send_to_recipient': send_to_recipient
-        })
+        }
 
         if additional_recipients:
             body['additional_recipients'] = [{'email_address': x} for x in additional_recipients]
 
         if paypal_request_id:
-            response = self._session.post(url, body, headers = { 'PayPal-Request-Id' : paypal_request_id })
+            response = yield self._request.post(url, body, headers = { 'PayPal-Request-Id' : paypal_request_id })
         else:
-            response = self._session.post(url, body)
+            response = yield self._request.post(url, body)
 
         if response.status_code // 100 != 2:
             return PaypalApiResponse.error(response)
@@ -418,7 +478,8 @@ class InvoiceClient(ClientBase):
 
         return PaypalApiResponse.success(response)
 
-    def search_invoices(self, page: int, page_size: int, total_required: bool, search: InvoiceSearchRequest) -> PaypalPage[Invoice]:
+    @api_operation
+    def search_invoices(self, page: int, page_size: int, total_required: bool, search: InvoiceSearchRequest, lazy: bool = False) -> PaypalPage[Invoice]:
         """Searches for and lists invoices that match search criteria. 
            If you pass multiple criteria, the response lists invoices 
            that match all criteria.
@@ -428,26 +489,80 @@ class InvoiceClient(ClientBase):
             page_size {int} -- page size
             total_required {bool} -- total count required
             search {InvoiceSearchRequest} -- search criteria to be matched
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Invoice] -- The paged elements in paypal API paged response 
         """
-        query_params = { page: page, page_size: page_size, total_required: total_required }
+        query_params = { 'page': page, 'page_size': page_size, 'total_required': total_required }
         
-        response = self._session.post(
+        response = yield self._request.post(
             parse_url(self._base_url, 'search-invoices'), 
-            json.dumps(search.to_dict()), params = query_params
+            search.to_dict(), params = query_params
         )
 
         if response.status_code != 200:
             return PaypalPage.error(response)
         
         json_response = response.json()
-        items = [ Invoice.serialize_from_json(x) for x in json_response['items']]
+        items = parse_entities(Invoice, json_response['items'], lazy=lazy)
         links = [ ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response['links'] ]
 
         return PaypalPage.success(response, json_response.get('total_items'), json_response.get('total_pages'), items, links)
 
+    def iter_search_invoice_pages(
+            self, search: InvoiceSearchRequest, page_size: int = 10, max_workers: int = 4, ordered: bool = True, lazy: bool = False
+        ) -> Iterator[PaypalPage[Invoice]]:
+        """Reads every page of invoices matching a search criteria, 
+           requesting the pages after the first one concurrently
+        
+        Arguments:
+            search {InvoiceSearchRequest} -- search criteria to be matched
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PaypalPage[Invoice]] -- The invoice pages
+        """
+        return self._fan_out_pages(
+            lambda: self.search_invoices(1, page_size, True, search, lazy),
+            lambda page: self.search_invoices(page, page_size, True, search, lazy), max_workers, ordered
+        )
+
+    def iter_search_invoices(self, search: InvoiceSearchRequest, page_size: int = 10, prefetch: bool = False, lazy: bool = False) -> Iterator[Invoice]:
+        """Lazily lists the invoices matching a search criteria page by page
+        
+        Arguments:
+            search {InvoiceSearchRequest} -- search criteria to be matched
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[Invoice] -- The invoices
+        """
+        # Search pages are requested by index since the next page links require the search body
+        pages = itertools.count(2)
+
+        return self._iter_elements(
+            lambda: self.search_invoices(1, page_size, True, search, lazy),
+            lambda link: self.search_invoices(next(pages), page_size, True, search, lazy), prefetch
+        )
+
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> T:
         """Creates a client from a given paypal session
@@ -469,6 +584,7 @@ class InvoiceTemplateClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
             super().__init__(base_url, session)
 
+    @api_operation
     def create_template(self, template: Template, *, headers: dict = dict()) -> PaypalApiResponse:
         """Calls the Paypal API to create a template.
         
@@ -478,7 +594,7 @@ class InvoiceTemplateClient(ClientBase):
         Returns:
             PaypalApiResponse[Template] -- The paypal API response
         """
-        response = self._session.post(self._base_url, json.dumps(template.to_dict()), headers=headers)
+        response = yield self._request.post(self._base_url, template.to_dict(), headers=headers)
 
         if response.status_code != 200:
             return PaypalPage.error(response)
@@ -487,6 +603,7 @@ class InvoiceTemplateClient(ClientBase):
 
         return PaypalApiResponse.success(response, parsed_data)
     
+    @api_operation
     def list_templates(self, page: int = 1, page_size: int = 20, fields: InvoiceListRequestField = InvoiceListRequestField.ALL) -> PaypalApiBulkResponse[Invoice]:
         """ Calls the paypal API to lists merchant-created templates with associated details. The associated details include 
             the emails, addresses, and phone numbers from the user's PayPal profile.
@@ -504,13 +621,14 @@ class InvoiceTemplateClient(ClientBase):
         # a page of templates, with the desired fields. This response must be tested.
         params = { 'page': page, 'page_size': page_size, 'fields': fields.name.lower() }
 
-        response = self._session.get(self._base_url, params)
+        response = yield self._request.get(self._base_url, params)
 
         if response.status_code != 200:
             return PaypalApiBulkResponse.error(response)
 
         return PaypalApiBulkResponse.success(response, Invoice.serialize_from_json(response.json()))
         
+    @api_operation
     def delete_template(self, template_id: str) -> PaypalApiResponse:
         """Deletes a template by id
         
@@ -520,9 +638,10 @@ class InvoiceTemplateClient(ClientBase):
         Returns:
             PaypalApiResponse -- API Response.
         """
-        response = self._session.delete(parse_url(self._base_url, template_id))
+        response = yield self._request.delete(parse_url(self._base_url, template_id))
         return PaypalApiResponse.success(response) if response.status_code == 204 else PaypalApiResponse.error(response)
     
+    @api_operation
     def update_template(self, template_id: str, template: Template) -> PaypalApiResponse[Template]:
         """Fully updates a template
         
@@ -533,7 +652,7 @@ class InvoiceTemplateClient(ClientBase):
         Returns:
             PaypalApiResponse[Template] -- A response that might contain the template
         """
-        response = self._session.put(parse_url(self._base_url, template_id), json.dumps(template.to_dict()))
+        response = yield self._request.put(parse_url(self._base_url, template_id), template.to_dict())
 
         # TODO: The docs are inconsistent on this call response. Test manually
         if response.status_code // 100 != 2:
@@ -542,6 +661,7 @@ class InvoiceTemplateClient(ClientBase):
         parsed_data = Template.serialize_from_json(response.json()) if response.json() else None
         return PaypalApiResponse.success(response, parsed_data)
     
+    @api_operation
     def show_template_details(self, template_id: str) -> PaypalApiResponse[Template]:
         """Shows the details for a template by it's id
         
@@ -551,7 +671,7 @@ class InvoiceTemplateClient(ClientBase):
         Returns:
             PaypalApiResponse[Template] -- Response status with a Template object
         """
-        response = self._session.get(parse_url(self._base_url, template_id))
+        response = yield self._request.get(parse_url(self._base_url, template_id))
 
         if response.status_code != 200:
             return PaypalApiResponse.error(response)
@@ -570,4 +690,12 @@ class InvoiceTemplateClient(ClientBase):
             T -- an instance of Dispute client with the right configuration by session mode
         """
         base_url = parse_url(_LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL, 'templates')
-        return cls(base_url, session)
\ No newline at end of file
+        return cls(base_url, session)
+
+class AsyncInvoiceClient(AsyncClientBase, InvoiceClient):
+    """Asyncio invoice v2 API client class
+    """
+
+class AsyncInvoiceTemplateClient(AsyncClientBase, InvoiceTemplateClient):
+    """Asyncio client for invoice template resources
+    """
@@ -3,12 +3,11 @@
 
     Resource docs & Reference: https://developer.paypal.com/docs/api/orders/v2/  
 """
-import json
 
 from datetime import datetime
 from typing import Type, TypeVar, List
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -45,6 +44,7 @@ class OrderClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def create_order(self, order: Order, request_id: str = None, partner_attr_id: str = None, response_type: ResponseType = ResponseType.MINIMAL) -> PaypalApiResponse[Order]:
         """Calls the paypal Api to create an order
         
@@ -68,13 +68,14 @@ class OrderClient(ClientBase):
         if partner_attr_id:
             headers['PayPal-Partner-Attribution-Id'] = partner_attr_id
         
-        api_response = self._session.post(url, json.dumps(order.to_dict()), headers = headers)
+        api_response = yield self._request.post(url, order.to_dict(), headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Order.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def update_order(self, order_id: str, updates: List[PatchUpdateRequest]) -> PaypalApiResponse:
         """Updates an order with the CREATED or APPROVED status.
         
@@ -86,15 +87,16 @@ class OrderClient(ClientBase):
             PaypalApiResponse -- API operation response
         """
         url = parse_url(self._base_url, order_id)
-        body = json.dumps([{ 'op': x.operation, 'path': x.path, 'value': x.value } for x in updates ])
+        body = [{ 'op': x.operation, 'path': x.path, 'value': x.value } for x in updates ]
 
-        api_response = self._session.patch(url, body)
+        api_response = yield self._request.patch(url, body)
 
         if api_response.status_code != 204:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response)
 
+    @api_operation
     def show_order_details(self, order_id: str) -> PaypalApiResponse[Order]:
         """Calls the api to retrieve the order details
         
@@ -104,13 +106,14 @@ class OrderClient(ClientBase):
         Returns:
             PaypalApiResponse -- API operation response with the order if successful
         """
-        api_response = self._session.get(parse_url(self._base_url, order_id))
+        api_response = yield self._request.get(parse_url(self._base_url, order_id))
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Order.serialize_from_json(api_response.json()))
 
+    @api_operation
     def authorize_payment_for_order(
         self, order_id: str, payment_source: PaymentSource = None,
         request_id: str = None,  client_metadata_id: str = None,
@@ -145,15 +148,16 @@ class OrderClient(ClientBase):
             headers['PayPal-Client-Metadata-Id'] = client_metadata_id
 
         if payment_source:
-            api_response = self._session.post(url, json.dumps(payment_source.to_dict()), headers = headers)
+            api_response = yield self._request.post(url, payment_source.to_dict(), headers = headers)
         else:
-            api_response = self._session.post(url, None)
+            api_response = yield self._request.post(url, None, headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse(True, api_response)
         
         return PaypalApiResponse(False, api_response, Order.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def capture_payment_for_order(
         self, order_id: str, payment_source: PaymentSource = None,
         request_id: str = None,  client_metadata_id: str = None,
@@ -188,9 +192,9 @@ class OrderClient(ClientBase):
             headers['PayPal-Client-Metadata-Id'] = client_metadata_id
 
         if payment_source:
-            api_response = self._session.post(url, json.dumps(payment_source.to_dict()), headers = headers)
+            api_response = yield self._request.post(url, payment_source.to_dict(), headers = headers)
         else:
-            api_response = self._session.post(url, None)
+            api_response = yield self._request.post(url, None, headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse(True, api_response)
@@ -210,3 +214,7 @@ class OrderClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncOrderClient(AsyncClientBase, OrderClient):
+    """Asyncio orders resource group client class.
+    """
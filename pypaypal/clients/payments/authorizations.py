@@ -3,12 +3,11 @@
 
     Resource docs & Reference: https://developer.paypal.com/docs/api/payments/v2/ 
 """
-import json
 
 from datetime import datetime
 from typing import Type, TypeVar, List
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -47,6 +46,7 @@ class AuthorizationClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
     
+    @api_operation
     def show_authorization_details(self, authorization_id: str) -> PaypalApiResponse[Authorization]:
         """Calls the paypal API to show details for an authorized payment, by ID.
         
@@ -56,13 +56,14 @@ class AuthorizationClient(ClientBase):
         Returns:
             PaypalApiResponse[Authorization] -- An api response with the authorization details
         """
-        api_response = self._session.get(parse_url(self._base_url, authorization_id))
+        api_response = yield self._request.get(parse_url(self._base_url, authorization_id))
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Authorization.serialize_from_json(api_response.json()))
     
+    @api_operation
     def capture_authorized_payment(
         self, authorization_id: str, invoice_id: str = None, note_to_payer: str = None,
         instruction: PaymentInstruction = None, amount: Money = None, final_capture: bool = False,
@@ -100,17 +101,18 @@ class AuthorizationClient(ClientBase):
         if final_capture:
             body['final_capture'] = final_capture
         if instruction:
-            body['instruction'] = instruction        
+            body['instruction'] = instruction.to_dict()
         if amount:
             body['amount'] = amount.to_dict()
 
-        api_response = self._session.post(url, json.dumps(body), headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
 
         if api_response.status_code != 201:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Capture.serialize_from_json(api_response.json()))
 
+    @api_operation
     def reauthorize_payment(
         self, authorization_id: str, amount: Money, request_id: str = None,
         response_type: ResponseType = ResponseType.MINIMAL) -> PaypalApiResponse[Authorization]:
@@ -135,13 +137,14 @@ class AuthorizationClient(ClientBase):
         if amount:
             body['amount'] = amount.to_dict()
 
-        api_response = self._session.post(url, json.dumps(body), headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
 
         if api_response.status_code != 201:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Authorization.serialize_from_json(api_response.json()))
 
+    @api_operation
     def void_payment(self, authorization_id: str, auth_assertion_token: str = None) -> PaypalApiResponse:
         """Calls the paypal API to void an authorized payment, by ID. 
            See the api docs for a full set of rules.
@@ -159,9 +162,9 @@ class AuthorizationClient(ClientBase):
         url = parse_url(self._base_url, authorization_id, 'void')
 
         if auth_assertion_token:
-            api_response = self._session.post(url, None, headers = {'PayPal-Auth-Assertion' : auth_assertion_token})
+            api_response = yield self._request.post(url, None, headers = {'PayPal-Auth-Assertion' : auth_assertion_token})
         else:
-            api_response = self._session.post(url, None)
+            api_response = yield self._request.post(url, None)
 
         if api_response.status_code != 204:
             return PaypalApiResponse(True, api_response)
@@ -181,3 +184,7 @@ class AuthorizationClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncAuthorizationClient(AsyncClientBase, AuthorizationClient):
+    """Asyncio authorizations resource group client class.
+    """
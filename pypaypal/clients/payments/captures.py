@@ -3,12 +3,11 @@
 
     Resource docs & Reference: https://developer.paypal.com/docs/api/payments/v2/ 
 """
-import json
 
 from datetime import datetime
 from typing import Type, TypeVar, List
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -44,6 +43,7 @@ class CaptureClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def show_capture_details(self, capture_id: str) -> PaypalApiResponse[Capture]:
         """Calls the paypal API to show details for an authorized payment, by ID.
         
@@ -53,13 +53,14 @@ class CaptureClient(ClientBase):
         Returns:
             PaypalApiResponse[Capture] -- An api response with the capture details
         """
-        api_response = self._session.get(parse_url(self._base_url, capture_id))
+        api_response = yield self._request.get(parse_url(self._base_url, capture_id))
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Capture.serialize_from_json(api_response.json()))
 
+    @api_operation
     def refund_capture(
         self, capture_id: str, invoice_id: str, note_to_payer: str, 
         amount: Money = None, request_id: str = None, auth_assertion_token: str = None,
@@ -100,7 +101,7 @@ class CaptureClient(ClientBase):
         if amount:
             body['amount'] = amount.to_dict()
 
-        api_response = self._session.post(url, json.dumps(body), headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
 
         if api_response.status_code != 201:
             return PaypalApiResponse(True, api_response)
@@ -120,3 +121,7 @@ class CaptureClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncCaptureClient(AsyncClientBase, CaptureClient):
+    """Asyncio captures resource group client class.
+    """
@@ -8,7 +8,7 @@ import json
 from datetime import datetime
 from typing import Type, TypeVar, List
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -42,6 +42,7 @@ class RefundClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def show_refund_details(self, refund_id: str) -> PaypalApiResponse[Refund]:
         """Calls the paypal API to show details for an authorized payment, by ID.
         
@@ -51,7 +52,7 @@ class RefundClient(ClientBase):
         Returns:
             PaypalApiResponse[Refund] -- An api response with the refund details
         """
-        api_response = self._session.get(parse_url(self._base_url, refund_id))
+        api_response = yield self._request.get(parse_url(self._base_url, refund_id))
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
@@ -71,3 +72,7 @@ class RefundClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncRefundClient(AsyncClientBase, RefundClient):
+    """Asyncio refunds resource group client class.
+    """
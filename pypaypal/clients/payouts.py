@@ -3,10 +3,8 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/payments.payouts-batch/v1/
 """
 
-import json
-
-from typing import Type, TypeVar, List
-from pypaypal.clients.base import ClientBase, ActionLink
+from typing import Type, TypeVar, List, Iterator, NamedTuple
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -20,13 +18,15 @@ from pypaypal.entities.base import (
     ResponseType, 
     PaypalApiResponse, 
     PatchUpdateRequest,
-    PaypalApiBulkResponse
+    PaypalApiBulkResponse,
+    parse_entities
 )
 
 from pypaypal.entities.payouts import (
     PayoutItem,
     PagedPayout,
     PayoutHeader,
+    PayoutItemDetail,
     SenderBatchHeader
 )
 
@@ -44,6 +44,29 @@ T = TypeVar('T', bound = 'PayoutClient')
 
 I = TypeVar('I', bound = 'PayoutItemClient')
 
+"""
+    Max amount of items in a single batch payout
+"""
+MAX_PAYOUT_BATCH_SIZE = 15000
+
+"""
+    Max amount of items in a payout batch details page
+"""
+MAX_PAYOUT_ITEMS_PAGE_SIZE = 1000
+
+class PayoutItemStatus(NamedTuple):
+    """Compact payout item read for reconciliation, without the entity build
+    """
+    payout_item_id: str
+    transaction_status: str
+    amount: str
+    currency_code: str
+
+    @classmethod
+    def from_json(cls, json_data: dict) -> 'PayoutItemStatus':
+        amount = (json_data.get('payout_item') or json_data).get('amount') or {}
+        return cls(json_data.get('payout_item_id'), json_data.get('transaction_status'), amount.get('value'), amount.get('currency', amount.get('currency_code')))
+
 class PayoutClient(ClientBase):
     """Payout resource group client class.
     """
@@ -51,12 +74,13 @@ class PayoutClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
     
-    def create_batch_payout(self, sender_batch_header: SenderBatchHeader, items: List[PayoutItem], request_id: str = None) -> PaypalApiResponse[PayoutHeader]:
+    @api_operation
+    def create_batch_payout(self, sender_batch_header: SenderBatchHeader, items: List[PayoutItemDetail], request_id: str = None) -> PaypalApiResponse[PayoutHeader]:
         """Calls the paypal API to create a batch payout to one or more recipients
         
         Arguments:
             sender_batch_header {SenderBatchHeader} -- Sender-provided payout header for a payout request.
-            items {List[PayoutItem]} -- A list of individual payout items.
+            items {List[PayoutItemDetail]} -- A list of individual payout items (max MAX_PAYOUT_BATCH_SIZE).
         
         Keyword Arguments:
             request_id {str} -- Request id for idempotence (default: {None})
@@ -70,8 +94,8 @@ class PayoutClient(ClientBase):
         if request_id:
             headers['PayPal-Request-Id'] = request_id
         
-        body = json.dumps({ sender_batch_header.to_dict(), items.to_dict() })
-        api_response = self._session.post(url, body, headers = headers) if headers else self._session.post(url, body)
+        body = { 'sender_batch_header': sender_batch_header.to_dict(), 'items': [ x.to_dict() for x in items ] }
+        api_response = yield (self._request.post(url, body, headers = headers) if headers else self._request.post(url, body))
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -80,6 +104,7 @@ class PayoutClient(ClientBase):
 
         return PaypalApiResponse.success(api_response, PayoutHeader.serialize_from_json(j_data) if j_data else None)
 
+    @api_operation
     def show_payout_batch_details(
         self, payout_batch_id: str, page: int = 1, page_size: int = 1000, 
         fields: str = None, total_required: bool = True) -> PaypalApiResponse[PagedPayout]:
@@ -90,13 +115,75 @@ class PayoutClient(ClientBase):
         if fields:
             params['fields'] = fields
         
-        api_response = self._session.get(url, params)
+        api_response = yield self._request.get(url, params)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
 
         return PaypalApiResponse.success(api_response, PagedPayout.serialize_from_json(api_response.json()))
 
+    def _payout_items_page(self, api_response, page_size: int, compact: bool, lazy: bool = False) -> PaypalPage:
+        """Builds a page of payout items from a payout batch details response
+        
+        Arguments:
+            api_response {Response} -- the API response
+            page_size {int} -- size of the requested page
+            compact {bool} -- parse the items as PayoutItemStatus tuples
+
+        Keyword Arguments:
+            lazy {bool} -- parse the items as read only LazyEntity proxies (default: {False})
+        
+        Returns:
+            PaypalPage -- The page with the batch items
+        """
+        if api_response.status_code // 100 != 2:
+            return PaypalPage.error(api_response)
+
+        json_response = api_response.json()
+        items = json_response.get('items') or []
+        total_items = json_response.get('total_items', 0)
+        total_pages = json_response.get('total_pages') or -(-total_items // page_size)
+        elements = [ PayoutItemStatus.from_json(x) for x in items ] if compact else parse_entities(PayoutItem, items, lazy=lazy)
+        links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response.get('links', [])]
+
+        return PaypalPage.success(api_response, total_items, total_pages, elements, links)
+
+    @api_operation
+    def _read_payout_items(self, payout_batch_id: str, page: int, page_size: int, compact: bool, lazy: bool = False) -> PaypalPage:
+        url = parse_url(self._base_url, payout_batch_id)
+        params = { 'page': page,  'page_size': page_size, 'total_required': True }
+        api_response = yield self._request.get(url, params)
+
+        return self._payout_items_page(api_response, page_size, compact, lazy)
+
+    def iter_payout_batch_items(
+            self, payout_batch_id: str, page_size: int = MAX_PAYOUT_ITEMS_PAGE_SIZE, 
+            max_workers: int = 4, ordered: bool = False, compact: bool = False, lazy: bool = False
+        ) -> Iterator[PayoutItem]:
+        """Streams every item of a payout batch, requesting the pages after the first one concurrently
+        
+        Arguments:
+            payout_batch_id {str} -- the batch id
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {MAX_PAYOUT_ITEMS_PAGE_SIZE})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the items by page index or as the pages are read (default: {False})
+            compact {bool} -- yield PayoutItemStatus tuples instead of building the entities (default: {False})
+            lazy {bool} -- yield read only LazyEntity proxies instead of building the entities (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PayoutItem] -- The batch items (PayoutItemStatus if compact)
+        """
+        pages = self._fan_out_pages(
+            lambda: self._read_payout_items(payout_batch_id, 1, page_size, compact, lazy),
+            lambda page: self._read_payout_items(payout_batch_id, page, page_size, compact, lazy), max_workers, ordered
+        )
+        return (element for page in pages for element in page.elements)
+
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> T:
         """Creates a client from a given paypal session
@@ -117,6 +204,7 @@ class PayoutItemClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def show_payout_item_details(self, payout_item_id: str) -> PaypalApiResponse[PayoutItem]:
         """Calls the paypal API to show a payout item details
         
@@ -126,13 +214,14 @@ class PayoutItemClient(ClientBase):
         Returns:
             PaypalApiResponse[PayoutItem] -- Response with the item data if successful
         """        
-        api_response = self._session.get(parse_url(self._base_url, payout_item_id))
+        api_response = yield self._request.get(parse_url(self._base_url, payout_item_id))
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
 
         return PaypalApiResponse.success(api_response, PayoutItem.serialize_from_json(api_response.json()))
 
+    @api_operation
     def cancel_unclaimed_payout_item(self, payout_item_id: str) -> PaypalApiResponse[PayoutItem]:
         """Calls the paypal API to cancel an unclaimed payout item details
         
@@ -142,7 +231,7 @@ class PayoutItemClient(ClientBase):
         Returns:
             PaypalApiResponse[PayoutItem] -- Response with the item data if successful
         """        
-        api_response = self._session.post(parse_url(self._base_url, payout_item_id))
+        api_response = yield self._request.post(parse_url(self._base_url, payout_item_id))
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -167,3 +256,41 @@ class PayoutItemClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(parse_url(base_url, 'payouts-item'), session)
+
+class AsyncPayoutClient(AsyncClientBase, PayoutClient):
+    """Asyncio payout resource group client class.
+    """
+    async def iter_payout_batch_items(
+            self, payout_batch_id: str, page_size: int = MAX_PAYOUT_ITEMS_PAGE_SIZE, 
+            max_workers: int = 4, ordered: bool = False, compact: bool = False, lazy: bool = False
+        ):
+        """Streams every item of a payout batch, requesting the pages after the first one concurrently
+        
+        Arguments:
+            payout_batch_id {str} -- the batch id
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {MAX_PAYOUT_ITEMS_PAGE_SIZE})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the items by page index or as the pages are read (default: {False})
+            compact {bool} -- yield PayoutItemStatus tuples instead of building the entities (default: {False})
+            lazy {bool} -- yield read only LazyEntity proxies instead of building the entities (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[PayoutItem] -- The batch items (PayoutItemStatus if compact)
+        """
+        pages = self._fan_out_pages(
+            lambda: self._read_payout_items(payout_batch_id, 1, page_size, compact, lazy),
+            lambda page: self._read_payout_items(payout_batch_id, page, page_size, compact, lazy), max_workers, ordered
+        )
+
+        async for page in pages:
+            for element in page.elements:
+                yield element
+
+class AsyncPayoutItemClient(AsyncClientBase, PayoutItemClient):
+    """Asyncio payout items resource group client class.
+    """
@@ -4,11 +4,10 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/catalog-products/v1/
 """
 
-import json
-from typing import Type, TypeVar, List
+from typing import Type, TypeVar, List, Iterator
 
-from pypaypal.clients.base import ClientBase, ActionLink
-from pypaypal.entities.base import ResponseType, PaypalApiResponse, PaypalPage
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
+from pypaypal.entities.base import ResponseType, PaypalApiResponse, PaypalPage, parse_entities
 
 from pypaypal.entities.product import Product, ProductType, ProductUpdateRequest
 
@@ -52,6 +51,7 @@ class ProductsClient(ClientBase):
         """
         super().__init__(url, session)
 
+    @api_operation
     def create_product(self, product: Product, response_type: ResponseType = ResponseType.MINIMAL) -> PaypalApiResponse[Product]:
         """Performs an API call to create a new product
         
@@ -67,18 +67,22 @@ class ProductsClient(ClientBase):
         body['update_time'] = body.pop('_update_time', None)
         self._clean_dictionary(body, _PRODUCT_PROPERTIES)
 
-        api_response = self._session.post(url, json.dumps(body), headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
         
         if api_response.status_code != 201:
             return PaypalApiResponse(True, api_response)
         return PaypalApiResponse(False, api_response, Product.serialize_from_json(api_response.json(), response_type))
 
-    def list_products(self, page_size: int, page: int) -> PaypalPage[Product]:
+    @api_operation
+    def list_products(self, page_size: int, page: int, lazy: bool = False) -> PaypalPage[Product]:
         """Performs an API call to get a page of products
         
         Arguments:
             page_size {int} -- Amount of elements in the page
             page {int} -- current page index
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Product] -- A page with product elements
@@ -86,29 +90,71 @@ class ProductsClient(ClientBase):
         url = self._base_url
         params = { 'page_size': page_size, 'page': page, 'total_required': True }
 
-        api_response = self._session.get(url, params)
+        api_response = yield self._request.get(url, params)
         
         if api_response.status_code != 200:
             return PaypalPage(True, api_response, 0, 0, [], [])
         
         json_response = api_response.json()
-        products = [ Product.serialize_from_json(x) for x in json_response['products']]
+        products = parse_entities(Product, json_response['products'], lazy=lazy)
         links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in json_response['links']]
 
         return PaypalPage(False, api_response, json_response['total_items'], json_response['total_pages'], products, links)
 
-    def list_products_from_page_link(self, page_link: ActionLink) -> PaypalPage[Product]:
+    def list_products_from_page_link(self, page_link: ActionLink, lazy: bool = False) -> PaypalPage[Product]:
         """Performs an API call to get a page of products
         
         Arguments:
-            page_size {int} -- Amount of elements in the page
-            page {int} -- current page index
+            page_link {ActionLink} -- page link
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Product] -- A page with product elements
         """
-        return self._page_from_link(page_link, 'products', Product)
+        return self._page_from_link(page_link, 'products', Product, lazy)
+
+    def iter_products(self, page_size: int = 10, prefetch: bool = False, lazy: bool = False) -> Iterator[Product]:
+        """Lazily lists the products page by page
+        
+        Keyword Arguments:
+            page_size {int} -- Amount of elements in the pages (default: {10})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[Product] -- The products
+        """
+        return self._iter_elements(
+            lambda: self.list_products(page_size, 1, lazy), 
+            lambda link: self.list_products_from_page_link(link, lazy), prefetch
+        )
+
+    def iter_product_pages(self, page_size: int = 10, max_workers: int = 4, ordered: bool = True, lazy: bool = False) -> Iterator[PaypalPage[Product]]:
+        """Reads every product page, requesting the pages after the first one concurrently
+        
+        Keyword Arguments:
+            page_size {int} -- Amount of elements in the pages (default: {10})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
 
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PaypalPage[Product]] -- The product pages
+        """
+        return self._fan_out_pages(
+            lambda: self.list_products(page_size, 1, lazy), 
+            lambda page: self.list_products(page_size, page, lazy), max_workers, ordered
+        )
+
+    @api_operation
     def show_product_details(self, product_id: str, response_type = ResponseType.MINIMAL) -> PaypalApiResponse[Product]:
         """Calls the API to get the details for a given product
         
@@ -123,13 +169,14 @@ class ProductsClient(ClientBase):
         """
         url = parse_url(self._base_url, product_id)
         headers = { 'Prefer': response_type.as_header_value() }        
-        api_response = self._session.get(url, None, headers = headers)
+        api_response = yield self._request.get(url, None, headers = headers)
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Product.serialize_from_json(api_response.json(), response_type))
     
+    @api_operation
     def product_details_from_entity(self, product: Product, response_type: ResponseType=ResponseType.MINIMAL) -> PaypalApiResponse[Product]:
         """Calls the API to get the details for a given product
         
@@ -144,13 +191,14 @@ class ProductsClient(ClientBase):
         """
         url = product.read_link
         headers = { 'Prefer': response_type.as_header_value() }        
-        api_response = self._session.get(url, None, headers = headers)
+        api_response = yield self._request.get(url, None, headers = headers)
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, Product.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def update_product(self, product_id: str, updates: List[ProductUpdateRequest]) -> PaypalApiResponse:
         """Updates a product
         
@@ -163,7 +211,7 @@ class ProductsClient(ClientBase):
         """
         url = parse_url(self._base_url, product_id)
         body = [ {'op': x.operation, 'path': x.path, 'value': x.value} for x in updates ]
-        api_response = self._session.patch(url, json.dumps(body))
+        api_response = yield self._request.patch(url, body)
 
         return PaypalApiResponse(api_response.status_code != 204, api_response)
 
@@ -179,4 +227,8 @@ class ProductsClient(ClientBase):
             T -- an instance of TrackersClient with the right configuration by session mode
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(base_url, session)
\ No newline at end of file
+        return cls(base_url, session)
+
+class AsyncProductsClient(AsyncClientBase, ProductsClient):
+    """Asyncio products resource group client class
+    """
@@ -3,10 +3,9 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/referenced-ReferencedPayouts/v1/
 """
 
-import json
 
-from typing import Type, TypeVar, List
-from pypaypal.clients.base import ClientBase, ActionLink
+from typing import Type, TypeVar, List, Iterator
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -16,6 +15,7 @@ from pypaypal.http import (
 )
 
 from pypaypal.entities.base import ( 
+    PaypalPage,
     ResponseType, 
     PaypalApiResponse, 
     PatchUpdateRequest,
@@ -50,6 +50,7 @@ class ReferencedPayoutClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
     
+    @api_operation
     def create_referenced_batch_payout(
         self, request: ReferencedPayoutRequest, request_id: str = None, partnerAttrId: str = None) -> PaypalApiBulkResponse[ActionLink]:
         """Creates a referenced batch payout for asynchronous, offline processing
@@ -75,7 +76,7 @@ class ReferencedPayoutClient(ClientBase):
 
         body = request.to_dict()
         body.pop('_execution_type', None)
-        api_response = self._session.post(self._base_url, json.dumps(body), headers = headers)
+        api_response = yield self._request.post(self._base_url, body, headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiBulkResponse.error(api_response)
@@ -95,11 +96,28 @@ class ReferencedPayoutClient(ClientBase):
             PaypalApiResponse[ReferencedPayoutResponse] -- response info
         """
         if api_response.status_code // 100 != 2:
-            return PaypalApiBulkResponse.error(api_response)
+            return PaypalApiResponse.error(api_response)
         
         j_data = api_response.json()
-        return PaypalApiBulkResponse.success(api_response, ReferencedPayoutResponse.serialize_from_json(j_data) if j_data else None)        
+        return PaypalApiResponse.success(api_response, ReferencedPayoutResponse.serialize_from_json(j_data) if j_data else None)
 
+    def _referenced_items_page(self, api_response) -> PaypalPage[ReferencedPayoutsItem]:
+        """Wraps a list batch payout items response in a page to follow its links
+        
+        Arguments:
+            api_response {PaypalApiResponse[ReferencedPayoutResponse]} -- the list response
+        
+        Returns:
+            PaypalPage[ReferencedPayoutsItem] -- the page with the listed items
+        """
+        if api_response.has_errors:
+            return PaypalPage.error(api_response._raw_response)
+
+        listed = api_response.parsed_response
+        items, links = (listed.referenced_payouts, listed.links) if listed else ([], [])
+        return PaypalPage.success(api_response._raw_response, None, None, items, links)
+
+    @api_operation
     def list_referenced_batch_payout_items(self, payouts_batch_id: str) -> PaypalApiResponse[ReferencedPayoutResponse]:
         """Calls the API to list the payout items in a referenced batch payout. Each item in the list includes payout item details. 
         
@@ -109,8 +127,11 @@ class ReferencedPayoutClient(ClientBase):
         Returns:
             PaypalApiResponse[ReferencedPayoutResponse] -- Listed referenced payouts with the directive
         """
-        return self._process_referenced_list_response(self._session.get(parse_url(self._base_url, payouts_batch_id)))
+        api_response = yield self._request.get(parse_url(self._base_url, payouts_batch_id))
+
+        return self._process_referenced_list_response(api_response)
 
+    @api_operation
     def list_referenced_batch_payout_items_by_link(self, link: ActionLink) -> PaypalApiResponse[ReferencedPayoutResponse]:
         """Calls the API to list the payout items in a referenced batch payout. Each item in the list includes payout item details. 
         
@@ -120,7 +141,30 @@ class ReferencedPayoutClient(ClientBase):
         Returns:
             PaypalApiResponse[ReferencedPayoutResponse] -- Listed referenced payouts with the directive
         """
-        return self._process_referenced_list_response(self._session.get(link.href))
+        api_response = yield self._request.get(link.href)
+
+        return self._process_referenced_list_response(api_response)
+
+    def iter_referenced_batch_payout_items(self, payouts_batch_id: str, prefetch: bool = True) -> Iterator[ReferencedPayoutsItem]:
+        """Lazily streams the items of a referenced batch payout following the listing links, 
+           reading the next page in background while the current one is consumed.
+        
+        Arguments:
+            payouts_batch_id {str} -- The batch id
+        
+        Keyword Arguments:
+            prefetch {bool} -- read the next page ahead (default: {True})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[ReferencedPayoutsItem] -- The batch items
+        """
+        return self._iter_elements(
+            lambda: self._referenced_items_page(self.list_referenced_batch_payout_items(payouts_batch_id)),
+            lambda link: self._referenced_items_page(self.list_referenced_batch_payout_items_by_link(link)), prefetch
+        )
 
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> T:
@@ -152,14 +196,15 @@ class ReferencedPayoutItemClient(ClientBase):
             PaypalApiResponse[ReferencedPayoutsItem] -- The processed item
         """
         if api_response.status_code // 100 != 2:
-            return PaypalApiBulkResponse.error(api_response)
+            return PaypalApiResponse.error(api_response)
 
         j_data = api_response.json()        
-        return PaypalApiBulkResponse.success(
+        return PaypalApiResponse.success(
             api_response, 
             ReferencedPayoutsItem.serialize_from_json(j_data) if j_data else None
         )
 
+    @api_operation
     def create_referenced_payout_item(
             self, item: ReferencedPayoutsItem, request_id: str = None, 
             partnerAttrId: str = None, execution_type: ExecutionType = ExecutionType.SYNC
@@ -186,10 +231,11 @@ class ReferencedPayoutItemClient(ClientBase):
         if execution_type.is_async:
             headers['Prefer'] = 'respond-async'
 
-        return self._process_item_response(
-            self._session.post(self._base_url, json.dumps(item.to_dict()), headers = headers)
-        )
+        api_response = yield self._request.post(self._base_url, item.to_dict(), headers = headers)
+
+        return self._process_item_response(api_response)
     
+    @api_operation
     def show_referenced_payout_item_details(self, payout_item_id: str, partnerAttrId: str = None) -> PaypalApiResponse[ReferencedPayoutsItem]:
         """Calls the paypal api to show a referenced payout item details.
         
@@ -203,9 +249,12 @@ class ReferencedPayoutItemClient(ClientBase):
             PaypalApiResponse[ReferencedPayoutsItem] -- Api Response obj with the item
         """
         url = parse_url(self._base_url, payout_item_id)
-        headers = {'PayPal-Partner-Attribution-Id' : partnerAttrId } if payout_item_id else dict()
-        return self._process_item_response(self._session.get(url, headers = headers))
+        headers = {'PayPal-Partner-Attribution-Id' : partnerAttrId } if partnerAttrId else dict()
+        api_response = yield self._request.get(url, headers = headers)
 
+        return self._process_item_response(api_response)
+
+    @api_operation
     def show_referenced_payout_item_details_by_link(self, link: ActionLink, partnerAttrId: str = None) -> PaypalApiResponse[ReferencedPayoutsItem]:
         """Calls the paypal api to show a referenced payout item details.
         
@@ -219,8 +268,10 @@ class ReferencedPayoutItemClient(ClientBase):
             PaypalApiResponse[ReferencedPayoutsItem] -- Api Response obj with the item
         """
         url = link.href
-        headers = {'PayPal-Partner-Attribution-Id' : partnerAttrId } if payout_item_id else dict()
-        return self._process_item_response(self._session.get(url, headers = headers))
+        headers = {'PayPal-Partner-Attribution-Id' : partnerAttrId } if partnerAttrId else dict()
+        api_response = yield self._request.get(url, headers = headers)
+
+        return self._process_item_response(api_response)
 
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> I:
@@ -234,4 +285,35 @@ class ReferencedPayoutItemClient(ClientBase):
             T -- an instance of Dispute client with the right configuration by session mode
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(parse_url(base_url, 'referenced-payouts-items'), session)
\ No newline at end of file
+        return cls(parse_url(base_url, 'referenced-payouts-items'), session)
+
+class AsyncReferencedPayoutClient(AsyncClientBase, ReferencedPayoutClient):
+    """Asyncio referencedPayout resource group client class.
+    """
+    def iter_referenced_batch_payout_items(self, payouts_batch_id: str, prefetch: bool = True):
+        """Lazily streams the items of a referenced batch payout following the listing links, 
+           reading the next page in background while the current one is consumed.
+        
+        Arguments:
+            payouts_batch_id {str} -- The batch id
+        
+        Keyword Arguments:
+            prefetch {bool} -- read the next page ahead (default: {True})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[ReferencedPayoutsItem] -- The batch items
+        """
+        async def first_page():
+            return self._referenced_items_page(await self.list_referenced_batch_payout_items(payouts_batch_id))
+
+        async def next_page(link: ActionLink):
+            return self._referenced_items_page(await self.list_referenced_batch_payout_items_by_link(link))
+
+        return self._iter_elements(first_page, next_page, prefetch)
+
+class AsyncReferencedPayoutItemClient(AsyncClientBase, ReferencedPayoutItemClient):
+    """Asyncio payout items resource group client class.
+    """
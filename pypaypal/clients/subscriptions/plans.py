@@ -3,12 +3,11 @@
 
     Resource docs & Reference: https://developer.paypal.com/docs/api/subscriptions/v1/
 """
-import json
 
 from datetime import datetime
-from typing import Type, TypeVar, List, NamedTuple
+from typing import Type, TypeVar, List, Iterator, NamedTuple
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -57,6 +56,7 @@ class PlanClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def create_plan(self, plan: Plan, request_id: str = None, response_type: ResponseType = ResponseType.MINIMAL) -> PaypalApiResponse[Plan]:
         """Calls the paypal API to create a plan
         
@@ -71,23 +71,24 @@ class PlanClient(ClientBase):
             PaypalApiResponse[Plan] -- an API response object with the plan info
         """
         url = self._base_url
-        body = json.dumps(plan.to_dict())
+        body = plan.to_dict()
         headers = { 'Prefer': response_type.as_header_value() }
 
         if request_id:
             headers['PayPal-Request-Id'] = request_id
         
-        api_response = self._session.post(url, body, headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
         
         return PaypalApiResponse.success(api_response, Plan.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def list_plans(
             self, product_id: str = None, plan_ids: List[str] = [], 
             page_size: int = 10, page: int = 1, total_required: bool = True, 
-            response_type: ResponseType = ResponseType.MINIMAL
+            response_type: ResponseType = ResponseType.MINIMAL, lazy: bool = False
         ) -> PaypalPage[Plan]:
         """Calls the Paypal API to list different plan details in a page
         
@@ -98,6 +99,7 @@ class PlanClient(ClientBase):
             page {int} -- desired page (default: {1})
             total_required {bool} -- flag to show the total count in the response (default: {True})
             response_type {ResponseType} -- response type (default: {ResponseType.MINIMAL})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Plan] -- Page with plan details
@@ -110,14 +112,15 @@ class PlanClient(ClientBase):
         if plan_ids:
             params['plan_ids'] = ','.join(plan_ids)
 
-        api_response = self._session.get(url, params, headers = { 'Prefer': response_type.as_header_value() })
+        api_response = yield self._request.get(url, params, headers = { 'Prefer': response_type.as_header_value() })
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
-        return PaypalPage.full_parse_success(api_response, Plan, 'plans', response_type)
+        return PaypalPage.full_parse_success(api_response, Plan, 'plans', response_type, lazy)
 
-    def list_plans_from_link(self, link: ActionLink, response_type: ResponseType = ResponseType.MINIMAL) -> PaypalPage[Plan]:
+    @api_operation
+    def list_plans_from_link(self, link: ActionLink, response_type: ResponseType = ResponseType.MINIMAL, lazy: bool = False) -> PaypalPage[Plan]:
         """Calls the Paypal API to list different plan details in a page
 
         Arguments:
@@ -125,18 +128,71 @@ class PlanClient(ClientBase):
 
         Keyword Arguments:
             response_type {ResponseType} -- response type (default: {ResponseType.MINIMAL})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[Plan] -- Page with plan details
         """
         url = link.href
-        api_response = self._session.get(url, headers = { 'Prefer': response_type.as_header_value() })
+        api_response = yield self._request.get(url, headers = { 'Prefer': response_type.as_header_value() })
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
-        return PaypalPage.full_parse_success(api_response, Plan, 'plans', response_type)
+        return PaypalPage.full_parse_success(api_response, Plan, 'plans', response_type, lazy)
 
+    def iter_plans(
+            self, product_id: str = None, plan_ids: List[str] = [], page_size: int = 10, 
+            response_type: ResponseType = ResponseType.MINIMAL, prefetch: bool = False, lazy: bool = False
+        ) -> Iterator[Plan]:
+        """Lazily lists the plans page by page
+        
+        Keyword Arguments:
+            product_id {str} -- product id to query (default: {None})
+            plan_ids {List[str]} -- list of desired plan ids (10 supported) (default: {[]})
+            page_size {int} -- size of the pages (default: {10})
+            response_type {ResponseType} -- response type (default: {ResponseType.MINIMAL})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[Plan] -- The plans
+        """
+        return self._iter_elements(
+            lambda: self.list_plans(product_id, plan_ids, page_size, 1, True, response_type, lazy),
+            lambda link: self.list_plans_from_link(link, response_type, lazy), prefetch
+        )
+
+    def iter_plan_pages(
+            self, product_id: str = None, plan_ids: List[str] = [], page_size: int = 10, 
+            response_type: ResponseType = ResponseType.MINIMAL, max_workers: int = 4, ordered: bool = True, lazy: bool = False
+        ) -> Iterator[PaypalPage[Plan]]:
+        """Reads every plan page, requesting the pages after the first one concurrently
+        
+        Keyword Arguments:
+            product_id {str} -- product id to query (default: {None})
+            plan_ids {List[str]} -- list of desired plan ids (10 supported) (default: {[]})
+            page_size {int} -- size of the pages (default: {10})
+            response_type {ResponseType} -- response type (default: {ResponseType.MINIMAL})
+            max_workers {int} -- max pages requested at once (default: {4})
+            ordered {bool} -- yield the pages by index or as they're read (default: {True})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[PaypalPage[Plan]] -- The plan pages
+        """
+        return self._fan_out_pages(
+            lambda: self.list_plans(product_id, plan_ids, page_size, 1, True, response_type, lazy),
+            lambda page: self.list_plans(product_id, plan_ids, page_size, page, True, response_type, lazy), max_workers, ordered
+        )
+
+    @api_operation
     def update_plan(self, plan_id: str, update_request: List[PatchUpdateRequest]) -> PaypalApiResponse:
         """Patch request to update a plan. See the docs for details 
         
@@ -148,15 +204,16 @@ class PlanClient(ClientBase):
             PaypalApiResponse -- Response obj with operation status
         """
         url = parse_url(self._base_url, plan_id) 
-        body = json.dumps([ {'op': x.operation, 'value': x.value, 'path': x.path } for x in update_request ])
+        body = [ {'op': x.operation, 'value': x.value, 'path': x.path } for x in update_request ]
 
-        api_response = self._session.patch(url, body)
+        api_response = yield self._request.patch(url, body)
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
         return PaypalApiResponse.success(api_response)
 
+    @api_operation
     def show_plan_details(self, plan_id: str) -> PaypalApiResponse[Plan]:
         """Calls the paypal API to get the plan details
         
@@ -166,13 +223,14 @@ class PlanClient(ClientBase):
         Returns:
             PaypalApiResponse[Plan] -- Api response obj with the plan info.
         """
-        api_response = self._session.get(parse_url(self._base_url, plan_id))
+        api_response = yield self._request.get(parse_url(self._base_url, plan_id))
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
         return PaypalApiResponse.success(api_response, Plan.serialize_from_json(api_response.json()))
 
+    @api_operation
     def activate_plan(self, plan_id: str) -> PaypalApiResponse:
         """Calls the API to activate a plan
         
@@ -182,13 +240,14 @@ class PlanClient(ClientBase):
         Returns:
             PaypalApiResponse -- Response with the operation status
         """
-        api_response = self._session.post(parse_url(self._base_url, plan_id, 'activate'))
+        api_response = yield self._request.post(parse_url(self._base_url, plan_id, 'activate'))
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
         return PaypalApiResponse.success(api_response)
 
+    @api_operation
     def deactivate_plan(self, plan_id: str) -> PaypalApiResponse:
         """Calls the API to deactivate a plan
         
@@ -198,13 +257,14 @@ class PlanClient(ClientBase):
         Returns:
             PaypalApiResponse -- Response with the operation status
         """
-        api_response = self._session.post(parse_url(self._base_url, plan_id, 'deactivate'))
+        api_response = yield self._request.post(parse_url(self._base_url, plan_id, 'deactivate'))
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
         return PaypalApiResponse.success(api_response)
 
+    @api_operation
     def update_pricing(self, plan_id: str, pricing_schemes: List[UpdatePricingSchemeRequest]) -> PaypalApiResponse:
         """Calls the API to update a plan's pricing scheme
         
@@ -215,10 +275,10 @@ class PlanClient(ClientBase):
         Returns:
             PaypalApiResponse -- Response with the operation status
         """
-        body = json.dumps([ x.to_dict() for x in pricing_schemes ])
+        body = [ x.to_dict() for x in pricing_schemes ]
         url = parse_url(self._base_url, plan_id, 'update-pricing-schemes')
         
-        api_response = self._session.post(url, body)
+        api_response = yield self._request.post(url, body)
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
@@ -238,3 +298,7 @@ class PlanClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncPlanClient(AsyncClientBase, PlanClient):
+    """Asyncio plans resource group client class.
+    """
@@ -3,13 +3,12 @@
 
     Resource docs & Reference: https://developer.paypal.com/docs/api/subscriptions/v1/
 """
-import json
 
 from datetime import datetime
 from typing import Type, TypeVar, List, NamedTuple
 
 from pypaypal.entities.base import Money
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -71,6 +70,7 @@ class SubscriptionClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def create_subscription(self, subscription: Subscription, request_id: str = None, response_type: ResponseType = ResponseType.MINIMAL) -> PaypalApiResponse[Subscription]:
         """Calls the paypal API to create a subscription
         
@@ -85,19 +85,20 @@ class SubscriptionClient(ClientBase):
             PaypalApiResponse[Subscription] -- an API response object with the subscription info
         """
         url = self._base_url
-        body = json.dumps(subscription.to_dict())
+        body = subscription.to_dict()
         headers = { 'Prefer': response_type.as_header_value() }
 
         if request_id:
             headers['PayPal-Request-Id'] = request_id
         
-        api_response = self._session.post(url, body, headers = headers)
+        api_response = yield self._request.post(url, body, headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
         
         return PaypalApiResponse.success(api_response, Subscription.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def update_subscription(self, subscription_id: str, update_request: List[PatchUpdateRequest]) -> PaypalApiResponse:
         """Patch request to update a subscription. See the docs for details 
         
@@ -109,15 +110,16 @@ class SubscriptionClient(ClientBase):
             PaypalApiResponse -- Response obj with operation status
         """
         url = parse_url(self._base_url, subscription_id) 
-        body = json.dumps([ {'op': x.operation, 'value': x.value, 'path': x.path } for x in update_request ])
+        body = [ {'op': x.operation, 'value': x.value, 'path': x.path } for x in update_request ]
 
-        api_response = self._session.patch(url, body)
+        api_response = yield self._request.patch(url, body)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
         
         return PaypalApiResponse.success(api_response)
 
+    @api_operation
     def show_subscription_details(self, subscription_id: str) -> PaypalApiResponse[Subscription]:
         """Calls the paypal API to get a subscription details
         
@@ -127,7 +129,7 @@ class SubscriptionClient(ClientBase):
         Returns:
             PaypalApiResponse[Subscription] -- Api response obj with the subscription info.
         """
-        api_response = self._session.get(parse_url(self._base_url, subscription_id))
+        api_response = yield self._request.get(parse_url(self._base_url, subscription_id))
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -167,6 +169,7 @@ class SubscriptionClient(ClientBase):
         """
         return self._execute_subscription_action(subscription_id, 'cancel', reason)
 
+    @api_operation
     def capture_authorized_payment_on_subscription(
             self, subscription_id: str, note: str, amount: Money, 
             capture_type: str = 'OUTSTANDING_BALANCE', request_id: str = None
@@ -184,16 +187,16 @@ class SubscriptionClient(ClientBase):
         """
         url = parse_url(self._base_url, subscription_id, 'capture')
         
-        body = json.dumps({
+        body = {
             'note': note, 
             'amount': amount.to_dict(), 
             'capture_type': capture_type
-        })
+        }
 
         if not request_id:
-            api_response = self._session.post(url, body)
+            api_response = yield self._request.post(url, body)
         else:
-            api_response = self._session.post(url, body, headers = { 'PayPal-Request-Id': request_id })
+            api_response = yield self._request.post(url, body, headers = { 'PayPal-Request-Id': request_id })
              
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -201,6 +204,7 @@ class SubscriptionClient(ClientBase):
         j_data = api_response.json()
         return PaypalApiResponse.success(api_response, Capture.serialize_from_json(j_data) if j_data else None)
 
+    @api_operation
     def update_quantity_in_subscription(self, subscription_id: str, update: SubscriptionQuantityUpdateRequest) -> PaypalApiResponse[Subscription]:
         """Calls the paypal API to updates the quantity of the product or service in a subscription. 
            this method can also be used to to switch the plan and update the shipping_amount, 
@@ -213,10 +217,10 @@ class SubscriptionClient(ClientBase):
         Returns:
             PaypalApiResponse[Subscription] -- Response status with subscription details
         """
-        body = json.dumps(update.to_dict())
+        body = update.to_dict()
         url = parse_url(self._base_url, subscription_id, 'revise')
 
-        api_response = self._session.post(url, body)
+        api_response = yield self._request.post(url, body)
              
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -234,6 +238,7 @@ class SubscriptionClient(ClientBase):
         """
         return self._execute_subscription_action(subscription_id, 'suspend', reason)
 
+    @api_operation
     def _execute_subscription_action(self, subscription_id: str, action_name: str, reason: str = None) -> PaypalApiResponse:
         """Executes a generic and simple subscription action call to the Paypal API
         
@@ -247,23 +252,27 @@ class SubscriptionClient(ClientBase):
         Returns:
             PaypalApiResponse -- [description]
         """
-        body = json.dumps({ 'reason': reason }) if reason else None
+        body = { 'reason': reason } if reason else None
         url = parse_url(self._base_url, subscription_id, action_name)
 
-        api_response = self._session.post(url, body)
+        api_response = yield self._request.post(url, body)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
         
         return PaypalApiResponse.success(api_response)
 
-    def list_subscription_transactions(self, subscription_id: str, start_time: datetime, end_time: datetime) -> PaypalPage[SubscriptionTransaction]:
+    @api_operation
+    def list_subscription_transactions(self, subscription_id: str, start_time: datetime, end_time: datetime, lazy: bool = False) -> PaypalPage[SubscriptionTransaction]:
         """Calls the API to lists transactions for a subscription.
         
         Arguments:
             subscription_id {str} -- The subscription id
             start_time {datetime} -- transaction start time
             end_time {datetime} -- transaction end time
+
+        Keyword Arguments:
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
         
         Returns:
             PaypalPage[SubscriptionTransaction] -- Paged transaction info
@@ -272,12 +281,12 @@ class SubscriptionClient(ClientBase):
         url = parse_url(self._base_url, subscription_id, 'transactions')        
         params = { end_time.strftime(fmt), start_time.strftime(fmt) }
 
-        api_response = self._session.get(url, params)
+        api_response = yield self._request.get(url, params)
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
-        return PaypalPage.full_parse_success(api_response, SubscriptionTransaction, 'transaction')
+        return PaypalPage.full_parse_success(api_response, SubscriptionTransaction, 'transaction', lazy=lazy)
 
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> T:
@@ -292,3 +301,7 @@ class SubscriptionClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(base_url, session)
+
+class AsyncSubscriptionClient(AsyncClientBase, SubscriptionClient):
+    """Asyncio subscriptions resource group client class.
+    """
@@ -7,12 +7,18 @@
 """
 
 import json
+import queue
+import asyncio
+import threading
 
 from enum import Enum
-from datetime import datetime
-from typing import TypeVar, Set
+from datetime import datetime, timedelta
+from typing import TypeVar, Set, List, Tuple, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.errors import PageRequestError
+
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -26,10 +32,11 @@ from pypaypal.entities.base import (
     DateRange,
     AmountRange,
     ResponseType,
-    PaypalApiResponse
+    PaypalApiResponse,
+    in_context
 )
 
-from pypaypal.entities.sync import TransactionStatus, TransactionResponse
+from pypaypal.entities.sync import TransactionStatus, TransactionDetails, TransactionResponse
 
 """
     Base Resource Live URL
@@ -75,36 +82,60 @@ class PaymentInsrtumentType(Enum):
     # To query for a direct credit card transaction with a corresponding value.
     CREDITCARD = 2
 
+"""
+    Max date range allowed by the API for a single transaction query
+"""
+MAX_QUERY_WINDOW = timedelta(days=31)
+
+"""
+    Marks the end of a window export inside the export queues
+"""
+_WINDOW_DONE = object()
+
+def _format_date(date: datetime) -> str:
+    """Formats a date for the reporting API, naive dates are taken as UTC
+    """
+    offset = date.strftime('%z') if date.utcoffset() != None else 'Z'
+    return date.strftime('%Y-%m-%dT%H:%M:%S') + offset
+
+def date_windows(start: datetime, end: datetime, window: timedelta = MAX_QUERY_WINDOW) -> List[Tuple[datetime, datetime]]:
+    """Splits a date range into consecutive non overlapping windows (second precision) 
+       no larger than the allowed for a single query.
+
+    Arguments:
+        start {datetime} -- range start
+        end {datetime} -- range end
+
+    Keyword Arguments:
+        window {timedelta} -- max window size (default: {MAX_QUERY_WINDOW})
+
+    Returns:
+        List[Tuple[datetime, datetime]] -- the (start, end) windows
+    """
+    windows = []
+    window = min(window, MAX_QUERY_WINDOW)
+
+    while start <= end:
+        window_end = min(start + window, end)
+        windows.append((start, window_end))
+        start = window_end + timedelta(seconds=1)
+
+    return windows
+
 class SyncClient(ClientBase):
     """Sync (Transactio reporting) resource client
     """
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
-    
-    def list_transactions(
-        self, *, page: int = 1, page_size: int = 100,  fields: Set[TransactionField] = { TransactionField.TRANSACTION_INFO },
+
+    @staticmethod
+    def _transaction_parameters(
+        *, page: int = 1, page_size: int = 100,  fields: Set[TransactionField] = { TransactionField.TRANSACTION_INFO },
         transaction_id: str = None, transaction_type: str = None, transaction_status: TransactionStatus = None, 
         transaction_amount: AmountRange = None, date: DateRange = None, payment_instrument_type: PaymentInsrtumentType = None, 
         store_id: str = None, terminal_id: str = None, balance_affecting_records_only: bool = True
-    ) -> PaypalApiResponse[TransactionResponse]:
-        """[summary]
-        
-        Keyword Arguments:
-            page {int} -- Curent page (default: {1})
-            page_size {int} -- page size max 500 (default: {100})
-            fields {Set[TransactionField]} -- fields to include in the report (default: {{ TransactionField.TRANSACTION_INFO }})
-            transaction_id {str} -- transaction ids (note: they are not unique) (default: {None})
-            transaction_type {str} -- transaction event code (default: {None})
-            transaction_status {TransactionStatus} -- transaction status for the query (default: {None})
-            transaction_amount {AmountRange} -- transaction amount range filter (default: {None})
-            date {DateRange} -- transaction date range filter (default: {None})
-            payment_instrument_type {PaymentInsrtumentType} -- creditcard or debitcard payment (None for both) (default: {None})
-            store_id {str} --  Filters the transactions in the response by a store ID.  (default: {None})
-            terminal_id {str} -- Filters the transactions in the response by a terminal ID.  (default: {None})
-            balance_affecting_records_only {bool} --  flag to include only balance-impacting or all transactions (default: {True})
-        
-        Returns:
-            PaypalApiResponse[TransactionResponse] -- Page with all the desired transaction info
+    ) -> dict:
+        """Builds the query parameters of a transaction list request, see list_transactions
         """
         parameters = {
             'page': page, 'store_id': store_id, 'page_size': page_size,
@@ -134,13 +165,188 @@ class SyncClient(ClientBase):
                 f = TransactionField.ALL.as_parameter()
             parameters['fields'] = f
 
-        api_response = self._session.get(self._base_url, parameters)
+        return parameters
+    
+    @api_operation
+    def list_transactions(
+        self, *, page: int = 1, page_size: int = 100,  fields: Set[TransactionField] = { TransactionField.TRANSACTION_INFO },
+        transaction_id: str = None, transaction_type: str = None, transaction_status: TransactionStatus = None, 
+        transaction_amount: AmountRange = None, date: DateRange = None, payment_instrument_type: PaymentInsrtumentType = None, 
+        store_id: str = None, terminal_id: str = None, balance_affecting_records_only: bool = True
+    ) -> PaypalApiResponse[TransactionResponse]:
+        """[summary]
+        
+        Keyword Arguments:
+            page {int} -- Curent page (default: {1})
+            page_size {int} -- page size max 500 (default: {100})
+            fields {Set[TransactionField]} -- fields to include in the report (default: {{ TransactionField.TRANSACTION_INFO }})
+            transaction_id {str} -- transaction ids (note: they are not unique) (default: {None})
+            transaction_type {str} -- transaction event code (default: {None})
+            transaction_status {TransactionStatus} -- transaction status for the query (default: {None})
+            transaction_amount {AmountRange} -- transaction amount range filter (default: {None})
+            date {DateRange} -- transaction date range filter (default: {None})
+            payment_instrument_type {PaymentInsrtumentType} -- creditcard or debitcard payment (None for both) (default: {None})
+            store_id {str} --  Filters the transactions in the response by a store ID.  (default: {None})
+            terminal_id {str} -- Filters the transactions in the response by a terminal ID.  (default: {None})
+            balance_affecting_records_only {bool} --  flag to include only balance-impacting or all transactions (default: {True})
+        
+        Returns:
+            PaypalApiResponse[TransactionResponse] -- Page with all the desired transaction info
+        """
+        parameters = self._transaction_parameters(
+            page=page, page_size=page_size, fields=fields, transaction_id=transaction_id,
+            transaction_type=transaction_type, transaction_status=transaction_status,
+            transaction_amount=transaction_amount, date=date, payment_instrument_type=payment_instrument_type,
+            store_id=store_id, terminal_id=terminal_id, balance_affecting_records_only=balance_affecting_records_only
+        )
+
+        api_response = yield self._request.get(self._base_url, parameters)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
 
         return PaypalApiResponse.success(api_response, TransactionResponse.serialize_from_json(api_response.json()))
 
+    @api_operation
+    def _window_page(self, page: int, page_size: int, date: DateRange, filters: dict, raw: bool = False) -> Tuple[list, int]:
+        """Reads a single transaction page of a date window
+        
+        Arguments:
+            page {int} -- the page to be read
+            page_size {int} -- size of the pages
+            date {DateRange} -- the window date range
+            filters {dict} -- list_transactions filters
+
+        Keyword Arguments:
+            raw {bool} -- return the raw json details instead of entities (default: {False})
+
+        Raises:
+            PageRequestError: If the page can't be read
+        
+        Returns:
+            Tuple[list, int] -- the page transaction details & the total pages
+        """
+        api_response = yield self._request.get(
+            self._base_url, self._transaction_parameters(page=page, page_size=page_size, date=date, **filters)
+        )
+
+        if api_response.status_code // 100 != 2:
+            raise PageRequestError(PaypalApiResponse.error(api_response))
+
+        data = api_response.json()
+
+        if raw:
+            return data.get('transaction_details'), data.get('total_pages')
+
+        response = TransactionResponse.serialize_from_json(data)
+        return response.transaction_details, response.total_pages
+
+    def _window_pages(self, window: Tuple[datetime, datetime], page_size: int, filters: dict, raw: bool = False) -> Iterator[List[TransactionDetails]]:
+        """Reads every transaction page for a single date window
+        
+        Arguments:
+            window {Tuple[datetime, datetime]} -- the (start, end) window
+            page_size {int} -- size of the pages
+            filters {dict} -- list_transactions filters
+
+        Keyword Arguments:
+            raw {bool} -- yield the raw json details instead of entities (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[List[TransactionDetails]] -- the transaction details of every page
+        """
+        page, total_pages = 1, 1
+        date = DateRange(_format_date(window[0]), _format_date(window[1]))
+
+        while page <= total_pages:
+            details, pages = self._window_page(page, page_size, date, filters, raw)
+
+            if not details:
+                return
+
+            yield details
+            page, total_pages = page + 1, pages or 1
+
+    def export_transactions(
+            self, start: datetime, end: datetime, *, page_size: int = 500, 
+            max_workers: int = 4, window: timedelta = MAX_QUERY_WINDOW, raw: bool = False, **filters
+        ) -> Iterator[TransactionDetails]:
+        """Streams every transaction in a date range of any size. The range is split 
+           into windows the API accepts, windows are read in parallel, each one walking 
+           all of its pages, and the details are yielded as their pages arrive (windows 
+           are interleaved). Only a few pages are held in memory at once.
+        
+        Arguments:
+            start {datetime} -- range start
+            end {datetime} -- range end
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages, max 500 (default: {500})
+            max_workers {int} -- windows read at once (default: {4})
+            window {timedelta} -- max window size, up to 31 days (default: {MAX_QUERY_WINDOW})
+            raw {bool} -- yield the raw json of the details, skipping the entities build (e.g. to feed a TransactionSink) (default: {False})
+            filters -- every other list_transactions filter (fields, transaction_status, etc)
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[TransactionDetails] -- the transaction details (dicts if raw)
+        """
+        windows = date_windows(start, end, window)
+        pages = queue.Queue(maxsize=max_workers * 2)
+        cancelled = threading.Event()
+
+        def put(item):
+            while not cancelled.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def export_window(window: Tuple[datetime, datetime]):
+            if cancelled.is_set():
+                return
+
+            try:
+                for details in self._window_pages(window, page_size, filters, raw):
+                    if not put(details):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(_WINDOW_DONE)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = []
+
+        try:
+            for w in windows:
+                futures.append(executor.submit(in_context(export_window), w))
+
+            pending = len(windows)
+
+            while pending:
+                item = pages.get()
+
+                if item is _WINDOW_DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield from item
+        finally:
+            # Queued windows are dropped & the running ones stop on their next page
+            cancelled.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
     @classmethod
     def for_session(cls: T, session: PayPalSession) -> T:
         """Creates a client from a given paypal session
@@ -153,4 +359,98 @@ class SyncClient(ClientBase):
             T -- an instance of Dispute client with the right configuration by session mode
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(base_url, session)
\ No newline at end of file
+        return cls(base_url, session)
+
+class AsyncSyncClient(AsyncClientBase, SyncClient):
+    """Asyncio sync (Transactio reporting) resource client
+    """
+    async def _window_pages(self, window: Tuple[datetime, datetime], page_size: int, filters: dict, raw: bool = False):
+        """Reads every transaction page for a single date window
+        
+        Arguments:
+            window {Tuple[datetime, datetime]} -- the (start, end) window
+            page_size {int} -- size of the pages
+            filters {dict} -- list_transactions filters
+
+        Keyword Arguments:
+            raw {bool} -- yield the raw json details instead of entities (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[List[TransactionDetails]] -- the transaction details of every page
+        """
+        page, total_pages = 1, 1
+        date = DateRange(_format_date(window[0]), _format_date(window[1]))
+
+        while page <= total_pages:
+            details, pages = await self._window_page(page, page_size, date, filters, raw)
+
+            if not details:
+                return
+
+            yield details
+            page, total_pages = page + 1, pages or 1
+
+    async def export_transactions(
+            self, start: datetime, end: datetime, *, page_size: int = 500, 
+            max_workers: int = 4, window: timedelta = MAX_QUERY_WINDOW, raw: bool = False, **filters
+        ):
+        """Streams every transaction in a date range of any size. The range is split 
+           into windows the API accepts, windows are read concurrently, each one walking 
+           all of its pages, and the details are yielded as their pages arrive (windows 
+           are interleaved). Only a few pages are held in memory at once.
+        
+        Arguments:
+            start {datetime} -- range start
+            end {datetime} -- range end
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages, max 500 (default: {500})
+            max_workers {int} -- windows read at once (default: {4})
+            window {timedelta} -- max window size, up to 31 days (default: {MAX_QUERY_WINDOW})
+            raw {bool} -- yield the raw json of the details, skipping the entities build (e.g. to feed a TransactionSink) (default: {False})
+            filters -- every other list_transactions filter (fields, transaction_status, etc)
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            AsyncIterator[TransactionDetails] -- the transaction details (dicts if raw)
+        """
+        windows = date_windows(start, end, window)
+        pages = asyncio.Queue(maxsize=max_workers * 2)
+        slots = asyncio.Semaphore(max_workers)
+
+        async def export_window(window: Tuple[datetime, datetime]):
+            async with slots:
+                try:
+                    async for details in self._window_pages(window, page_size, filters, raw):
+                        await pages.put(details)
+                    await pages.put(_WINDOW_DONE)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    await pages.put(e)
+
+        tasks = [ asyncio.ensure_future(export_window(w)) for w in windows ]
+
+        try:
+            pending = len(windows)
+
+            while pending:
+                item = await pages.get()
+
+                if item is _WINDOW_DONE:
+                    pending -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    for details in item:
+                        yield details
+        finally:
+            # Producers blocked on a full queue only stop once cancelled & awaited
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -4,13 +4,12 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/tracking/v1/ 
 """
 
-import json
-from typing import Type, TypeVar, List
+from typing import Type, TypeVar, List, Iterable, Mapping, Tuple, Union
 
-from pypaypal.clients.base import ClientBase
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation
 from pypaypal.entities.base import ResponseType, PaypalApiResponse
 
-from pypaypal.entities.trackers import Tracker
+from pypaypal.entities.trackers import Tracker, TrackerBatchResponse
 
 from pypaypal.http import ( 
     parse_url,
@@ -38,8 +37,54 @@ _TRACKER_PROPERTIES = {
     'tracking_number_validated' 
 }
 
+"""
+    Tracker attributes with a name other than their property
+"""
+_TRACKER_ATTRIBUTES = { 'shipment_date': '_shipment_date', 'last_updated_time': '_last_updated_time' }
+
+"""
+    Boolean tracker properties, parsed when they come as text (e.g. csv rows)
+"""
+_BOOLEAN_TRACKER_PROPERTIES = { 'notify_buyer', 'tracking_number_validated' }
+
+"""
+    Max amount of trackers in a single trackers batch
+"""
+MAX_TRACKERS_BATCH_SIZE = 20
+
+"""
+    Tracker to be added, either the entity or a mapping with its properties (e.g. a csv.DictReader row)
+"""
+TrackerInput = Union[Tracker, Mapping[str, object]]
+
 T = TypeVar('T', bound = 'TrackersClient')
 
+def _tracker_body(tracker: TrackerInput) -> dict:
+    """Builds the request body of a tracker straight from its properties, 
+       skipping the empty ones
+    
+    Arguments:
+        tracker {TrackerInput} -- the tracker or its properties
+    
+    Returns:
+        dict -- the tracker body
+    """
+    if isinstance(tracker, Tracker):
+        values = ((k, getattr(tracker, _TRACKER_ATTRIBUTES.get(k, k), None)) for k in _TRACKER_PROPERTIES)
+    else:
+        values = ((k, tracker.get(k)) for k in _TRACKER_PROPERTIES)
+
+    body = dict()
+
+    for k, v in values:
+        if v == None or v == '':
+            continue
+        if k in _BOOLEAN_TRACKER_PROPERTIES and isinstance(v, str):
+            v = v.lower() == 'true'
+        body[k] = v
+
+    return body
+
 class TrackersClient(ClientBase):
     """Trackers resource group client class
     """
@@ -52,6 +97,7 @@ class TrackersClient(ClientBase):
         """
         super().__init__(url, session)
 
+    @api_operation
     def show_tracking_info(self, transaction_id: str, tracking_number: int, response_type: ResponseType= ResponseType.MINIMAL) -> PaypalApiResponse[Tracker]:
         """Gets the tracking info for a given tracker key
         
@@ -67,12 +113,13 @@ class TrackersClient(ClientBase):
         """     
         headers = { 'Prefer': response_type.as_header_value() } 
         url = parse_url(self._base_url, f'{transaction_id}-{tracking_number}')
-        api_response = self._session.get(url, None, headers=headers)
+        api_response = yield self._request.get(url, None, headers=headers)
         
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
         return PaypalApiResponse(False, api_response, Tracker.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def update_tracking_info(self, transaction_id: str, tracking_number: int, **kwargs) -> PaypalApiResponse[Tracker]:
         """Updates tracking info in the api
         
@@ -87,37 +134,46 @@ class TrackersClient(ClientBase):
             PaypalApiResponse[Tracker] -- Response container with the response status
         """
         url = parse_url(self._base_url, f'{transaction_id}-{tracking_number}')
-        api_response = self._session.put(url, json.dumps(kwargs))        
+        api_response = yield self._request.put(url, kwargs)        
         error = api_response.status_code != 204
 
         return PaypalApiResponse(error, api_response)
 
-    def add_trackers(self, trackers: List[Tracker], response_type: ResponseType= ResponseType.MINIMAL) -> PaypalApiResponse[Tracker]:
-        """Adds trackers to a transaction
+    def _add_trackers_request(self, trackers: Iterable[TrackerInput], request_id: str, response_type: ResponseType) -> Tuple[str, dict, dict]:
+        """Builds the url, body & headers of a trackers batch
+        """
+        url = parse_url(self._base_url, '..', 'trackers-batch')
+        headers = { 'Prefer': response_type.as_header_value() }
+
+        if request_id:
+            headers['PayPal-Request-Id'] = request_id
+
+        return url, { 'trackers': [ _tracker_body(t) for t in trackers ] }, headers
+
+    @api_operation
+    def add_trackers(
+            self, trackers: Iterable[TrackerInput], request_id: str = None, response_type: ResponseType= ResponseType.MINIMAL
+        ) -> PaypalApiResponse[TrackerBatchResponse]:
+        """Adds trackers to one or more transactions (max MAX_TRACKERS_BATCH_SIZE)
         
         Arguments:
-            trackers {List[Tracker]} -- [description]
+            trackers {Iterable[TrackerInput]} -- the trackers or mappings with their properties
         
+        Keyword Arguments:
+            request_id {str} -- request id for idempotence (default: {None})
+            response_type {ResponseType} -- response representation (default: {ResponseType.MINIMAL})
+
         Returns:
-            PaypalApiResponse[Tracker] -- [description]
+            PaypalApiResponse[TrackerBatchResponse] -- the added tracker identifiers & the errors of the rejected trackers
         """
-        body = []
-        url = parse_url(self._base_url, 'trackers-batch')
-        headers = { 'Prefer': response_type.as_header_value() }
-
-        for t in trackers:
-            b = t.to_dict()
-            b['shipment_date'] = b.pop('_shipment_date', None)
-            b['last_updated_time'] = b.pop('_last_updated_time', None)
-            self._clean_dictionary(b, _TRACKER_PROPERTIES)
-            body.append(b)
-        
-        api_response = self._session.post(url, json.dumps(body), headers = headers)
+        url, body, headers = self._add_trackers_request(trackers, request_id, response_type)
+        api_response = yield self._request.post(url, body, headers = headers)
         
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
-        return PaypalApiResponse(False, api_response, Tracker.serialize_from_json(api_response.json(), response_type))
+        return PaypalApiResponse(False, api_response, TrackerBatchResponse.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def tracking_info_by_entity(self, tracker: Tracker, response_type: ResponseType= ResponseType.MINIMAL) -> PaypalApiResponse[Tracker]:
         """Gets the tracking info for a given tracking entity
         
@@ -129,34 +185,26 @@ class TrackersClient(ClientBase):
         """
         url = tracker.read_link
         headers = { 'Prefer': response_type.as_header_value() }
-        api_response = self._execute_action_link(url, None, headers = headers)
+        api_response = yield self._action_link_request(url, None, headers = headers)
 
         if api_response.status_code != 200:
             return PaypalApiResponse(True, api_response)
         return PaypalApiResponse(False, api_response, Tracker.serialize_from_json(api_response.json(), response_type))
 
+    @api_operation
     def update_tracking_info_by_entity(self, tracker: Tracker) -> PaypalApiResponse[Tracker]:
-        """Updates tracking info in the api
+        """Updates the tracking info of a tracker entity in the api, the body is built 
+           from the entity properties (its json response isn't kept in compact mode)
         
         Arguments:
-            transaction_id {str} -- The id of the transaction
-            tracking_number {int} -- The tracking number
-
-        Keyword Arguments:
-            mappings with the fields to be updated, see the docs for the names & values.
+            tracker {Tracker} -- the tracker with its update link & the new values
         
         Returns:
             PaypalApiResponse[Tracker] -- Response container with the response status
         """
-        body = tracker.json_data
+        body = _tracker_body(tracker)
         url = tracker.update_link
-
-        for item in tracker.to_dict().items():
-            key = item.key
-            if key in body.keys():
-                body[key] = item.value
-
-        api_response = self._execute_action_link(url, body)
+        api_response = yield self._action_link_request(url, body)
         error = api_response.status_code != 204
         return PaypalApiResponse(error, api_response)
 
@@ -172,4 +220,8 @@ class TrackersClient(ClientBase):
             T -- an instance of TrackersClient with the right configuration by session mode
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(base_url, session)
\ No newline at end of file
+        return cls(base_url, session)
+
+class AsyncTrackersClient(AsyncClientBase, TrackersClient):
+    """Asyncio trackers resource group client class
+    """
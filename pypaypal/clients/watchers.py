@@ -0,0 +1,249 @@
+"""
+    Payout batch status watcher.
+
+    Tracks many payout batches at once from a single scheduler thread, each batch is polled
+    with its own adaptive backoff (the delay resets when the batch changes & grows while it doesn't)
+    and only reads the batch header unless item status changes are requested.
+"""
+
+import time
+import heapq
+import itertools
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from pypaypal.errors import PayoutWatchError
+from pypaypal.clients.payouts import PayoutClient
+from pypaypal.entities.payouts import BatchStatus, PayoutHeader, PayoutItem
+
+"""
+    Batch statuses that won't change anymore
+"""
+FINAL_BATCH_STATUSES = frozenset({ BatchStatus.SUCCESS, BatchStatus.DENIED, BatchStatus.CANCELED })
+
+"""
+    Max items per payout batch details page
+"""
+_ITEMS_PAGE_SIZE = 1000
+
+class PollBackoff(NamedTuple):
+    """Polling delays for a single batch
+    """
+    # Seconds until the first poll & after a poll with changes.
+    initial: float = 2
+    # Delay growth after a poll without changes.
+    factor: float = 2
+    # Max seconds between polls.
+    max_delay: float = 120
+    # Consecutive failed polls before giving up on a batch.
+    max_errors: int = 5
+
+    def next_delay(self, delay: float, changed: bool) -> float:
+        return self.initial if changed else min(delay * self.factor, self.max_delay)
+
+class ItemStatusChange(NamedTuple):
+    """Transaction status change of a payout item between polls
+    """
+    payout_item_id: str
+    sender_item_id: str
+    previous_status: str
+    status: str
+
+class BatchUpdate(NamedTuple):
+    """Result of a payout batch poll
+    """
+    payout_batch_id: str
+    header: PayoutHeader
+    changes: List[ItemStatusChange]
+
+    @property
+    def batch_status(self) -> BatchStatus:
+        return self.header.status_enum if self.header else None
+
+    @property
+    def is_final(self) -> bool:
+        return self.batch_status in FINAL_BATCH_STATUSES
+
+class _WatchedBatch:
+    """Polling state of a payout batch
+    """
+    def __init__(self, payout_batch_id: str, future: Future, on_update: Callable[[BatchUpdate], None], delay: float):
+        self.payout_batch_id = payout_batch_id
+        self.future = future
+        self.on_update = on_update
+        self.delay = delay
+        self.errors = 0
+        self.batch_status = None
+        self.item_statuses: Dict[str, str] = dict()
+
+class PayoutBatchWatcher:
+    """Polls many payout batches until their status is final.
+    """
+    def __init__(self, client: PayoutClient, backoff: PollBackoff = None, track_items: bool = False, max_workers: int = 4):
+        """Constructor
+
+        Arguments:
+            client {PayoutClient} -- the payouts client
+
+        Keyword Arguments:
+            backoff {PollBackoff} -- polling delays (default: {None})
+            track_items {bool} -- read the batch items on every poll to report their status changes (default: {False})
+            max_workers {int} -- max batches polled at once (default: {4})
+        """
+        self.client = client
+        self.backoff = backoff or PollBackoff()
+        self.track_items = track_items
+        self._max_workers = max_workers
+        self._executor = None
+        self._thread = None
+        self._running = False
+        self._schedule: List[Tuple[float, int, _WatchedBatch]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    def watch(self, payout_batch_id: str, on_update: Callable[[BatchUpdate], None] = None) -> Future:
+        """Starts tracking a payout batch
+
+        Arguments:
+            payout_batch_id {str} -- the batch id
+
+        Keyword Arguments:
+            on_update {Callable[[BatchUpdate], None]} -- called after every poll with changes (default: {None})
+
+        Returns:
+            Future -- resolved with the final BatchUpdate or a PayoutWatchError if the batch can't be read
+        """
+        future = Future()
+        self._enqueue(_WatchedBatch(payout_batch_id, future, on_update, self.backoff.initial), 0)
+        return future
+
+    def _enqueue(self, batch: _WatchedBatch, delay: float):
+        with self._condition:
+            heapq.heappush(self._schedule, (time.monotonic() + delay, next(self._sequence), batch))
+            self._condition.notify()
+
+    def _read_items(self, payout_batch_id: str) -> Tuple[PayoutHeader, List[PayoutItem]]:
+        header, items = None, []
+
+        for page in itertools.count(1):
+            response = self.client.show_payout_batch_details(payout_batch_id, page, _ITEMS_PAGE_SIZE, total_required=False)
+
+            if response.has_errors:
+                raise PayoutWatchError(payout_batch_id, response)
+
+            header = header or response.parsed_response.batch_header
+            page_items = response.parsed_response.items or []
+            items.extend(page_items)
+
+            if len(page_items) < _ITEMS_PAGE_SIZE:
+                return header, items
+
+    def _read(self, payout_batch_id: str) -> Tuple[PayoutHeader, List[PayoutItem]]:
+        if self.track_items:
+            return self._read_items(payout_batch_id)
+
+        response = self.client.show_payout_batch_details(payout_batch_id, 1, 1, fields='batch_header', total_required=False)
+
+        if response.has_errors:
+            raise PayoutWatchError(payout_batch_id, response)
+
+        return response.parsed_response.batch_header, []
+
+    def _changes(self, batch: _WatchedBatch, items: List[PayoutItem]) -> List[ItemStatusChange]:
+        changes = []
+
+        for item in items:
+            previous = batch.item_statuses.get(item.payout_item_id)
+
+            if previous != item.transaction_status:
+                batch.item_statuses[item.payout_item_id] = item.transaction_status
+                changes.append(ItemStatusChange(item.payout_item_id, item.sender_item_id, previous, item.transaction_status))
+
+        return changes
+
+    def _poll(self, batch: _WatchedBatch):
+        if batch.future.cancelled():
+            return
+
+        try:
+            header, items = self._read(batch.payout_batch_id)
+        except Exception as e:
+            batch.errors += 1
+
+            if batch.errors >= self.backoff.max_errors:
+                batch.future.set_exception(e)
+            else:
+                batch.delay = self.backoff.next_delay(batch.delay, False)
+                self._enqueue(batch, batch.delay)
+            return
+
+        batch.errors = 0
+        update = BatchUpdate(batch.payout_batch_id, header, self._changes(batch, items))
+        changed = bool(update.changes) or update.batch_status != batch.batch_status
+        batch.batch_status = update.batch_status
+
+        if changed and batch.on_update:
+            try:
+                batch.on_update(update)
+            except Exception:
+                # Callback errors must not stop the batch tracking
+                pass
+
+        if update.is_final:
+            batch.future.set_result(update)
+            return
+
+        batch.delay = self.backoff.next_delay(batch.delay, changed)
+        self._enqueue(batch, batch.delay)
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                while self._running and (not self._schedule or self._schedule[0][0] > time.monotonic()):
+                    self._condition.wait(self._schedule[0][0] - time.monotonic() if self._schedule else None)
+
+                if not self._running:
+                    return
+
+                _, _, batch = heapq.heappop(self._schedule)
+
+            if not batch.future.cancelled():
+                self._executor.submit(self._poll, batch)
+
+    @property
+    def watched(self) -> int:
+        """Amount of batches waiting for their next poll
+        """
+        with self._condition:
+            return len(self._schedule)
+
+    def start(self) -> 'PayoutBatchWatcher':
+        """Starts the polling thread
+        """
+        if not self._running:
+            self._running = True
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Stops polling, pending batches are left unresolved
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+
+        if self._thread:
+            self._thread.join()
+            self._executor.shutdown()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
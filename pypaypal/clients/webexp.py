@@ -4,12 +4,11 @@
     Resource docs & Reference: https://developer.paypal.com/docs/api/payment-experience/v1/#definition-presentation
 """
 
-import json
 
 from datetime import datetime
 from typing import Type, TypeVar, List
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -45,6 +44,7 @@ class WebExpClient(ClientBase):
     def __init__(self, url: str, session: PayPalSession):
         super().__init__(url, session)
 
+    @api_operation
     def create_profile(self, profile: WebExpProfile, request_id: str = None) -> PaypalApiResponse[WebExpProfile]:
         """Calls the paypal Api to create a WebExp Profile
         
@@ -58,13 +58,14 @@ class WebExpClient(ClientBase):
             PaypalApiResponse[WebExpProfile] -- An api response with the profile
         """        
         headers = {'PayPal-Request-Id': request_id} if request_id else dict()
-        api_response = self._session.post(self._base_url, json.dumps(profile.to_dict()), headers = headers)
+        api_response = yield self._request.post(self._base_url, profile.to_dict(), headers = headers)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse(True, api_response)
 
         return PaypalApiResponse(False, api_response, WebExpProfile.serialize_from_json(api_response.json()))
 
+    @api_operation
     def list_profiles(self) -> PaypalApiBulkResponse[WebExpProfile]:
         """Calls the paypal Api to get a list with the latest 20 web experience profiles 
            for a merchant or subject.
@@ -72,13 +73,14 @@ class WebExpClient(ClientBase):
         Returns:
             PaypalApiBulkResponse[WebExpProfile] -- Latest 20 profiles
         """
-        api_response = self._session.get(self._base_url)
+        api_response = yield self._request.get(self._base_url)
 
         if api_response.status_code != 200:
             return PaypalApiBulkResponse(True, api_response)
 
         return PaypalApiBulkResponse(False, api_response, [WebExpProfile.serialize_from_json(x) for x in api_response.json()])
     
+    @api_operation
     def delete_profile(self, profile_id: str) -> PaypalApiResponse:
         """Calls the paypal Api to delete a WebExp Profile
         
@@ -88,12 +90,13 @@ class WebExpClient(ClientBase):
         Returns:
             PaypalApiResponse -- An api response 
         """
-        api_response = self._session.delete(parse_url(self._base_url, profile_id))
+        api_response = yield self._request.delete(parse_url(self._base_url, profile_id))
 
         if api_response.status_code != 204:
             return PaypalApiBulkResponse(True, api_response)
         return PaypalApiBulkResponse(False, api_response)
     
+    @api_operation
     def show_profile_details(self, profile_id: str) -> PaypalApiResponse[WebExpProfile]:
         """Calls the paypal Api to delete a WebExp Profile
         
@@ -103,12 +106,13 @@ class WebExpClient(ClientBase):
         Returns:
             PaypalApiResponse[WebExpProfile] -- An api response with the profile info
         """
-        api_response = self._session.get(parse_url(self._base_url, profile_id))
+        api_response = yield self._request.get(parse_url(self._base_url, profile_id))
 
         if api_response.status_code != 200:
             return PaypalApiBulkResponse(True, api_response)
         return PaypalApiBulkResponse(False, api_response, WebExpProfile.serialize_from_json(api_response.json()))
 
+    @api_operation
     def path_update_profile(self, profile_id: str, updates: List[PatchUpdateRequest]) ->  PaypalApiResponse:
         """Calls the api to partially-update a web experience profile, by ID.
         
@@ -120,14 +124,15 @@ class WebExpClient(ClientBase):
             PaypalApiResponse -- API response status
         """
         url = parse_url(self._base_url, profile_id)
-        body = json.dumps([{ 'op': x.operation, 'path': x.path, 'value': x.value } for x in updates ])
+        body = [{ 'op': x.operation, 'path': x.path, 'value': x.value } for x in updates ]
 
-        api_response = self._session.patch(url, body)
+        api_response = yield self._request.patch(url, body)
 
         if api_response.status_code != 204:
             return PaypalApiResponse(True, api_response)
         return PaypalApiResponse(False, api_response)
 
+    @api_operation
     def fully_update_profile(self, profile_id: str, name: str, temporary: bool, flow_config: FlowConfig) -> PaypalApiResponse:
         """Calls the api to fully update a web experience profile, by ID.
         
@@ -141,8 +146,12 @@ class WebExpClient(ClientBase):
         url = parse_url(self._base_url, profile_id)
         body = WebExpProfile.create(name, temporary, flow_config)
 
-        api_response = self._session.put(url, body)
+        api_response = yield self._request.put(url, body)
 
         if api_response.status_code != 204:
             return PaypalApiResponse(True, api_response)
         return PaypalApiResponse(False, api_response)
+
+class AsyncWebExpClient(AsyncClientBase, WebExpClient):
+    """Asyncio paypal Web Expirience Profile resource group client class
+    """
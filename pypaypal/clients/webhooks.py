@@ -5,11 +5,12 @@
 """
 
 import json
+import asyncio
 
 from datetime import datetime
-from typing import TypeVar, Set, List
+from typing import TypeVar, Set, List, Iterator
 
-from pypaypal.clients.base import ClientBase, ActionLink
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation, ActionLink
 
 from pypaypal.http import ( 
     parse_url,
@@ -36,6 +37,8 @@ from pypaypal.entities.webhooks import (
     SignatureVerificationStatus
 )
 
+from pypaypal.signatures import LocalSignatureVerifier, LocalVerificationError, default_verifier
+
 """
     Base Resource Live URL
 """
@@ -93,6 +96,7 @@ class WebHookClient(ClientBase):
         return PaypalApiResponse.success(api_response, Webhook.serialize_from_json(api_response.json()))
 
     
+    @api_operation
     def create_webhook(self, url: str, event_types: List[EventType], subscribe_all: bool = False) -> PaypalApiResponse[Webhook]:
         """Calls the paypal API to create a webhook
         
@@ -103,14 +107,17 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiResponse[Webhook] -- Paypal response status with webhook object.
         """
-        body = json.dumps({
+        body = {
             'url': url, 
             'event_types': [x.to_dict() for x in event_types] if not subscribe_all else '*'
-        })
+        }
         
-        return self._process_simple_response(self._session.post(self._base_url, body))
+        api_response = yield self._request.post(self._base_url, body)
+
+        return self._process_simple_response(api_response)
 
 
+    @api_operation
     def list_webhooks(self, anchor_type: AnchorType = AnchorType.APPLICATION) -> PaypalApiBulkResponse[Webhook]:
         """Calls the paypal api to list an app webhooks
         
@@ -120,7 +127,7 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiBulkResponse[Webhook] -- Paypal response status with webhook objects.
         """
-        api_response = self._session.get(self._base_url, params = {'anchor_type': anchor_type.name})
+        api_response = yield self._request.get(self._base_url, params = {'anchor_type': anchor_type.name})
 
         if api_response.status_code//100 != 2:
             return PaypalApiBulkResponse.error(api_response)
@@ -130,6 +137,7 @@ class WebHookClient(ClientBase):
             [ Webhook.serialize_from_json(x) for x in api_response.json().get('webhooks', []) ]
         )
     
+    @api_operation
     def delete_webhook(self, webhook_id: str) -> PaypalApiResponse:
         """Calls the paypal API to delete a webhook by id.
         
@@ -139,9 +147,10 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiResponse -- Paypal response status
         """
-        api_response = self._session.delete(parse_url(self._base_url, webhook_id))
+        api_response = yield self._request.delete(parse_url(self._base_url, webhook_id))
         return PaypalApiResponse.error(api_response) if api_response.status_code//100 != 2 else PaypalApiResponse.success(api_response)
 
+    @api_operation
     def update_webhook(self, webhook_id: str, patch_request: List[PatchUpdateRequest]) -> PaypalApiResponse[Webhook]:
         """Calls the paypal API to replace webhook fields with new values
         
@@ -152,9 +161,12 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiResponse[Webhook] -- Paypal response status with webhook object. 
         """
-        body = json.dumps({'patch_request': [ x.to_dict() for x in patch_request ]})
-        return self._process_simple_response(self._session.patch(parse_url(self._base_url, webhook_id), body))
+        body = {'patch_request': [ x.to_dict() for x in patch_request ]}
+        api_response = yield self._request.patch(parse_url(self._base_url, webhook_id), body)
 
+        return self._process_simple_response(api_response)
+
+    @api_operation
     def show_webhook_details(self, webhook_id: str) -> PaypalApiResponse[Webhook]:
         """Calls the paypal API to show a webhook details
         
@@ -164,8 +176,11 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiResponse[Webhook] -- Response status with webhook object.
         """
-        return self._process_simple_response(self._session.get(parse_url(self._base_url, webhook_id)))
+        api_response = yield self._request.get(parse_url(self._base_url, webhook_id))
+
+        return self._process_simple_response(api_response)
 
+    @api_operation
     def list_event_subscriptions_for_webhook(self, webhook_id: str) -> PaypalApiBulkResponse[EventType]:
         """Calls the paypal API to list the event subscription for a Webhook
         
@@ -175,7 +190,7 @@ class WebHookClient(ClientBase):
         Returns:
             PaypalApiBulkResponse[EventType] -- Paypal response status with event type list. 
         """
-        api_response = self._session.get(parse_url(self._base_url, webhook_id, 'event-types'))
+        api_response = yield self._request.get(parse_url(self._base_url, webhook_id, 'event-types'))
 
         if api_response.status_code//100 != 2:
             return PaypalApiBulkResponse.error(api_response)
@@ -205,19 +220,59 @@ class VerifySignatureClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
 
-    def verify_webhook_signature(self, signature: WebhookSignature) -> SignatureVerificationStatus:
-        """Calls the paypal API to verify a webhook signature (it usually comes in the headers).
+    def _verification_body(self, signature: WebhookSignature, body: bytes) -> dict:
+        data = signature.to_dict()
+
+        if body != None and 'webhook_event' not in data:
+            data['webhook_event'] = self._session.codec.loads(body)
+
+        return data
+
+    def verify_webhook_signature(
+            self, signature: WebhookSignature, body: bytes = None, verifier: LocalSignatureVerifier = None
+        ) -> SignatureVerificationStatus:
+        """Verifies a webhook signature (it usually comes in the headers). If the raw request body 
+           is given the signature is checked locally with the cached PayPal certificate, 
+           the paypal API is called otherwise or if the local check isn't possible.
+        
+        Arguments:
+            signature {WebhookSignature} -- The signature
+        
+        Keyword Arguments:
+            body {bytes} -- The raw webhook request body, exactly as received (default: {None})
+            verifier {LocalSignatureVerifier} -- The local verifier, the process wide one if None (default: {None})
+
+        Returns:
+            SignatureVerificationStatus -- Verification status
+        
+        Raises:
+            ApiCallError -- If there's an error calling the API.
+        """
+        if body != None:
+            try:
+                return (verifier or default_verifier()).verify(signature, body)
+            except LocalVerificationError:
+                pass
+
+        return self._verify_with_api(signature, body)
+
+    @api_operation
+    def _verify_with_api(self, signature: WebhookSignature, body: bytes = None) -> SignatureVerificationStatus:
+        """Calls the paypal API to verify a webhook signature
         
         Arguments:
             signature {WebhookSignature} -- The signature
         
+        Keyword Arguments:
+            body {bytes} -- The raw webhook request body (default: {None})
+
         Returns:
             SignatureVerificationStatus -- Verification status
         
         Raises:
             ApiCallError -- If there's an error calling the API.
-        """        
-        api_response = self._session.post(self._base_url, json.dumps(signature.to_dict()))
+        """
+        api_response = yield self._request.post(self._base_url, self._verification_body(signature, body))
 
         if api_response.status_code//100 != 2:
             raise ApiCallError(PaypalApiResponse.error(api_response))
@@ -235,8 +290,8 @@ class VerifySignatureClient(ClientBase):
         Returns:
             T -- an instance of Dispute client with the right configuration by session mode
         """
-        base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
-        return cls(parse_url(base_url, 'verify-webhook-signature'), session)
+        base_url = LEGACY_LIVE_API_BASE_URL if session.session_mode.is_live() else LEGACY_SANDBOX_API_BASE_URL
+        return cls(parse_url(base_url, 'notifications', 'verify-webhook-signature'), session)
     
 class EventTypeClient(ClientBase):
     """Verify WebHook Signatire resource client
@@ -244,13 +299,14 @@ class EventTypeClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
 
+    @api_operation
     def list_available_events(self) -> PaypalApiBulkResponse[EventType]:
         """Calls the paypal API to get a list of available events to which any webhook can subscribe.
         
         Returns:
             PaypalApiBulkResponse[EventType] -- Paypal response status with the event type list.
         """
-        api_response = self._session.get(self._base_url)
+        api_response = yield self._request.get(self._base_url)
 
         if api_response.status_code//100 != 2:
             return PaypalApiBulkResponse.error(api_response)
@@ -280,28 +336,55 @@ class EventClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
 
+    @api_operation
     def list_event_notifications(
             self, page_size: int = 10, transaction_id: str = None, 
-            event_type: str = None, date: DateRange = None
+            event_type: str = None, date: DateRange = None, lazy: bool = False
         ) -> PaypalPage[WebhookEvent]:
-        params = { 'page_size': 10 }
+        params = { 'page_size': page_size }
 
         if transaction_id != None: 
             params['transaction_id'] = transaction_id
         if event_type != None: 
             params['event_type'] = event_type
-        if date != None and date.start_time != None: 
+        if date != None and date.start != None: 
             params['start_time'] = datetime.strftime(date.start, '%Y-%m-%dT%H:%M:%S') 
-        if date != None and date.end_time != None:
+        if date != None and date.end != None:
             params['end_time'] = datetime.strftime(date.end, '%Y-%m-%dT%H:%M:%S')
         
-        api_response = self._session.get(self._base_url, params = params)
+        api_response = yield self._request.get(self._base_url, params = params)
 
         if api_response.status_code // 100 != 2:
             return PaypalPage.error(api_response)
         
-        return PaypalPage.full_parse_success(api_response, WebhookEvent, 'events')
+        return PaypalPage.full_parse_success(api_response, WebhookEvent, 'events', lazy=lazy)
+
+    def iter_event_notifications(
+            self, page_size: int = 10, transaction_id: str = None, 
+            event_type: str = None, date: DateRange = None, prefetch: bool = False, lazy: bool = False
+        ) -> Iterator[WebhookEvent]:
+        """Lazily lists the webhook event notifications page by page
+        
+        Keyword Arguments:
+            page_size {int} -- size of the pages (default: {10})
+            transaction_id {str} -- transaction id filter (default: {None})
+            event_type {str} -- event type filter (default: {None})
+            date {DateRange} -- event date range filter (default: {None})
+            prefetch {bool} -- read the next page in background while the current one is consumed (default: {False})
+            lazy {bool} -- parse the elements as read only LazyEntity proxies (default: {False})
+
+        Raises:
+            PageRequestError: If a page can't be read
+        
+        Returns:
+            Iterator[WebhookEvent] -- The webhook events
+        """
+        return self._iter_elements(
+            lambda: self.list_event_notifications(page_size, transaction_id, event_type, date, lazy),
+            lambda link: self._page_from_link(link, 'events', WebhookEvent, lazy), prefetch
+        )
 
+    @api_operation
     def show_event_notification_details(self, event_id: str) -> PaypalApiResponse[WebhookEvent]:
         """Calls the API to get the details for a webhook event notification.
         
@@ -311,13 +394,14 @@ class EventClient(ClientBase):
         Returns:
             PaypalApiResponse[WebhookEvent] -- Paypal response status with event obj.
         """
-        api_response = self._session.get(parse_url(self._base_url, event_id))
+        api_response = yield self._request.get(parse_url(self._base_url, event_id))
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
         
         return PaypalApiResponse.success(api_response, WebhookEvent.serialize_from_json(api_response.json()))
 
+    @api_operation
     def resend_event_notification(self, event_id: str, webhooks_ids: List[str] = []) -> PaypalApiResponse[WebhookEvent]:
         """Calls the paypal API to resend notification events
         
@@ -331,7 +415,7 @@ class EventClient(ClientBase):
             PaypalApiResponse[WebhookEvent] -- A response with the webhooks events.
         """
         body = { 'webhook_ids': webhooks_ids or [] }
-        api_response = self._session.post(parse_url(self._base_url, event_id), json.dumps(body))
+        api_response = yield self._request.post(parse_url(self._base_url, event_id), body)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -358,6 +442,7 @@ class SimulateEventClient(ClientBase):
     def __init__(self, base_url: str, session: PayPalSession):
         super().__init__(base_url, session)
 
+    @api_operation
     def simulate_webhook_event(self, webhook_id: str, url: str, event_type: str, resource_version: str) -> PaypalApiResponse[WebhookEvent]:
         """Calls the paypal API to send a webhook simulation
         
@@ -379,7 +464,7 @@ class SimulateEventClient(ClientBase):
         if body['resource_version'] != None: 
             body['resource_version'] = resource_version
 
-        api_response = self._session.post(self._base_url, json.dumps(body))
+        api_response = yield self._request.post(self._base_url, body)
 
         if api_response.status_code // 100 != 2:
             return PaypalApiResponse.error(api_response)
@@ -400,3 +485,54 @@ class SimulateEventClient(ClientBase):
         """
         base_url = _LIVE_RESOURCE_BASE_URL if session.session_mode.is_live() else _SANDBOX_RESOURCE_BASE_URL
         return cls(parse_url(base_url, 'simulate-event'), session)
+
+class AsyncWebHookClient(AsyncClientBase, WebHookClient):
+    """Asyncio webHook resource client
+    """
+
+class AsyncVerifySignatureClient(AsyncClientBase, VerifySignatureClient):
+    """Asyncio verify WebHook Signatire resource client
+    """
+    async def verify_webhook_signature(
+            self, signature: WebhookSignature, body: bytes = None, verifier: LocalSignatureVerifier = None
+        ) -> SignatureVerificationStatus:
+        """Verifies a webhook signature (it usually comes in the headers). If the raw request body 
+           is given the signature is checked locally with the cached PayPal certificate, 
+           the paypal API is called otherwise or if the local check isn't possible.
+        
+        Arguments:
+            signature {WebhookSignature} -- The signature
+        
+        Keyword Arguments:
+            body {bytes} -- The raw webhook request body, exactly as received (default: {None})
+            verifier {LocalSignatureVerifier} -- The local verifier, the process wide one if None (default: {None})
+
+        Returns:
+            SignatureVerificationStatus -- Verification status
+        
+        Raises:
+            ApiCallError -- If there's an error calling the API.
+        """
+        if body != None:
+            verifier = verifier or default_verifier()
+            try:
+                if verifier.cache.get(signature.cert_url) == None:
+                    # Certificate downloads are blocking, only the first delivery pays for it
+                    await asyncio.get_event_loop().run_in_executor(None, verifier.certificate, signature.cert_url)
+                return verifier.verify(signature, body)
+            except LocalVerificationError:
+                pass
+
+        return await self._verify_with_api(signature, body)
+
+class AsyncEventTypeClient(AsyncClientBase, EventTypeClient):
+    """Asyncio verify WebHook Signatire resource client
+    """
+
+class AsyncEventClient(AsyncClientBase, EventClient):
+    """Asyncio verify WebHook Signatire resource client
+    """
+
+class AsyncSimulateEventClient(AsyncClientBase, SimulateEventClient):
+    """Asyncio verify WebHook Signatire resource client
+    """
@@ -0,0 +1,166 @@
+"""Module with the json codecs used by the sessions.
+
+   Request bodies are encoded straight to bytes & response bodies are parsed
+   at most once. The fastest installed backend is used by default:
+   orjson, then msgspec, falling back to the standard library.
+
+        pip install pypaypal[fastjson]
+"""
+import json
+
+from abc import ABC, abstractmethod
+from typing import Union
+
+try:
+    import orjson
+except ImportError: # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError: # pragma: no cover
+    msgspec = None
+
+class JsonCodec(ABC):
+    """Base class for the json codecs.
+    """
+    name = None
+
+    @abstractmethod
+    def dumps(self, obj) -> bytes:
+        """Encodes an object
+
+        Arguments:
+            obj -- a json serializable object
+
+        Returns:
+            bytes -- the utf-8 encoded json
+        """
+        pass
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]):
+        """Decodes a json document
+
+        Arguments:
+            data {Union[bytes, str]} -- the json document
+
+        Returns:
+            The decoded object
+        """
+        pass
+
+    def __repr__(self):
+        return f'{type(self).__name__}()'
+
+class StdlibCodec(JsonCodec):
+    """Codec backed by the standard library json module.
+    """
+    name = 'json'
+
+    def dumps(self, obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]):
+        return json.loads(data)
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by orjson.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires orjson, install it with: pip install orjson')
+
+    def dumps(self, obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, str]):
+        return orjson.loads(data)
+
+class MsgspecCodec(JsonCodec):
+    """Codec backed by msgspec.
+    """
+    name = 'msgspec'
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError('MsgspecCodec requires msgspec, install it with: pip install msgspec')
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]):
+        return self._decoder.decode(data)
+
+def default_codec() -> JsonCodec:
+    """Gets the fastest available codec
+
+    Returns:
+        JsonCodec -- an orjson, msgspec or standard library codec
+    """
+    if orjson:
+        return OrjsonCodec()
+    if msgspec:
+        return MsgspecCodec()
+    return StdlibCodec()
+
+def encode_body(codec: JsonCodec, body):
+    """Encodes a request body, already encoded bodies (str, bytes, forms, etc) are kept
+
+    Arguments:
+        codec {JsonCodec} -- the codec
+        body -- the request body
+
+    Returns:
+        The encoded body
+    """
+    return codec.dumps(body) if isinstance(body, (dict, list)) else body
+
+"""
+    Marks a response body not parsed yet
+"""
+_NOT_PARSED = object()
+
+class JsonResponse:
+    """Http response wrapper parsing the json body at most once.
+
+       Every other member is read from the wrapped response, the parsed
+       body is shared between every json() call so it shouldn't be modified.
+    """
+    def __init__(self, response, codec: JsonCodec):
+        """Constructor
+
+        Arguments:
+            response -- the wrapped http response
+            codec {JsonCodec} -- codec for the body
+        """
+        self._response = response
+        self._codec = codec
+        self._json = _NOT_PARSED
+
+    @property
+    def raw_response(self):
+        return self._response
+
+    def json(self, **kwargs):
+        """Parses the response body (once)
+
+        Returns:
+            The parsed json body
+        """
+        if self._json is _NOT_PARSED:
+            self._json = self._codec.loads(self._response.content)
+        return self._json
+
+    def __getattr__(self, name: str):
+        return getattr(self._response, name)
+
+    def __bool__(self):
+        return bool(self._response)
+
+    def __repr__(self):
+        return repr(self._response)
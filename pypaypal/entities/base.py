@@ -1,24 +1,221 @@
 """
     Module with serialized object representations of paypal responses
 """
-import copy
+import functools
+import threading
+
 from enum import Enum
 from datetime import datetime
+from types import MappingProxyType
+from contextlib import contextmanager
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
 from email.mime.base import MIMEBase
-from typing import Type, TypeVar, List, Generic, Dict, Iterable
-
-import dateutil.parser
+from typing import Type, TypeVar, List, Generic, Dict, Iterable, Mapping, NamedTuple, Tuple, Callable
 
 from pypaypal.http import PayPalSession
+from pypaypal.timestamps import parse_timestamp
 from pypaypal.errors import PaypalRequestError, PayPalErrorDetail
 
+try:
+    import contextvars
+except ImportError:
+    # python 3.6, settings are thread local
+    contextvars = None
+
 T = TypeVar('T', bound = 'PayPalEntity')
 
 P = TypeVar('P', bound = 'PaypalPortableAddress')
 
+"""
+    Entity attributes that are never serialized
+"""
+_INTERNAL_ATTRIBUTES = frozenset({ '_response_type', '_json_response', '_timestamps' })
+
+"""
+    Read only view of an empty json object
+"""
+_EMPTY_JSON = MappingProxyType({})
+
+class _CompactMode:
+    """Compact entities setting: a process wide default (see set_compact_mode) that 
+       compact_mode overrides for the current context (thread & asyncio task)
+    """
+    enabled = False
+    _local = contextvars.ContextVar('pypaypal_compact_mode', default=None) if contextvars else threading.local()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        value = cls._local.get() if contextvars else getattr(cls._local, 'value', None)
+        return cls.enabled if value == None else value
+
+    @classmethod
+    def override(cls, value: bool):
+        if contextvars:
+            return cls._local.set(value)
+
+        previous = getattr(cls._local, 'value', None)
+        cls._local.value = value
+        return previous
+
+    @classmethod
+    def restore(cls, token):
+        if contextvars:
+            cls._local.reset(token)
+        else:
+            cls._local.value = token
+
+def set_compact_mode(enabled: bool = True):
+    """Enables or disables the compact entities mode for the whole process. 
+       Entities built in compact mode don't retain their raw json response 
+       (json_data is empty) so it can be freed right after parsing, 
+       useful to hold large result sets in memory.
+
+    Keyword Arguments:
+        enabled {bool} -- the mode flag (default: {True})
+    """
+    _CompactMode.enabled = enabled
+
+@contextmanager
+def compact_mode(enabled: bool = True):
+    """Context manager enabling (or disabling) the compact entities mode only for the 
+       current thread or asyncio task, other requests keep the process setting. 
+       The client thread pools (page prefetch & fan out, exports, bulk executors) inherit it.
+
+    Keyword Arguments:
+        enabled {bool} -- the mode flag (default: {True})
+    """
+    token = _CompactMode.override(enabled)
+    try:
+        yield
+    finally:
+        _CompactMode.restore(token)
+
+def in_context(function: Callable) -> Callable:
+    """Binds a function to a copy of the current context, so the settings of the 
+       caller (e.g. compact_mode) apply when it's run by a worker thread. 
+       Every call to be submitted needs its own copy.
+
+    Arguments:
+        function {Callable} -- the function
+
+    Returns:
+        Callable -- the function bound to the context
+    """
+    if contextvars == None:
+        return function
+    return functools.partial(contextvars.copy_context().run, function)
+
+def _compact_init(init: Callable) -> Callable:
+    """Wraps an entity constructor releasing the raw json once 
+       the outermost constructor is done, if compact mode is enabled
+    """
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+
+        if _CompactMode.is_enabled() and type(self).__init__ is __init__:
+            self._json_response = _EMPTY_JSON
+
+    return __init__
+
+"""
+    Serializable slot attributes by entity class
+"""
+_SLOTS = dict()
+
+def _slot_names(cls: type) -> Tuple[str]:
+    slots = _SLOTS.get(cls)
+
+    if slots is None:
+        declared = [ c.__dict__.get('__slots__', ()) for c in reversed(cls.__mro__) ]
+        slots = _SLOTS[cls] = tuple(
+            x for d in declared for x in ((d,) if isinstance(d, str) else d)
+            if x not in _INTERNAL_ATTRIBUTES and x not in ('__dict__', '__weakref__')
+        )
+
+    return slots
+
+def _identity(value):
+    return value
+
+def _encode_entity(value: 'PayPalEntity'):
+    return value.to_dict()
+
+def _encode_mapping(value: dict) -> dict:
+    return { k: _to_json_value(v) for k,v in value.items() }
+
+def _encode_iterable(value: Iterable) -> list:
+    return [ _to_json_value(x) for x in value ]
+
+"""
+    Json encoders by attribute value type, filled on first use of each type
+"""
+_ENCODERS = { type(None): _identity, str: _identity, bytes: _identity, int: _identity, float: _identity, bool: _identity }
+
+def _encoder(value_type: type):
+    """Resolves (once per type) the json encoder for an attribute value type
+    """
+    if issubclass(value_type, PayPalEntity):
+        encoder = _encode_entity
+    elif issubclass(value_type, (str, bytes, int, float)):
+        encoder = _identity
+    elif issubclass(value_type, dict):
+        encoder = _encode_mapping
+    elif issubclass(value_type, Iterable):
+        encoder = _encode_iterable
+    else:
+        encoder = _identity
+
+    _ENCODERS[value_type] = encoder
+    return encoder
+
+def _to_json_value(value):
+    """Converts an entity attribute value into its json representation, 
+       containers are rebuilt so the result never shares mutable state with the entity
+    """
+    encoder = _ENCODERS.get(type(value)) or _encoder(type(value))
+    return encoder(value)
+
+"""
+    Shared placeholder for entities without serializable child types
+"""
+_NO_TYPES = MappingProxyType({})
+
+"""
+    Compiled json decoders by entity class, see PayPalEntity._build_args
+"""
+_DECODERS = dict()
+
+class _Decoder(NamedTuple):
+    """Child types decoder compiled for an entity class
+    """
+    entity_types: Dict[str, type]
+    array_types: Dict[str, type]
+    # Decoding function by json key, array keys map to (function, True)
+    converters: Dict[str, Tuple[Callable[[dict], 'PayPalEntity'], bool]]
+
+    @classmethod
+    def compile(cls, entity_types: Dict[str, type], array_types: Dict[str, type]) -> '_Decoder':
+        converters = { k: (v.serialize_from_json, False) for k,v in entity_types.items() }
+        converters.update({ k: (v.serialize_from_json, True) for k,v in array_types.items() })
+        return cls(entity_types, array_types, converters)
+
+    def decode(self, json_data: dict) -> dict:
+        args = dict(json_data)
+
+        for k in self.converters.keys() & json_data.keys():
+            decode, is_array = self.converters[k]
+            v = json_data[k]
+
+            if is_array:
+                args[k] = [ decode(x) for x in v ]
+            elif v:
+                args[k] = decode(v)
+
+        return args
+
 class ResponseType(Enum):
     MINIMAL = 1
     REPRESENTATION = 2
@@ -79,30 +276,86 @@ class AppCtxLandingPage(Enum):
 
 class PayPalEntity(ABC):
     """
-        Base class with common properties for serialized paypal entities
+        Base class with common properties for serialized paypal entities.
+
+        High volume entities declare __slots__ to skip the per instance dict, 
+        subclasses without them keep a regular instance dict.
     """
+    __slots__ = ('_response_type', '_json_response', '_timestamps', '__weakref__')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if '__init__' in cls.__dict__:
+            cls.__init__ = _compact_init(cls.__dict__['__init__'])
+
+    def _attributes(self) -> Iterable[Tuple[str, object]]:
+        """Instance attributes, both slots & instance dict ones
+        """
+        for k in _slot_names(type(self)):
+            yield k, getattr(self, k, None)
+
+        attributes = getattr(self, '__dict__', None)
+
+        if attributes:
+            yield from attributes.items()
+
     def __init__(self, json_response: dict= dict(), response_type: ResponseType = ResponseType.MINIMAL):
         self._response_type = response_type
         self._json_response = json_response
 
+    def _timestamp(self, attribute: str) -> datetime:
+        """Parses a timestamp attribute once per value, the parsed
+           timestamp is kept until the attribute is reassigned
+
+        Arguments:
+            attribute {str} -- the attribute holding the timestamp text
+
+        Returns:
+            datetime -- the parsed timestamp, None if missing or invalid
+        """
+        value = getattr(self, attribute)
+
+        if not value:
+            return None
+
+        timestamps = getattr(self, '_timestamps', None)
+
+        if timestamps is None:
+            timestamps = self._timestamps = dict()
+
+        cached = timestamps.get(attribute)
+
+        if cached is None or cached[0] != value:
+            try:
+                cached = timestamps[attribute] = (value, parse_timestamp(value))
+            except (ValueError, TypeError, OverflowError):
+                cached = timestamps[attribute] = (value, None)
+
+        return cached[1]
+
     @property
-    def json_data(self) -> dict:
+    def json_data(self) -> Mapping:
         """Getter for this instance private json data
         
         Returns:
-            dict -- A deep copy of the instance json attribute
+            Mapping -- A read only view of the instance json attribute (copy it with dict() to make changes)
         """
-        return copy.deepcopy(self._json_response) if self._json_response else dict()
+        return MappingProxyType(self._json_response) if self._json_response else _EMPTY_JSON
 
     def to_dict(self) -> dict:
-        d = copy.deepcopy(self.__dict__)
-        pp_entity_props = { k : v.to_dict() for k,v in d.items() if isinstance(v, PayPalEntity) }
-        
-        for k,v in d.items():
-            if isinstance(v, Iterable) and not isinstance(v, str):
-                d[k] = [ x.to_dict() if isinstance(x, PayPalEntity) else x for x in v ]
+        d = dict()
+
+        for k,v in self._attributes():
+            if v is None or k in _INTERNAL_ATTRIBUTES:
+                continue
 
-        return { k : v for k,v in { **d, **pp_entity_props }.items() if v != None and v != [] and k not in {'_response_type', '_json_response'} }
+            v = _to_json_value(v)
+
+            if v != []:
+                d[k] = v
+
+        return d
 
     @classmethod
     def _build_args(cls, json_data: dict, entity_types: Dict[str, T] = dict(), array_types: Dict[str, Iterable[T]] = dict()) -> dict:
@@ -118,14 +371,14 @@ class PayPalEntity(ABC):
         Returns:
             dict -- An array with the arguments for serialization.
         """
-        return {
-            # Primitives
-            **json_data,
-            # Serialized types
-            **{ k : entity_types[k].serialize_from_json(v) for k,v in json_data.items() if k in entity_types.keys() and v },
-            # Serilized type arrays
-            **{ k : [array_types[k].serialize_from_json(v) for v in json_data[k]] for k in json_data.keys() if k in array_types }
-        }
+        entity_types, array_types = entity_types or _NO_TYPES, array_types or _NO_TYPES
+        decoder = _DECODERS.get(cls)
+
+        # Compiled once per class, the type mappings are class constants
+        if decoder == None or decoder.entity_types is not entity_types or decoder.array_types is not array_types:
+            decoder = _DECODERS[cls] = _Decoder.compile(entity_types, array_types)
+
+        return decoder.decode(json_data)
 
     @classmethod
     def instance_from_dict(cls: Type[T], dictionary: dict) -> T:
@@ -158,6 +411,7 @@ class PayPalEntity(ABC):
 class ActionLink(PayPalEntity):
     """Wraping class for entities HATEOAS action links 
     """
+    __slots__ = ('rel', 'href', '_method')
 
     def __init__(self, href: str, rel: str, method: str, **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
@@ -188,6 +442,155 @@ class ActionLink(PayPalEntity):
         """
         return cls(json_data['href'], json_data['rel'], json_data['method'], json_data = json_data, response_type = response_type)
 
+class _LazyPlan(NamedTuple):
+    """Attributes of an entity class that can be read without a full parse
+    """
+    # json keys assigned as they are to the attribute with the same name
+    direct: frozenset
+    # entity class & array flag by json key of the child entity attributes
+    children: Dict[str, Tuple[type, bool]]
+
+"""
+    Lazy parsing plans by entity class, derived from the first fully parsed instance
+"""
+_LAZY_PLANS = dict()
+
+_JSON_SCALARS = (str, int, float, bool)
+
+def _is_child_entity(entity_class: type, json_data: dict, entity: PayPalEntity) -> bool:
+    try:
+        return entity_class.serialize_from_json(json_data).to_dict() == entity.to_dict()
+    except Exception:
+        return False
+
+def _lazy_plan(entity: PayPalEntity, json_data: dict) -> _LazyPlan:
+    """Compares a fully parsed entity with its json to find the attributes 
+       that can be served straight from the json or decoding just a child
+    """
+    attributes = dict(entity._attributes())
+    direct, children = set(), dict()
+
+    for k,v in json_data.items():
+        attr = attributes.get(k)
+
+        if attr is None:
+            continue
+        if isinstance(v, _JSON_SCALARS) and attr is v:
+            direct.add(k)
+        elif isinstance(v, dict) and isinstance(attr, PayPalEntity) and _is_child_entity(type(attr), v, attr):
+            children[k] = (type(attr), False)
+        elif isinstance(v, list) and v and isinstance(attr, list) and len(attr) == len(v):
+            child_class = type(attr[0])
+            if issubclass(child_class, PayPalEntity) and all(type(x) is child_class and _is_child_entity(child_class, j, x) for x,j in zip(attr, v)):
+                children[k] = (child_class, True)
+
+    return _LazyPlan(frozenset(direct), children)
+
+class LazyEntity(Generic[T]):
+    """Read only proxy of an entity that parses its json on demand.
+
+        Plain attributes are read straight from the json and child entities 
+        (amounts, links, etc) are decoded on first access & cached, anything 
+        else (properties, methods, renamed attributes) parses the full entity 
+        once. What can be served without a full parse is learned per entity 
+        class from the first instance fully parsed, so the attribute values are 
+        the same an eagerly parsed entity would have.
+
+        Proxies are registered as virtual PayPalEntity subclasses so code 
+        dispatching on the entity base class (json encoding, sinks) handles 
+        them like eager entities, their entity_class tells the proxied type.
+    """
+    __slots__ = ('_entity_class', '_json_response', '_response_type', '_entity', '_values')
+
+    def __init__(self, entity_class: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL):
+        """Constructor
+
+        Arguments:
+            entity_class {Type[T]} -- the proxied entity class
+            json_data {dict} -- the entity json
+
+        Keyword Arguments:
+            response_type {ResponseType} -- the response type (default: {ResponseType.MINIMAL})
+        """
+        self._entity_class = entity_class
+        self._json_response = json_data
+        self._response_type = response_type
+        self._entity = None
+        self._values = dict()
+
+    @property
+    def entity_class(self) -> Type[T]:
+        return self._entity_class
+
+    @property
+    def json_data(self) -> Mapping:
+        return MappingProxyType(self._json_response)
+
+    def materialize(self) -> T:
+        """Fully parses the proxied entity (once)
+
+        Returns:
+            T -- the entity
+        """
+        if self._entity is None:
+            self._entity = self._entity_class.serialize_from_json(self._json_response, self._response_type)
+
+            if self._entity_class not in _LAZY_PLANS:
+                _LAZY_PLANS[self._entity_class] = _lazy_plan(self._entity, self._json_response)
+
+        return self._entity
+
+    def to_dict(self) -> dict:
+        return self.materialize().to_dict()
+
+    def __getattr__(self, name: str):
+        plan = _LAZY_PLANS.get(self._entity_class)
+
+        if self._entity is not None or plan is None:
+            return getattr(self.materialize(), name)
+
+        if name in self._values:
+            return self._values[name]
+
+        value = self._json_response.get(name)
+
+        if name in plan.direct and isinstance(value, _JSON_SCALARS):
+            return value
+
+        child = plan.children.get(name)
+
+        if child and value:
+            child_class, is_array = child
+            value = [ child_class.serialize_from_json(x) for x in value ] if is_array else child_class.serialize_from_json(value)
+            self._values[name] = value
+            return value
+
+        return getattr(self.materialize(), name)
+
+    def __repr__(self) -> str:
+        return f'LazyEntity({self._entity_class.__name__})'
+
+PayPalEntity.register(LazyEntity)
+
+def parse_entities(entity_class: Type[T], elements: List[dict], response_type: ResponseType = ResponseType.MINIMAL, lazy: bool = False) -> List[T]:
+    """Parses a list of entity jsons, eagerly or as read only LazyEntity proxies
+
+    Arguments:
+        entity_class {Type[T]} -- the entity class
+        elements {List[dict]} -- the entity jsons
+
+    Keyword Arguments:
+        response_type {ResponseType} -- the response type (default: {ResponseType.MINIMAL})
+        lazy {bool} -- parse lazily, the proxies are read only (default: {False})
+
+    Returns:
+        List[T] -- the entities or their lazy proxies
+    """
+    if lazy:
+        return [ LazyEntity(entity_class, x, response_type) for x in elements ]
+
+    return [ entity_class.serialize_from_json(x, response_type) for x in elements ]
+
 class PaypalApiResponse(Generic[T]):
     """Response wrapper for api responses
     """
@@ -276,7 +679,7 @@ class PaypalPage(Generic[T]):
             PayPalErrorDetail -- Error details if exists else None
         """
         data = self._raw_response.json()
-        return PayPalErrorDetail.serialize_from_json(data) if self.error and data else None
+        return PayPalErrorDetail.serialize_from_json(data) if self.errors and data else None
 
     @property
     def next_page_link(self) -> ActionLink:
@@ -318,17 +721,19 @@ class PaypalPage(Generic[T]):
         return cls(True, api_response, total_items, total_pages, elements, links)
 
     @classmethod
-    def full_parse_success(cls, api_response, entity_class: Type[T], response_entity_key: str, response_type: ResponseType = ResponseType.MINIMAL) -> 'PaypalPage':
-        """Fully parses a successful api response to return a page
+    def full_parse_success(cls, api_response, entity_class: Type[T], response_entity_key: str, response_type: ResponseType = ResponseType.MINIMAL, lazy: bool = False) -> 'PaypalPage':
+        """Fully parses a successful api response to return a page, 
+           the elements are LazyEntity proxies if lazy (see parse_entities)
         """
         j_data = api_response.json()
         links = [ ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in j_data.get('links', []) ]
-        elements = [ entity_class.serialize_from_json(x, response_type) for x in j_data.get(response_entity_key, [])]
+        elements = parse_entities(entity_class, j_data.get(response_entity_key, []), response_type, lazy)
         return cls(False, api_response, j_data.get('total_items'), j_data.get('total_pages'), elements, links)
 
 class Money(PayPalEntity):
     """Amount object definition for paypal request/responses
     """
+    __slots__ = ('value', 'currency_code')
 
     def __init__(self, currency_code: str, value: str, **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
@@ -337,7 +742,9 @@ class Money(PayPalEntity):
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        return cls(json_data['currency_code'], json_data['value'], json_response= json_data, response_type = response_type)
+        # Payouts amounts use 'currency' instead of 'currency_code'
+        currency_code = json_data['currency_code'] if 'currency_code' in json_data else json_data.get('currency')
+        return cls(currency_code, json_data['value'], json_response= json_data, response_type = response_type)
 
 class PaypalMerchant(PayPalEntity):
     """Merchant object representation
@@ -374,10 +781,7 @@ class PaypalMessage(PayPalEntity):
 
     @property
     def time_posted(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._time_posted) if self._time_posted else None
-        except:
-            return None
+        return self._timestamp('_time_posted')
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
@@ -514,6 +918,7 @@ class PatchUpdateRequest:
 class PaypalName(PayPalEntity):
     """Name object representation
     """
+    __slots__ = ('surname', 'given_name', 'prefix', 'suffix', 'full_name', 'middle_name')
 
     def __init__(self, given_name: str, surname: str,  **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
@@ -533,6 +938,7 @@ class PaypalName(PayPalEntity):
 class PaypalPhoneDetail(PayPalEntity):
     """Phone detail object representation
     """
+    __slots__ = ('country_code', 'national_number', 'phone_type', 'extension_number')
 
     def __init__(self, country_code: str, national_number: str, **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
@@ -655,10 +1061,7 @@ class Item(PayPalEntity):
 
     @property
     def item_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._item_date) if self._item_date else None
-        except:
-            return None
+        return self._timestamp('_item_date')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
@@ -6,8 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import (
     T, 
     Money, 
@@ -167,10 +165,7 @@ class DisputeTransaction(PayPalEntity):
     
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
@@ -343,17 +338,11 @@ class Dispute(PayPalEntity):
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def read_link(self) -> ActionLink:
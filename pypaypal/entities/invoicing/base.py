@@ -4,8 +4,6 @@
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import ( 
     T, 
     Tax,
@@ -32,17 +30,11 @@ class MetaData(PayPalEntity):
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def last_updated_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._last_updated_time) if self._last_updated_time else None
-        except:
-            return None
+        return self._timestamp('_last_updated_time')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
@@ -140,10 +132,7 @@ class FileReference(PayPalEntity):
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
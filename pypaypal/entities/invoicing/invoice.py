@@ -5,8 +5,6 @@
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import ( 
     T, 
     Item,
@@ -42,10 +40,7 @@ class InvoicePaymentTerm(PayPalEntity):
     
     @property
     def due_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._due_date) if self._due_date else None
-        except:
-            return None
+        return self._timestamp('_due_date')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
@@ -85,10 +80,7 @@ class InvoiceDetail(PayPalEntity):
 
     @property
     def invoice_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._invoice_date) if self._invoice_date else None
-        except:
-            return None
+        return self._timestamp('_invoice_date')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
@@ -168,10 +160,7 @@ class PaymentDetail(PayPalEntity):
 
     @property
     def payment_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._payment_date) if self._payment_date else None
-        except:
-            return None
+        return self._timestamp('_payment_date')
 
     def to_dict(self) -> dict:
         ret = super().to_dict()
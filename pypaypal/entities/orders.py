@@ -6,8 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import ( 
     T, 
     Money,
@@ -454,17 +452,11 @@ class Order(PayPalEntity):
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return datetime.strptime(self._create_time, '%Y-%m-%d') if self._create_time != None else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return datetime.strptime(self._update_time, '%Y-%m-%d') if self._update_time != None else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def read_link(self) -> ActionLink:
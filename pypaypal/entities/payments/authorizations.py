@@ -6,8 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import (
     T,
     Money,
@@ -75,24 +73,15 @@ class Authorization(PayPalEntity):
    
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def expiration_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._expiration_time) if self._expiration_time else None
-        except:
-            return None
+        return self._timestamp('_expiration_time')
 
     @property
     def Status_enum(self) -> AuthorizationStatus:
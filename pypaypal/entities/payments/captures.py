@@ -5,8 +5,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import (
     T,
     Money,
@@ -132,17 +130,11 @@ class Capture(PayPalEntity):
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def Status_enum(self) -> CaptureStatusDetailReason:
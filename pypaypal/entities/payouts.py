@@ -6,7 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
 from pypaypal.errors import PayPalErrorDetail
 
 from pypaypal.entities.base import ( 
@@ -156,16 +155,13 @@ class PayoutHeader(PayPalEntity):
     @property
     def status_enum(self) -> BatchStatus:
         try:
-            return BatchStatus[self.status] if self.status else None
+            return BatchStatus[self.batch_status] if self.batch_status else None
         except:
             return None
 
     @property
     def time_created(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._time_created) if self._time_created else None
-        except:
-            return None
+        return self._timestamp('_time_created')
     
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
@@ -184,6 +180,10 @@ class PayoutHeader(PayPalEntity):
 class PayoutItemDetail(PayPalEntity):
     """Payout item detail object representation
     """
+    __slots__ = (
+        'note', 'amount', 'receiver', 'recipient_type', 'sender_item_id', 'recipient_name',
+        'recipient_wallet'
+    )
 
     def __init__(
         self, recipient_type: str, amount: Currency, note: str, 
@@ -255,6 +255,12 @@ class CurrencyConversion(PayPalEntity):
 class PayoutItem(PayPalEntity):
     """Payout item object representation
     """
+    __slots__ = (
+        'note', 'errors', 'amount', 'receiver', 'activity_id', 'payout_item', 'recipient_type',
+        'payout_item_id', 'transaction_id', 'sender_item_id', 'payout_item_fee', 'payout_batch_id',
+        'sender_batch_id', 'recipient_wallet', 'transaction_status', 'currency_conversion',
+        'alternate_notification_method', '_time_created', 'links'
+    )
 
     def __init__(
         self, payout_item_id: str, transaction_id: str, activity_id: str, 
@@ -285,10 +291,7 @@ class PayoutItem(PayPalEntity):
 
     @property
     def time_created(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._time_created) if self._time_created else None
-        except:
-            return None
+        return self._timestamp('_time_created')
     
     @classmethod
     def create(
@@ -356,7 +359,7 @@ class PagedPayout(PayPalEntity):
         if 'batch_header' in json_data.keys():
             batch_header = PayoutHeader.serialize_from_json(json_data['batch_header'], response_type)
         if 'items' in json_data.keys():
-            items = [ PayoutItem.serialize_from_json(json_data[x]) for x in json_data['items'] ]
+            items = [ PayoutItem.serialize_from_json(x, response_type) for x in json_data['items'] ]
 
         return cls(batch_header, items, json_response = json_data, response_type = response_type)
     
\ No newline at end of file
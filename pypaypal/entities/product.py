@@ -6,7 +6,6 @@ from enum import Enum
 from typing import Type
 from datetime import datetime
 
-import dateutil.parser
 from pypaypal.entities.base import T, PayPalEntity, ResponseType, ActionLink, PatchUpdateRequest
 
 class ProductType(Enum):
@@ -51,17 +50,11 @@ class Product(PayPalEntity):
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def read_link(self) -> ActionLink:
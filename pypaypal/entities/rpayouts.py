@@ -6,8 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import ( 
     T, 
     Money,
@@ -242,12 +240,21 @@ class ReferencedPayoutResponse(ReferencedPayoutCall):
         """
         return next(filter(lambda x: x.rel == 'self', self.links), None)
 
+    @property
+    def next_page_link(self) -> ActionLink:
+        """Retrieves a link to read the next page of items.
+        
+        Returns:
+            ActionLink -- The link for requesting the information to the API.
+        """
+        return next(filter(lambda x: x.rel == 'next', self.links), None)
+
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
         payout_directive, referenced_payouts  = None,  []
 
         if 'payout_directive'  in json_data.keys():
-            payout_directive = PayoutDirective.serialize_from_json(payout_directive, response_type)
+            payout_directive = PayoutDirective.serialize_from_json(json_data['payout_directive'], response_type)
         if 'referenced_payouts' in json_data.keys():
             referenced_payouts = [ReferencedPayoutsItem.serialize_from_json(x, response_type) for x in json_data['referenced_payouts']]
         
@@ -2,8 +2,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import (
     T, 
     Money, 
@@ -189,10 +187,7 @@ class LastPaymentDetails(PayPalEntity):
 
     @property
     def time_as_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self.time) if self.time else None
-        except:
-            return None
+        return self._timestamp('time')
 
     @classmethod
     def create(cls, *, amount: Money, time: str) -> 'LastPaymentDetails':
@@ -260,31 +255,19 @@ class Subscription(PayPalEntity):
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @property
     def start_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._start_time) if self._start_time else None
-        except:
-            return None
+        return self._timestamp('_start_time')
 
     @property
     def status_update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._status_update_time) if self._status_update_time else None
-        except:
-            return None
+        return self._timestamp('_status_update_time')
 
     @property
     def status_enum(self) -> SubscriptionStatus:
@@ -394,10 +377,7 @@ class SubscriptionTransaction(PayPalEntity):
 
     @property
     def time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._time) if self._time else None
-        except:
-            return None
+        return self._timestamp('_time')
 
     def to_dict(self) -> dict:
         r = super().to_dict()
@@ -1,21 +1,32 @@
 """
     Module with all Paypal Sync (transactions) related entities 
 """
+import csv
+import json
+
 from enum import Enum
+from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import NamedTuple, Type, List
+from typing import NamedTuple, Type, List, Dict, Tuple, Iterable, Mapping, Union, Callable
 
-import dateutil.parser
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError: # pragma: no cover
+    pyarrow = None
 
+from pypaypal.timestamps import parse_timestamps
 from pypaypal.entities.base import (
     T,
     Money,
     PaypalName,
     ActionLink,
+    LazyEntity,
     ResponseType,
     PayPalEntity,
     PaypalPhoneDetail,
-    PaypalPortableAddress
+    PaypalPortableAddress,
+    _EMPTY_JSON
 )
 
 # Transaction statuses string definitions
@@ -306,6 +317,16 @@ class PayerStatusProperty(Enum):
 class TransactionInfo(PayPalEntity):
     """Transaction info object representation
     """
+    __slots__ = (
+        'fee_amount', 'tip_amount', 'invoice_id', 'credit_term', 'other_amount', 'custom_field',
+        'ending_balance', 'transaction_id', 'discount_amount', 'shipping_amount', 'insurance_amount',
+        'sales_tax_amount', 'transaction_note', 'bank_reference_id', 'paypal_account_id', 'available_balance',
+        'transaction_amount', 'transaction_status', 'transaction_subject', 'paypal_reference_id',
+        'shipping_tax_amount', 'payment_tracking_id', 'payment_method_type', 'protection_eligibility',
+        'transaction_event_code', 'credit_promotional_fee', 'annual_percentage_rate',
+        'paypal_reference_id_type', 'shipping_discount_amount', 'credit_transactional_fee',
+        '_transaction_updated_date', '_transaction_initiation_date'
+    )
 
     _MONEY_TYPES = {
         'transaction_amount', 'fee_amount', 'discount_amount', 'insurance_amount',
@@ -314,6 +335,8 @@ class TransactionInfo(PayPalEntity):
         'available_balance', 'credit_transactional_fee', 'credit_promotional_fee'
     }
 
+    _ENTITY_TYPES = { k: Money for k in _MONEY_TYPES }
+
     def __init__(
         self, paypal_account_id: str = None, transaction_id: str = None,
         paypal_reference_id: str = None, paypal_reference_id_type: str = None, 
@@ -404,26 +427,24 @@ class TransactionInfo(PayPalEntity):
 
     @property
     def transaction_updated_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._transaction_updated_date) if self._transaction_updated_date else None
-        except:
-            return None
+        return self._timestamp('_transaction_updated_date')
 
     @property
     def transaction_initiation_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._transaction_initiation_date) if self._transaction_initiation_date else None
-        except:
-            return None
+        return self._timestamp('_transaction_initiation_date')
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        args = {**json_data , **{ k : Money.serialize_from_json(v) for k, v in json_data.items() if k in cls._MONEY_TYPES }}
+        args = super()._build_args(json_data, cls._ENTITY_TYPES)
         return cls(**args, json_response = json_data, response_type = response_type)
 
 class PayerInfo(PayPalEntity):
     """Payer info object representation
     """
+    __slots__ = (
+        'address', 'payer_name', 'account_id', 'country_code', 'payer_status', 'phone_number',
+        'email_address', 'address_status'
+    )
     
     _PAYPAL_ENTITY_TYPES = { 'payer_name': PaypalName, 'address': PaypalPortableAddress, 'phone_number': PaypalPhoneDetail }
 
@@ -469,8 +490,7 @@ class PayerInfo(PayPalEntity):
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        special_types = { k : cls._PAYPAL_ENTITY_TYPES[k].serialize_from_json(v) for k,v in json_data.items() if k in cls._PAYPAL_ENTITY_TYPES.keys() }
-        args = { **json_data, **special_types }
+        args = super()._build_args(json_data, cls._PAYPAL_ENTITY_TYPES)
         return cls(**args, json_response = json_data, response_type = response_type)
 
 class ShippingInfo(PayPalEntity):
@@ -498,6 +518,7 @@ class ShippingInfo(PayPalEntity):
 class TaxAmount(PayPalEntity):
     """Tax amount object representation.
     """
+    __slots__ = ('tax_amount',)
 
     def __init__(self, tax_amount: Money, **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
@@ -523,6 +544,12 @@ class CheckoutOption(PaypalName):
 class ItemDetail(PayPalEntity):
     """Item detail object representation.
     """
+    __slots__ = (
+        'item_code', 'item_name', 'item_description', 'item_options', 'item_quantity', 'item_unit_price',
+        'item_amount', 'discount_amount', 'adjustment_amount', 'gift_wrap_amount', 'tax_percentage',
+        'tax_amounts', 'basic_shipping_amount', 'extra_shipping_amount', 'handling_amount',
+        'insurance_amount', 'total_item_amount', 'invoice_number', 'checkout_options'
+    )
 
     _MONEY_TYPES = {
         'item_unit_price', 'item_amount', 'discount_amount', 'adjustment_amount', 
@@ -530,6 +557,8 @@ class ItemDetail(PayPalEntity):
         'handling_amount', 'insurance_amount', 'total_item_amount'
     }
 
+    _ENTITY_TYPES = { k: Money for k in _MONEY_TYPES }
+
     _PAYPAL_TYPE_ARRAYS = {
         'tax_amounts': TaxAmount,
         'checkout_options': CheckoutOption
@@ -567,20 +596,15 @@ class ItemDetail(PayPalEntity):
         
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        args = {
-            # Regular (primitive) arguments
-            **json_data,
-            # Serialized Money arguments
-            **{ k : Money.serialize_from_json(v) for k, v in json_data.items() if k in cls._MONEY_TYPES },
-            # Serialized array arguments
-            **{ k : [cls._PAYPAL_TYPE_ARRAYS[k].serialize_from_json(v) for v in json_data[k]] for k in json_data.keys() if k in cls._PAYPAL_TYPE_ARRAYS }
-        }
+        args = super()._build_args(json_data, cls._ENTITY_TYPES, cls._PAYPAL_TYPE_ARRAYS)
         return cls(**args, json_response = json_data, response_type = response_type)
 
 class CartInfo(PayPalEntity):
     """Cart info object representation
     """
     
+    _ARRAY_TYPES = { 'item_details': ItemDetail }
+
     def __init__(self, tax_inclusive: bool = None, paypal_invoice_id: str = None, item_details: List[ItemDetail] = [], **kwargs):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
         self.tax_inclusive = tax_inclusive
@@ -589,10 +613,8 @@ class CartInfo(PayPalEntity):
     
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        items = []
-        if 'item_details' in json_data.keys():
-            items = [ItemDetail.serialize_from_json(v) for v in json_data['item_details']]        
-        return cls(json_data.get('tax_inclusive'), json_data.get('tax_inclusive'), items)
+        args = super()._build_args(json_data, array_types = cls._ARRAY_TYPES)
+        return cls(**args, json_response = json_data, response_type = response_type)
 
 class StoreInfo(PayPalEntity):
     """Store info object representation.
@@ -622,10 +644,7 @@ class AuctionInfo(PayPalEntity):
     
     @property
     def auction_closing_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._auction_closing_date) if self._auction_closing_date else None
-        except:
-            return None
+        return self._timestamp('_auction_closing_date')
     
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
@@ -654,6 +673,9 @@ class IncentiveDetail(PayPalEntity):
 class TransactionDetails(PayPalEntity):
     """Transaction details obj representation
     """
+    __slots__ = (
+        'cart_info', 'store_info', 'payer_info', 'auction_info', 'shipping_info', 'transaction_info'
+    )
 
     _PAYPAL_TYPES = { 
         # The transaction information.
@@ -676,10 +698,10 @@ class TransactionDetails(PayPalEntity):
     }
 
     def __init__(
-        self, transaction_info: TransactionInfo, 
-        payer_info: PayerInfo, shipping_info: ShippingInfo, 
-        cart_info: CartInfo, store_info: StoreInfo, 
-        auction_info: AuctionInfo, **kwargs
+        self, transaction_info: TransactionInfo = None, 
+        payer_info: PayerInfo = None, shipping_info: ShippingInfo = None, 
+        cart_info: CartInfo = None, store_info: StoreInfo = None, 
+        auction_info: AuctionInfo = None, **kwargs
         ):
         super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
         self.cart_info = cart_info
@@ -691,15 +713,18 @@ class TransactionDetails(PayPalEntity):
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        args = { k : cls._PAYPAL_TYPES[k].serialize_from_json(v) for k,v in json_data.items() if k in cls._PAYPAL_TYPES and v }
+        args = super()._build_args(json_data, cls._PAYPAL_TYPES)
         return cls(**args, json_response = json_data, response_type = response_type)
 
 class TransactionResponse(PayPalEntity):
     """Transaction query response with the main info and details    
     """
 
+    _ARRAY_TYPES = { 'transaction_details': TransactionDetails }
+
     def __init__(self, account_number: str = None, 
     transaction_details: List[TransactionDetails] = [], **kwargs):
+        super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
         self.account_number = account_number
         self.transaction_details = transaction_details or []
         self.page = self._json_response.get('page', kwargs.get('page'))
@@ -712,28 +737,290 @@ class TransactionResponse(PayPalEntity):
 
     @property
     def end_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._end_date) if self._end_date else None
-        except:
-            return None
+        return self._timestamp('_end_date')
 
     @property
     def start_date(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._start_date) if self._start_date else None
-        except:
-            return None
+        return self._timestamp('_start_date')
 
     @property
     def last_refreshed_datetime(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._last_refreshed_datetime) if self._last_refreshed_datetime else None
-        except:
-            return None
+        return self._timestamp('_last_refreshed_datetime')
 
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
-        args = { **json_data }
-        if 'transaction_details' in json_data.keys():
-            args['transaction_details'] = [ TransactionDetails.serialize_from_json(v) for v in json_data['transaction_details'] ]
+        args = super()._build_args(json_data, array_types = cls._ARRAY_TYPES)
         return cls(**args, json_response = json_data, response_type = response_type)
+
+"""
+    Flattened columns of the transaction sinks, as json paths inside a transaction detail
+"""
+_MONEY_COLUMNS = ('currency_code', 'value')
+
+_TRANSACTION_COLUMNS = [
+    *[('transaction_info', k) for k in (
+        'transaction_id', 'paypal_account_id', 'paypal_reference_id', 'paypal_reference_id_type',
+        'transaction_event_code', 'transaction_initiation_date', 'transaction_updated_date',
+        'transaction_status', 'transaction_subject', 'transaction_note', 'payment_tracking_id',
+        'bank_reference_id', 'invoice_id', 'custom_field', 'protection_eligibility', 'credit_term',
+        'annual_percentage_rate', 'payment_method_type', 'instrument_type', 'instrument_sub_type'
+    )],
+    *[('transaction_info', k, m) for k in sorted(TransactionInfo._MONEY_TYPES) for m in _MONEY_COLUMNS],
+    *[('payer_info', k) for k in ('account_id', 'email_address', 'address_status', 'payer_status', 'country_code')],
+    *[('payer_info', 'payer_name', k) for k in ('given_name', 'surname', 'alternate_full_name')],
+    *[('payer_info', 'phone_number', k) for k in ('country_code', 'national_number')],
+    *[('payer_info', 'address', k) for k in ('line1', 'line2', 'city', 'state', 'country_code', 'postal_code')],
+    ('cart_info', 'tax_inclusive'),
+    ('cart_info', 'paypal_invoice_id')
+]
+
+"""
+    Transaction timestamp columns
+"""
+_DATE_COLUMNS = frozenset({ 'transaction_info.transaction_initiation_date', 'transaction_info.transaction_updated_date' })
+
+_ITEM_COLUMNS = [
+    *[(k,) for k in (
+        'item_code', 'item_name', 'item_description', 'item_options', 'item_quantity',
+        'tax_percentage', 'invoice_number', 'tax_amounts', 'checkout_options'
+    )],
+    *[(k, m) for k in sorted(ItemDetail._MONEY_TYPES) for m in _MONEY_COLUMNS]
+]
+
+def _column_value(data: Mapping, path: Tuple[str]) -> str:
+    """Gets a flattened column value from a json object,
+       non string values (numbers, bools & arrays) are stored as json
+    """
+    for key in path:
+        data = data.get(key) if isinstance(data, Mapping) else None
+        if data is None:
+            return None
+    return data if isinstance(data, str) else json.dumps(data)
+
+class TransactionSink(ABC):
+    """Base class for the columnar transaction sinks.
+
+        Sinks flatten the raw transaction details json into a fixed set of 
+        string columns, named after their json path (e.g. 'transaction_info.fee_amount.value'), 
+        and write them in batches of a fixed size. No entity objects are built 
+        so raw details (see SyncClient.export_transactions) should be preferred.
+    """
+    def __init__(self, chunk_size: int = 10000, items: bool = False):
+        """Constructor
+
+        Keyword Arguments:
+            chunk_size {int} -- rows per written batch (default: {10000})
+            items {bool} -- write a row per cart item instead of one per transaction, 
+                            with the 'cart_info.item_details.*' columns (default: {False})
+        """
+        self.chunk_size = chunk_size
+        self.items = items
+        self.rows = 0
+        self._paths = _TRANSACTION_COLUMNS + ([('cart_info', 'item_details', *x) for x in _ITEM_COLUMNS] if items else [])
+        self._pending = 0
+        self._columns = self._empty_columns()
+
+    @property
+    def column_names(self) -> List[str]:
+        return ['.'.join(x) for x in self._paths]
+
+    def _empty_columns(self) -> Dict[str, list]:
+        return { '.'.join(x): [] for x in self._paths }
+
+    def _append(self, details: Mapping, item: Mapping = None):
+        values = [ _column_value(details, x) for x in _TRANSACTION_COLUMNS ]
+
+        if self.items:
+            values.extend([ _column_value(item, x) if item else None for x in _ITEM_COLUMNS ])
+
+        for column, value in zip(self._columns.values(), values):
+            column.append(value)
+
+        self._pending += 1
+
+        if self._pending >= self.chunk_size:
+            self.flush()
+
+    def write(self, details: Union[dict, TransactionDetails]):
+        """Adds a transaction to the sink
+
+        Arguments:
+            details {Union[dict, TransactionDetails]} -- the raw transaction detail json, its entity or lazy proxy
+
+        Raises:
+            ValueError: If the entity was built in compact mode, so it has no json to write
+        """
+        if isinstance(details, LazyEntity):
+            details = details._json_response
+        elif isinstance(details, PayPalEntity):
+            if details._json_response is _EMPTY_JSON:
+                raise ValueError('Entities built in compact mode have no json to write, pass the raw json instead')
+            details = details._json_response
+
+        if not self.items:
+            self._append(details)
+            return
+
+        cart = details.get('cart_info') or {}
+
+        for item in cart.get('item_details') or [None]:
+            self._append(details, item)
+
+    def write_all(self, details: Iterable[Union[dict, TransactionDetails]]) -> int:
+        """Adds every transaction of an iterable to the sink
+
+        Arguments:
+            details {Iterable[Union[dict, TransactionDetails]]} -- the transactions
+
+        Returns:
+            int -- the amount of transactions added
+        """
+        count = 0
+
+        for d in details:
+            self.write(d)
+            count += 1
+
+        return count
+
+    def flush(self):
+        """Writes the pending rows as a batch
+        """
+        if not self._pending:
+            return
+
+        columns, self._columns = self._columns, self._empty_columns()
+        self.rows += self._pending
+        self._pending = 0
+        self._write_batch(columns)
+
+    def close(self):
+        """Writes the pending rows & releases the sink resources
+        """
+        self.flush()
+
+    @abstractmethod
+    def _write_batch(self, columns: Dict[str, list]):
+        """Writes a batch of rows
+
+        Arguments:
+            columns {Dict[str, list]} -- the batch values by column name
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+class CsvTransactionSink(TransactionSink):
+    """Transaction sink writing the batches as csv rows, with a header row.
+    """
+    def __init__(self, file, chunk_size: int = 10000, items: bool = False, **fmtparams):
+        """Constructor
+
+        Arguments:
+            file {Union[str, TextIO]} -- the csv file path or an open text file
+
+        Keyword Arguments:
+            chunk_size {int} -- rows per written batch (default: {10000})
+            items {bool} -- write a row per cart item instead of one per transaction (default: {False})
+            fmtparams -- csv writer format parameters
+        """
+        super().__init__(chunk_size, items)
+        self._owned = isinstance(file, str)
+        self._file = open(file, 'w', newline='') if self._owned else file
+        self._writer = csv.writer(self._file, **fmtparams)
+        self._writer.writerow(self.column_names)
+
+    def _write_batch(self, columns: Dict[str, list]):
+        self._writer.writerows(zip(*columns.values()))
+
+    def close(self):
+        super().close()
+        if self._owned:
+            self._file.close()
+
+def _require_pyarrow():
+    """Checks that the optional pyarrow dependency is installed
+
+    Raises:
+        ImportError: If pyarrow is not available
+    """
+    if pyarrow is None:
+        raise ImportError('Arrow & Parquet sinks require pyarrow, install it with: pip install pypaypal[columnar]')
+
+class ArrowTransactionSink(TransactionSink):
+    """Transaction sink building arrow record batches of string columns,
+       optionally with the transaction dates as utc timestamp columns.
+    """
+    def __init__(
+            self, chunk_size: int = 10000, items: bool = False, 
+            on_batch: Callable[['pyarrow.RecordBatch'], None] = None, parse_dates: bool = False
+        ):
+        """Constructor
+
+        Keyword Arguments:
+            chunk_size {int} -- rows per record batch (default: {10000})
+            items {bool} -- write a row per cart item instead of one per transaction (default: {False})
+            on_batch {Callable[[pyarrow.RecordBatch], None]} -- batch consumer, if None the batches 
+                                                              are kept in the batches list (default: {None})
+            parse_dates {bool} -- write the transaction dates as timestamps instead of strings (default: {False})
+
+        Raises:
+            ImportError: If pyarrow is not available
+        """
+        _require_pyarrow()
+        super().__init__(chunk_size, items)
+        self.batches = []
+        self._on_batch = on_batch or self.batches.append
+        self._date_columns = _DATE_COLUMNS if parse_dates else frozenset()
+        self.schema = pyarrow.schema([ 
+            (x, pyarrow.timestamp('us', tz='UTC') if x in self._date_columns else pyarrow.string()) 
+            for x in self.column_names 
+        ])
+
+    def _write_batch(self, columns: Dict[str, list]):
+        arrays = [ 
+            pyarrow.array(parse_timestamps(v) if k in self._date_columns else v, type=self.schema.field(k).type)
+            for k,v in columns.items() 
+        ]
+        self._on_batch(pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema))
+
+    def to_table(self) -> 'pyarrow.Table':
+        """Builds a table with the kept batches, pending rows are flushed first
+
+        Returns:
+            pyarrow.Table -- the transactions table
+        """
+        self.flush()
+        return pyarrow.Table.from_batches(self.batches, schema=self.schema)
+
+class ParquetTransactionSink(ArrowTransactionSink):
+    """Transaction sink writing each batch as a parquet row group.
+    """
+    def __init__(self, path: str, chunk_size: int = 10000, items: bool = False, compression: str = 'snappy', parse_dates: bool = False):
+        """Constructor
+
+        Arguments:
+            path {str} -- the parquet file path
+
+        Keyword Arguments:
+            chunk_size {int} -- rows per row group (default: {10000})
+            items {bool} -- write a row per cart item instead of one per transaction (default: {False})
+            compression {str} -- parquet compression codec (default: {'snappy'})
+            parse_dates {bool} -- write the transaction dates as timestamps instead of strings (default: {False})
+
+        Raises:
+            ImportError: If pyarrow is not available
+        """
+        super().__init__(chunk_size, items, self._write_row_group, parse_dates)
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema, compression=compression)
+
+    def _write_row_group(self, batch: 'pyarrow.RecordBatch'):
+        self._writer.write_table(pyarrow.Table.from_batches([batch], schema=self.schema))
+
+    def close(self):
+        super().close()
+        self._writer.close()
@@ -2,10 +2,10 @@
     Module with all tracking related entities 
 """
 
-from typing import Type
+from typing import Type, List
 from datetime import datetime
 
-import dateutil.parser
+from pypaypal.errors import PayPalErrorDetail
 from pypaypal.entities.base import T, PayPalEntity, ResponseType, ActionLink
 
 class Tracker(PayPalEntity):
@@ -36,10 +36,7 @@ class Tracker(PayPalEntity):
 
     @property
     def last_updated_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._last_updated_time) if self._last_updated_time else None
-        except:
-            return None
+        return self._timestamp('_last_updated_time')
 
     @property
     def read_link(self) -> ActionLink:
@@ -74,3 +71,44 @@ class Tracker(PayPalEntity):
             json_data['transaction_id'], json_data['tracking_number'], json_data['status'],
             json_data['carrier'], json_response= json_data, response_type = response_type
         )
+
+class TrackerIdentifier(PayPalEntity):
+    """
+        Identifier of a tracker added in a batch
+    """
+    def __init__(self, transaction_id: str, tracking_number: str, **kwargs):
+        super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
+        self.transaction_id = transaction_id
+        self.tracking_number = tracking_number
+        self.links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in self._json_response.get('links', [])]
+
+    @property
+    def read_link(self) -> ActionLink:
+        """Retrieves a link to read this entity details.
+        
+        Returns:
+            ActionLink -- The link for requesting the information to the API.
+        """
+        return next(filter(lambda x: x.rel == 'self', self.links), None)
+
+    @classmethod
+    def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
+        return cls(json_data.get('transaction_id'), json_data.get('tracking_number'), json_response= json_data, response_type = response_type)
+
+class TrackerBatchResponse(PayPalEntity):
+    """
+        Result of a trackers batch, with the added trackers & the errors of the rejected ones
+    """
+    def __init__(self, tracker_identifiers: List[TrackerIdentifier], errors: List[PayPalErrorDetail], **kwargs):
+        super().__init__(kwargs.get('json_response', dict()), kwargs.get('response_type', ResponseType.MINIMAL))
+        self.errors = errors
+        self.tracker_identifiers = tracker_identifiers
+        self.links = [ActionLink(x['href'], x['rel'], x.get('method', 'GET')) for x in self._json_response.get('links', [])]
+
+    @classmethod
+    def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
+        return cls(
+            [ TrackerIdentifier.serialize_from_json(x, response_type) for x in json_data.get('tracker_identifiers', []) ],
+            [ PayPalErrorDetail.serialize_from_json(x) for x in json_data.get('errors', []) ],
+            json_response= json_data, response_type = response_type
+        )
@@ -6,8 +6,6 @@ from enum import Enum
 from datetime import datetime
 from typing import Type, List
 
-import dateutil.parser
-
 from pypaypal.entities.base import (
     T,
     ActionLink,
@@ -154,17 +152,11 @@ class Resource(PayPalEntity):
 
     @property
     def update_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._update_time) if self._update_time else None
-        except:
-            return None
+        return self._timestamp('_update_time')
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @classmethod
     def create(cls, resource_id: str, state: str, amount: ResourceAmount) -> 'Resource':
@@ -205,10 +197,7 @@ class WebhookEvent(PayPalEntity):
 
     @property
     def create_time(self) -> datetime:
-        try:
-            return dateutil.parser.parse(self._create_time) if self._create_time else None
-        except:
-            return None
+        return self._timestamp('_create_time')
 
     @classmethod
     def create(cls, event_id: str = None, resource_type: str = None,
@@ -223,6 +212,7 @@ class WebhookEvent(PayPalEntity):
     @classmethod
     def serialize_from_json(cls: Type[T], json_data: dict, response_type: ResponseType = ResponseType.MINIMAL) -> T:
         args = super()._build_args(json_data, cls._ENTITY_TYPES)
+        args['event_id'] = json_data.get('id')
         return cls(**args, json_response = json_data, response_type = response_type)
 
 class WebhookSignature(PayPalEntity):
@@ -41,8 +41,9 @@ class IdentityError(Exception):
     def __init__(self, response):
         super().__init__('Identity error occoured')
         self.response = response
-        self.error = response.json().get('error')
-        self.error_description = response.json().get('error_description')
+        body = response.json()
+        self.error = body.get('error')
+        self.error_description = body.get('error_description')
 
 class ExpiredSessionError(Exception):
     """
@@ -60,6 +61,23 @@ class PaypalRequestError(Exception):
         super().__init__(details.message)
         self.details = details
 
+class PayoutWatchError(Exception):
+    """
+        Errors polling the status of a payout batch
+    """
+    def __init__(self, payout_batch_id: str, response):
+        super().__init__(f'there was an error reading the payout batch {payout_batch_id} from the paypal api')
+        self.payout_batch_id = payout_batch_id
+        self.response = response
+
+class PageRequestError(Exception):
+    """
+        Errors reading a page while iterating a paged resource
+    """
+    def __init__(self, page):
+        super().__init__('there was an error reading a page from the paypal api')
+        self.page = page
+
 # class EntityRefreshError(Exception):
 #     """
 #       Error raised when there's a failure refreshing an entity  
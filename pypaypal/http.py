@@ -1,19 +1,26 @@
 """Module with basic http constants & session handling.
 """
+import time
+import uuid
+import random
+import logging
+import threading
 import urllib.parse
 
 from enum import Enum
 from abc import ABC, abstractmethod
 
-from requests import ( 
-    get, post, put, patch, delete 
-)
-
+from requests import post, Session
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout, ConnectionError as TransportError
 
 from typing import NamedTuple
-from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timedelta, timezone
 
+from pypaypal.throttling import RateLimiter
+from pypaypal.codec import JsonCodec, JsonResponse, default_codec, encode_body
 from pypaypal.errors import IdentityError, ExpiredSessionError
 
 """
@@ -30,6 +37,11 @@ LIVE_API_BASE_URL = 'https://api.paypal.com/v2/'
 """
 SANDBOX_API_BASE_URL = 'https://api.sandbox.paypal.com/v2/'
 
+"""
+    Header used by the PayPal API to process repeated requests only once.
+"""
+IDEMPOTENCY_HEADER = 'PayPal-Request-Id'
+
 """Live PayPal api base URL for v1 api requests.
 """
 LEGACY_LIVE_API_BASE_URL = 'https://api.paypal.com/v1/'
@@ -38,6 +50,14 @@ LEGACY_LIVE_API_BASE_URL = 'https://api.paypal.com/v1/'
 """
 LEGACY_SANDBOX_API_BASE_URL = 'https://api.sandbox.paypal.com/v1/'
 
+"""
+    Min seconds between background token refreshes, keeps margins 
+    close to (or above) the token lifetime from refreshing in a loop.
+"""
+MIN_REFRESH_DELAY = 30
+
+_logger = logging.getLogger(__name__)
+
 class AuthType(Enum):
     """
         Enumerated constants for the session type
@@ -80,7 +100,14 @@ class PayPalToken(NamedTuple):
         """
             Checks if the token is expired
         """
-        return self.requested_at + timedelta(seconds = self.expires_in) < datetime.now()
+        return self.expires_at < datetime.now()
+
+    @property
+    def expires_at(self) -> datetime:
+        """
+            Token expiration date
+        """
+        return self.requested_at + timedelta(seconds = self.expires_in)
     
     @classmethod
     def serialize(cls, json_data: dict):
@@ -91,6 +118,163 @@ class PayPalToken(NamedTuple):
             json_data['app_id'], json_data['expires_in'], json_data['nonce'], datetime.now()
         )
 
+class TransportOptions(NamedTuple):
+    """Connection pool settings for the http transport owned by a session.
+
+    Every session keeps a single pooled transport that is reused for all its
+    requests so the TCP & TLS handshakes are paid once per connection instead
+    of once per API call.
+    """
+    # Number of host connection pools to cache.
+    pool_connections: int = 10
+    # Max number of connections kept alive per host.
+    pool_maxsize: int = 10
+    # Block when every pooled connection is in use instead of opening extra ones.
+    pool_block: bool = False
+    # Keep connections open between requests.
+    keep_alive: bool = True
+
+    def create_transport(self) -> Session:
+        """Creates a pooled transport with this instance settings
+        
+        Returns:
+            Session -- A requests session with mounted pooled adapters
+        """
+        transport = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, 
+            pool_maxsize=self.pool_maxsize, 
+            pool_block=self.pool_block
+        )
+        transport.mount('https://', adapter)
+        transport.mount('http://', adapter)
+
+        if not self.keep_alive:
+            transport.headers['Connection'] = 'close'
+
+        return transport
+
+class RetryPolicy(NamedTuple):
+    """Retry settings for transient request failures of a session.
+
+    Idempotent methods are retried as they are. POST requests are only retried
+    carrying a PayPal-Request-Id header and the same id is sent on every attempt
+    so the API processes the write once. Not every endpoint honors the header,
+    so ids are only generated for POST requests without one if generate_request_ids
+    is enabled, otherwise those requests are sent once. PATCH requests are never retried.
+    """
+    # Max attempts per request, including the first one.
+    max_attempts: int = 3
+    # Base seconds for the exponential backoff between attempts.
+    backoff_factor: float = 0.5
+    # Max seconds between attempts (doesn't apply to Retry-After).
+    max_backoff: float = 30
+    # Randomize the backoff (full jitter) to spread retries of concurrent callers.
+    jitter: bool = True
+    # Wait the time requested by the API on Retry-After headers.
+    respect_retry_after: bool = True
+    # Generate a PayPal-Request-Id for POST requests without one, only safe if
+    # every POST endpoint called through the session honors the header.
+    generate_request_ids: bool = False
+    # Response status codes to retry.
+    retry_statuses: frozenset = frozenset({ 408, 429, 500, 502, 503, 504 })
+    # Transport exceptions to retry.
+    retry_exceptions: tuple = (TransportError, Timeout)
+    # Methods that can be retried without an idempotency key.
+    idempotent_methods: frozenset = frozenset({ 'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE' })
+
+    def prepare_headers(self, method: str, headers: dict = None) -> dict:
+        """Adds a generated PayPal-Request-Id to POST requests without one
+
+        Arguments:
+            method {str} -- http method
+
+        Keyword Arguments:
+            headers {dict} -- request headers (default: {None})
+
+        Returns:
+            dict -- the request headers
+        """
+        headers = dict(headers) if headers else {}
+
+        if self.generate_request_ids and method.upper() == 'POST' and not self._request_id(headers):
+            headers[IDEMPOTENCY_HEADER] = str(uuid.uuid4())
+
+        return headers
+
+    def can_retry(self, method: str, headers: dict = None) -> bool:
+        """Checks if a request can be safely retried
+
+        Arguments:
+            method {str} -- http method
+
+        Keyword Arguments:
+            headers {dict} -- request headers (default: {None})
+
+        Returns:
+            bool -- True for idempotent methods & POST requests with a PayPal-Request-Id
+        """
+        method = method.upper()
+        return method in self.idempotent_methods or (method == 'POST' and self._request_id(headers or {}) != None)
+
+    def should_retry(self, attempt: int, response) -> bool:
+        """Checks if a response must be retried
+
+        Arguments:
+            attempt {int} -- current attempt number (starting at 1)
+            response -- the http response
+
+        Returns:
+            bool -- True if there are attempts left & the response status is retryable
+        """
+        return attempt < self.max_attempts and response.status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff seconds for a given attempt
+
+        Arguments:
+            attempt {int} -- failed attempt number (starting at 1)
+
+        Returns:
+            float -- seconds to wait
+        """
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def delay(self, attempt: int, response = None) -> float:
+        """Seconds to wait before the next attempt
+
+        Arguments:
+            attempt {int} -- failed attempt number (starting at 1)
+
+        Keyword Arguments:
+            response -- the failed attempt response if any (default: {None})
+
+        Returns:
+            float -- seconds to wait
+        """
+        retry_after = self._retry_after(response) if self.respect_retry_after and response is not None else None
+        return retry_after if retry_after != None else self.backoff(attempt)
+
+    def _request_id(self, headers: dict) -> str:
+        return next((v for k,v in headers.items() if k.lower() == IDEMPOTENCY_HEADER.lower()), None)
+
+    def _retry_after(self, response) -> float:
+        value = response.headers.get('Retry-After')
+
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+
+        try:
+            return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0)
+        except (TypeError, ValueError):
+            return None
+
 def parse_url(base: str, *args: str) -> str:
     """Safely parses a web url
     """
@@ -101,13 +285,16 @@ def parse_url(base: str, *args: str) -> str:
         return parse_url(urllib.parse.urljoin(base, arg), *args[1:])
     return urllib.parse.urljoin(base, args[0].strip('/'))
 
-def _authenticate(client_id: str, secret:str, mode: SessionMode) -> PayPalToken:
+def _authenticate(client_id: str, secret:str, mode: SessionMode, transport: Session = None) -> PayPalToken:
     """Basic authentication that returns a PayPalToken
     
     Arguments:
         client_id {str} -- paypal client id
         secret {str} -- paypal client secret
         mode {SessionMode} -- Desired session mode (LIVE or SANDBOX)
+
+    Keyword Arguments:
+        transport {Session} -- pooled transport to perform the request with (default: {None})
     
     Raises:
         IdentityError: If the user fails to authenticate
@@ -124,7 +311,8 @@ def _authenticate(client_id: str, secret:str, mode: SessionMode) -> PayPalToken:
         'Content-Type': 'application/x-www-form-urlencoded'
     }
 
-    response = post(url, body, None, auth=HTTPBasicAuth(client_id, secret), headers=headers)
+    send = transport.post if transport else post
+    response = send(url, body, None, auth=HTTPBasicAuth(client_id, secret), headers=headers)
 
     if response.status_code != 200:
         raise IdentityError(response)
@@ -134,18 +322,25 @@ def _authenticate(client_id: str, secret:str, mode: SessionMode) -> PayPalToken:
 class PayPalSession(ABC):
     """PayPal session abstraction
     """
-    def __init__(self, auth_type: AuthType, session_mode: SessionMode, token: PayPalToken):
+    def __init__(self, auth_type: AuthType, session_mode: SessionMode, token: PayPalToken, transport: Session = None):
         """Constructor
         
         Arguments:
             auth_type {AuthType} -- The instance session type
             session_mode {SessionMode} -- The instance session mode
             token {PayPalToken} -- The instance initial access token
+
+        Keyword Arguments:
+            transport {Session} -- pooled transport for the requests, a default one is made if None (default: {None})
         """
         self._paypal_token = token
         self.auth_type = auth_type
         self.session_mode = session_mode
+        self.retry_policy = None
+        self.rate_limiter = None
+        self.codec = default_codec()
         self.status = SessionStatus.ACTIVE
+        self._transport = transport or TransportOptions().create_transport()
     
     @abstractmethod
     def get(self, url: str, params:dict=None, **kwargs):
@@ -210,6 +405,81 @@ class PayPalSession(ABC):
         """
         pass
 
+    def _request(self, method: str, url: str, **kwargs) -> JsonResponse:
+        """Performs a request through the session pooled transport, 
+           json bodies (dicts & lists) are encoded with the session codec
+        
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+        
+        Returns:
+            JsonResponse -- An http response parsing its body with the session codec
+        """
+        if kwargs.get('data') != None:
+            kwargs['data'] = encode_body(self.codec, kwargs['data'])
+
+        return JsonResponse(self._send_with_retries(method, url, **kwargs), self.codec)
+
+    def _send_with_retries(self, method: str, url: str, **kwargs):
+        """Sends a request retrying transient failures if the session has a retry policy
+        
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+        
+        Returns:
+            An http response
+        """
+        policy = self.retry_policy
+
+        if policy == None:
+            return self._send(method, url, **kwargs)
+
+        kwargs['headers'] = policy.prepare_headers(method, kwargs.get('headers'))
+        retryable = policy.can_retry(method, kwargs['headers'])
+        attempt = 1
+
+        while True:
+            try:
+                response = self._send(method, url, **kwargs)
+            except policy.retry_exceptions:
+                if not retryable or attempt >= policy.max_attempts:
+                    raise
+                time.sleep(policy.delay(attempt))
+                attempt += 1
+                continue
+
+            if not retryable or not policy.should_retry(attempt, response):
+                return response
+
+            response.close()
+            time.sleep(policy.delay(attempt, response))
+            attempt += 1
+
+    def _send(self, method: str, url: str, **kwargs):
+        """Sends a single request, waiting for the rate limiter if the session has one
+        
+        Arguments:
+            method {str} -- http method
+            url {str} -- request URL
+        
+        Returns:
+            An http response
+        """
+        if self.rate_limiter == None:
+            return self._transport.request(method, url, **kwargs)
+
+        with self.rate_limiter.acquire(url):
+            return self._transport.request(method, url, **kwargs)
+
+    def _close_transport(self):
+        """Closes the pooled transport releasing every kept-alive connection
+        """
+        if self._transport:
+            self._transport.close()
+            self._transport = None
+
     def _prepare_headers(self, token: PayPalToken, custom_headers:dict=None) -> dict:
         """Gets the headers to be used on every request
         
@@ -242,8 +512,8 @@ class _OAuthSession(PayPalSession):
         once the session is expired this instance will not be valid for further
         requests.
     """
-    def __init__(self, session_mode: SessionMode, token: PayPalToken):
-        super().__init__(AuthType.TOKEN, session_mode, token)
+    def __init__(self, session_mode: SessionMode, token: PayPalToken, transport: Session = None):
+        super().__init__(AuthType.TOKEN, session_mode, token, transport)
     
     def _check_token(self) -> PayPalToken:
         if self.status == SessionStatus.ACTIVE and (self._paypal_token == None or self._paypal_token.is_expired()):
@@ -256,27 +526,28 @@ class _OAuthSession(PayPalSession):
 
     def get(self, url: str, params:dict=None, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return get(url, params, **kwargs)
+        return self._request('GET', url, params=params, **kwargs)
 
     def post(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return post(url, body, None, **kwargs)
+        return self._request('POST', url, data=body, **kwargs)
 
     def put(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return put(url, body, **kwargs)
+        return self._request('PUT', url, data=body, **kwargs)
 
     def patch(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return patch(url, body, **kwargs)
+        return self._request('PATCH', url, data=body, **kwargs)
 
     def delete(self, url: str, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return delete(url, **kwargs)
+        return self._request('DELETE', url, **kwargs)
 
     def _dispose(self):
         self._paypal_token = None
         self.status = SessionStatus.DISPOSED
+        self._close_transport()
 
     def __repr__(self):
         return f'_OAuthSession(session_mode={self.session_mode}, status={self.status})'
@@ -291,8 +562,8 @@ class _BasicAuthSession(PayPalSession):
         all requests will use basic authorization which means that
         the client & secret will always travel through the network.
     """
-    def __init__(self, session_mode: SessionMode, token: PayPalToken, client: str, secret: str):
-        super().__init__(AuthType.BASIC, session_mode, token)
+    def __init__(self, session_mode: SessionMode, token: PayPalToken, client: str, secret: str, transport: Session = None):
+        super().__init__(AuthType.BASIC, session_mode, token, transport)
         self._client = client
         self._secret = secret
     
@@ -313,7 +584,7 @@ class _BasicAuthSession(PayPalSession):
         else:
             kwargs['auth'] = HTTPBasicAuth(self._client, self._secret)
         
-        response = get(url, params, **kwargs)        
+        response = self._request('GET', url, params=params, **kwargs)        
         if response.status_code == 401:
             raise IdentityError(response)
         return response
@@ -326,7 +597,7 @@ class _BasicAuthSession(PayPalSession):
         else:
             kwargs['auth'] = HTTPBasicAuth(self._client, self._secret)
 
-        response = post(url, body, None, **kwargs)        
+        response = self._request('POST', url, data=body, **kwargs)        
         if response.status_code == 401:
             raise IdentityError(response)
         return response
@@ -339,7 +610,7 @@ class _BasicAuthSession(PayPalSession):
         else:
             kwargs['auth'] = HTTPBasicAuth(self._client, self._secret)
         
-        response = put(url, body, **kwargs)
+        response = self._request('PUT', url, data=body, **kwargs)
         if response.status_code == 401:
             raise IdentityError(response)
         return response
@@ -352,7 +623,7 @@ class _BasicAuthSession(PayPalSession):
         else:
             kwargs['auth'] = HTTPBasicAuth(self._client, self._secret)
         
-        response = patch(url, body, **kwargs)
+        response = self._request('PATCH', url, data=body, **kwargs)
         if response.status_code == 401:
             raise IdentityError(response)
         return response
@@ -365,7 +636,7 @@ class _BasicAuthSession(PayPalSession):
         else:
             kwargs['auth'] = HTTPBasicAuth(self._client, self._secret)
 
-        response = delete(url, **kwargs)
+        response = self._request('DELETE', url, **kwargs)
         if response.status_code == 401:
             raise IdentityError(response)
         return response
@@ -375,6 +646,7 @@ class _BasicAuthSession(PayPalSession):
         self._secret = None
         self._paypal_token = None
         self.status = SessionStatus.DISPOSED
+        self._close_transport()
     
     def __repr__(self):
         return f'_BasicAuthSession(session_mode={self.session_mode}, status={self.status}, client={self._client})'
@@ -391,53 +663,124 @@ class _RefreshableSession(PayPalSession):
         secret network roundtrips.
         
         This session can receive flags to limit the refresh count.
+
+        Refreshes are single-flight: the first thread finding an expired token
+        fetches a new one while concurrent callers wait for it. When a refresh
+        margin is set the token is also refreshed on a background timer that
+        many seconds before it expires, so requests don't pay the refresh inline.
+
+        Refreshed tokens can be shared with other processes through a token store
+        (see pypaypal.tokens).
     """
-    def __init__(self, session_mode: SessionMode, token: PayPalToken, client:str, secret: str, refresh_limit:int=None):
-        super().__init__(AuthType.REFRESHABLE, session_mode, token)
+    def __init__(
+            self, session_mode: SessionMode, token: PayPalToken, client:str, secret: str, 
+            refresh_limit:int=None, transport: Session = None, refresh_margin: int = None,
+            token_store: 'TokenStore' = None
+        ):
+        super().__init__(AuthType.REFRESHABLE, session_mode, token, transport)
         self._client = client
         self._secret = secret
+        self._refresh_timer = None
         self._refresh_limit = refresh_limit
+        self._token_store = token_store
+        self._refresh_margin = refresh_margin
+        self._refresh_lock = threading.Lock()
+        self._schedule_refresh()
     
-    def _check_token(self) -> PayPalToken:
-        if self.status == SessionStatus.ACTIVE and (self._paypal_token == None or self._paypal_token.is_expired()):
-            self.status = SessionStatus.EXPIRED
-        
-        if self.status == SessionStatus.EXPIRED and (self._refresh_limit == None or self._refresh_limit > 0):
+    def _can_refresh(self) -> bool:
+        return self._refresh_limit == None or self._refresh_limit > 0
+
+    def _refresh(self, min_ttl: int = None):
+        """Fetches a new token, reusing a stored one if there's a token store. 
+           Must be called holding the refresh lock.
+
+        Keyword Arguments:
+            min_ttl {int} -- min validity in seconds for a stored token to be reused (default: {None})
+        """
+        if self._refresh_limit != None:
             self._refresh_limit-=1
-            self._paypal_token = _authenticate(self._client, self._secret, self.session_mode)
-            self.status = SessionStatus.ACTIVE
 
-        if self.status != SessionStatus.ACTIVE:
-            raise ExpiredSessionError(self)
+        fetch = lambda: _authenticate(self._client, self._secret, self.session_mode, self._transport)
+        self._paypal_token = self._token_store.fetch(self._client, self.session_mode, fetch, min_ttl) if self._token_store else fetch()
+        self.status = SessionStatus.ACTIVE
+        self._schedule_refresh()
 
-        return self._paypal_token
+    def _schedule_refresh(self):
+        """Schedules a background refresh ahead of the token expiration if a margin is set.
+        """
+        if self._refresh_timer:
+            # An inline refresh replaces the pending one
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+        if self._refresh_margin == None or self._paypal_token == None or not self._can_refresh():
+            return
+
+        delay = (self._paypal_token.expires_at - datetime.now()).total_seconds() - self._refresh_margin
+        self._refresh_timer = threading.Timer(max(delay, MIN_REFRESH_DELAY), self._proactive_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _proactive_refresh(self):
+        with self._refresh_lock:
+            if self.status == SessionStatus.DISPOSED or not self._can_refresh():
+                return
+            try:
+                self._refresh(self._refresh_margin)
+            except Exception:
+                # The token is still valid, the next expired check will retry inline.
+                _logger.warning('Background token refresh failed', exc_info=True)
+
+    def _check_token(self) -> PayPalToken:
+        token = self._paypal_token
+
+        if self.status == SessionStatus.ACTIVE and token != None and not token.is_expired():
+            return token
+
+        with self._refresh_lock:
+            # Another thread might have refreshed the token while this one waited
+            if self.status == SessionStatus.ACTIVE and (self._paypal_token == None or self._paypal_token.is_expired()):
+                self.status = SessionStatus.EXPIRED
+            
+            if self.status == SessionStatus.EXPIRED and self._can_refresh():
+                self._refresh()
+
+            if self.status != SessionStatus.ACTIVE:
+                raise ExpiredSessionError(self)
+
+            return self._paypal_token
 
     def get(self, url: str, params:dict=None, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return get(url, params, **kwargs)
+        return self._request('GET', url, params=params, **kwargs)
 
     def post(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return post(url, body, None, **kwargs)
+        return self._request('POST', url, data=body, **kwargs)
 
     def put(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return put(url, body, **kwargs)
+        return self._request('PUT', url, data=body, **kwargs)
 
     def patch(self, url: str, body, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return patch(url, body, **kwargs)
+        return self._request('PATCH', url, data=body, **kwargs)
 
     def delete(self, url: str, **kwargs):
         kwargs['headers'] = self._prepare_headers(self._check_token(), kwargs.get('headers'))
-        return delete(url, **kwargs)    
+        return self._request('DELETE', url, **kwargs)    
 
     def _dispose(self):
-        self._client = None
-        self._secret = None
-        self._refresh_limit = 0
-        self._paypal_token = None
-        self.status = SessionStatus.DISPOSED
+        with self._refresh_lock:
+            if self._refresh_timer:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+            self._client = None
+            self._secret = None
+            self._refresh_limit = 0
+            self._paypal_token = None
+            self.status = SessionStatus.DISPOSED
+        self._close_transport()
 
     def __repr__(self):
         return f'_RefreshableSession(session_mode={self.session_mode}, status={self.status}, client={self._client})'
@@ -445,23 +788,44 @@ class _RefreshableSession(PayPalSession):
     def __str__(self):
         return f'_RefreshableSession(session_mode={self.session_mode}, status={self.status}, client={self._client})'
 
-def session_from_token(token: PayPalToken, mode: SessionMode) -> PayPalSession:
+def session_from_token(
+        token: PayPalToken, mode: SessionMode, transport_options: TransportOptions = None, 
+        retry_policy: RetryPolicy = None, rate_limiter: RateLimiter = None, codec: JsonCodec = None
+    ) -> PayPalSession:
     """Creates a session from a given token
     
     Arguments:
         token {PayPalToken} -- A valid paypal token instance 
         mode {SessionMode} -- Desired session mode (LIVE or SANDBOX)
+
+    Keyword Arguments:
+        transport_options {TransportOptions} -- connection pool settings (default: {None})
+        retry_policy {RetryPolicy} -- retry settings for transient failures (default: {None})
+        rate_limiter {RateLimiter} -- client side rate limits by API family (default: {None})
+        codec {JsonCodec} -- json codec for bodies & responses, the fastest available if None (default: {None})
     
     Returns:
         PayPalSession -- A paypal session for all the api http requests
     """
-    return _OAuthSession(mode, token)
+    session = _OAuthSession(mode, token, (transport_options or TransportOptions()).create_transport())
+    session.retry_policy = retry_policy
+    session.rate_limiter = rate_limiter
+    session.codec = codec or session.codec
+    return session
 
 def authenticate(client_id: str, secret: str, mode: SessionMode, auth_type: AuthType=AuthType.REFRESHABLE, **kwargs) -> PayPalSession:
     """Creates a session for a given user. If a session handles any kind of 
        flags it can be received as a kwarg. 
        
        Supported flags -> 'refresh_limit' for refreshable sessions.
+                          'refresh_margin' seconds before expiration to refresh the token
+                          in background for refreshable sessions (at least MIN_REFRESH_DELAY seconds apart).
+                          'transport_options' (TransportOptions) for every session type.
+                          'token_store' (pypaypal.tokens.TokenStore) to share tokens between 
+                          processes for every session type.
+                          'retry_policy' (RetryPolicy) to retry transient failures for every session type.
+                          'rate_limiter' (RateLimiter) to throttle requests by API family for every session type.
+                          'codec' (pypaypal.codec.JsonCodec) for the json bodies & responses for every session type.
 
     Arguments:
         client_id {str} -- paypal client id
@@ -475,9 +839,29 @@ def authenticate(client_id: str, secret: str, mode: SessionMode, auth_type: Auth
     Returns:
         PayPalSession -- A paypal session for all the api http requests
     """
+    # The token request goes through the same pool the session will use.
+    transport = (kwargs.get('transport_options') or TransportOptions()).create_transport()
+
+    token_store = kwargs.get('token_store')
+
+    try:
+        fetch = lambda: _authenticate(client_id, secret, mode, transport)
+        token = token_store.fetch(client_id, mode, fetch) if token_store else fetch()
+    except:
+        transport.close()
+        raise
+
     if auth_type == AuthType.TOKEN:
-        return session_from_token(_authenticate(client_id, secret, mode), mode)    
-    token = _authenticate(client_id, secret, mode)
-    if auth_type == AuthType.BASIC:
-        return _BasicAuthSession(mode, token, client_id, secret)
-    return _RefreshableSession(mode, token, client_id, secret, kwargs.get('refresh_limit'))
+        session = _OAuthSession(mode, token, transport)
+    elif auth_type == AuthType.BASIC:
+        session = _BasicAuthSession(mode, token, client_id, secret, transport)
+    else:
+        session = _RefreshableSession(
+            mode, token, client_id, secret, kwargs.get('refresh_limit'), 
+            transport, kwargs.get('refresh_margin'), token_store
+        )
+
+    session.retry_policy = kwargs.get('retry_policy')
+    session.rate_limiter = kwargs.get('rate_limiter')
+    session.codec = kwargs.get('codec') or session.codec
+    return session
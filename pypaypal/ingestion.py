@@ -0,0 +1,539 @@
+"""Module with a webhook ingestion pipeline.
+
+   A WebhookIngestor acknowledges deliveries as soon as they are verified,
+   deduplicated & queued, the events are parsed & handled later on by a
+   bounded pool of worker threads so bursts never hold PayPal's requests.
+
+   PayPal redelivers events until they're acknowledged (and resent events
+   keep their id), so events are deduplicated by id with a bounded LRU,
+   optionally backed by a sqlite database to survive restarts. Ids are only
+   registered once their event is handled, the events in flight are tracked
+   apart so an event lost in a crash can still be backfilled.
+
+   An EventBackfill replays the events of a time range (e.g. after an outage)
+   through the same handlers, reading windows of the range concurrently and
+   checkpointing the finished ones so an interrupted backfill can resume.
+"""
+import os
+import json
+import time
+import queue
+import sqlite3
+import tempfile
+import threading
+
+from enum import Enum
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, NamedTuple, Tuple
+
+from pypaypal.entities.base import DateRange
+from pypaypal.codec import JsonCodec, default_codec
+from pypaypal.clients.sync import date_windows
+from pypaypal.clients.webhooks import EventClient, VerifySignatureClient
+from pypaypal.entities.webhooks import WebhookEvent, SignatureVerificationStatus
+from pypaypal.signatures import LocalSignatureVerifier, LocalVerificationError, default_verifier, signature_from_headers
+
+"""
+    Handler key for every event type
+"""
+ALL_EVENTS = '*'
+
+class IngestStatus(Enum):
+    """Outcome of a webhook delivery
+    """
+    ACCEPTED = 202
+    DUPLICATE = 200
+    MALFORMED = 400
+    INVALID_SIGNATURE = 401
+    OVERLOADED = 503
+
+    @property
+    def http_status(self) -> int:
+        """Http status to answer the delivery with, PayPal retries non 2xx answers
+        """
+        return self.value
+
+    @property
+    def acknowledged(self) -> bool:
+        return self.value // 100 == 2
+
+class IngestStats(NamedTuple):
+    """Ingestion counters
+    """
+    received: int
+    accepted: int
+    duplicates: int
+    rejected: int
+    overloaded: int
+    handled: int
+    failed: int
+    queued: int
+
+class EventDeduplicator(ABC):
+    """Base class for the webhook event id filters.
+    """
+    @abstractmethod
+    def __contains__(self, event_id: str) -> bool:
+        """Checks if an event id was registered
+        """
+        pass
+
+    @abstractmethod
+    def add(self, event_id: str) -> bool:
+        """Registers an event id
+
+        Arguments:
+            event_id {str} -- the event id
+
+        Returns:
+            bool -- True if the id wasn't registered before
+        """
+        pass
+
+    @abstractmethod
+    def discard(self, event_id: str):
+        """Forgets an event id so its redeliveries are processed again
+
+        Arguments:
+            event_id {str} -- the event id
+        """
+        pass
+
+class MemoryDeduplicator(EventDeduplicator):
+    """Thread safe LRU of the latest event ids.
+    """
+    def __init__(self, max_size: int = 100000):
+        """Constructor
+
+        Keyword Arguments:
+            max_size {int} -- max amount of ids kept (default: {100000})
+        """
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._ids = OrderedDict()
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._ids
+
+    def add(self, event_id: str) -> bool:
+        with self._lock:
+            if event_id in self._ids:
+                self._ids.move_to_end(event_id)
+                return False
+
+            self._ids[event_id] = None
+
+            if len(self._ids) > self.max_size:
+                self._ids.popitem(last=False)
+
+            return True
+
+    def discard(self, event_id: str):
+        with self._lock:
+            self._ids.pop(event_id, None)
+
+class SqliteDeduplicator(EventDeduplicator):
+    """Event ids persisted in a sqlite database behind an in memory LRU,
+       ids older than the retention period are purged as new ones come in.
+    """
+    def __init__(self, path: str, cache_size: int = 100000, retention: float = 604800, timeout: float = 30):
+        """Constructor
+
+        Arguments:
+            path {str} -- the database file path
+
+        Keyword Arguments:
+            cache_size {int} -- max amount of ids kept in memory (default: {100000})
+            retention {float} -- seconds to keep an id (default: {604800})
+            timeout {float} -- seconds to wait for the database lock (default: {30})
+        """
+        self.path = path
+        self.retention = retention
+        self._added = 0
+        self._lock = threading.Lock()
+        self._cache = MemoryDeduplicator(cache_size)
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute('CREATE TABLE IF NOT EXISTS paypal_webhook_events (event_id TEXT PRIMARY KEY, received_at REAL NOT NULL)')
+
+    def __contains__(self, event_id: str) -> bool:
+        if event_id in self._cache:
+            return True
+
+        with self._lock:
+            cursor = self._conn.execute('SELECT 1 FROM paypal_webhook_events WHERE event_id = ?', (event_id,))
+            return cursor.fetchone() != None
+
+    def add(self, event_id: str) -> bool:
+        if event_id in self._cache:
+            return False
+
+        with self._lock:
+            cursor = self._conn.execute(
+                'INSERT OR IGNORE INTO paypal_webhook_events (event_id, received_at) VALUES (?, ?)', (event_id, time.time())
+            )
+            self._added += 1
+
+            if self._added % 10000 == 0:
+                self._conn.execute('DELETE FROM paypal_webhook_events WHERE received_at < ?', (time.time() - self.retention,))
+
+        self._cache.add(event_id)
+        return cursor.rowcount == 1
+
+    def discard(self, event_id: str):
+        self._cache.discard(event_id)
+
+        with self._lock:
+            self._conn.execute('DELETE FROM paypal_webhook_events WHERE event_id = ?', (event_id,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+"""
+    Stops a worker thread
+"""
+_STOP = object()
+
+class WebhookIngestor:
+    """Verifies, deduplicates & queues webhook deliveries,
+       dispatching them to the handlers of their event type.
+    """
+    def __init__(
+            self, webhook_id: str, workers: int = 4, queue_size: int = 10000,
+            deduplicator: EventDeduplicator = None, verifier: LocalSignatureVerifier = None,
+            client: VerifySignatureClient = None, codec: JsonCodec = None,
+            on_error: Callable[[WebhookEvent, Exception], None] = None
+        ):
+        """Constructor
+
+        Arguments:
+            webhook_id {str} -- the id of the webhook receiving the deliveries, signatures aren't checked if None
+
+        Keyword Arguments:
+            workers {int} -- amount of handler threads (default: {4})
+            queue_size {int} -- max amount of queued events, deliveries are refused while it's full (default: {10000})
+            deduplicator {EventDeduplicator} -- event id filter, an in memory LRU if None (default: {None})
+            verifier {LocalSignatureVerifier} -- local signature verifier, the process wide one if None (default: {None})
+            client {VerifySignatureClient} -- API fallback for signatures that can't be checked locally (default: {None})
+            codec {JsonCodec} -- codec for the delivery bodies, the fastest available if None (default: {None})
+            on_error {Callable[[WebhookEvent, Exception], None]} -- called when an event fails, with None if it can't be parsed (default: {None})
+        """
+        self.webhook_id = webhook_id
+        self.deduplicator = deduplicator or MemoryDeduplicator()
+        self._workers = workers
+        self._client = client
+        self._on_error = on_error
+        self._codec = codec or default_codec()
+        self._verifier = verifier or default_verifier()
+        self._queue = queue.Queue(queue_size)
+        self._handlers: Dict[str, List[Callable[[WebhookEvent], None]]] = dict()
+        self._threads = []
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(IngestStats._fields[:-1], 0)
+
+    def add_handler(self, event_type: str, handler: Callable[[WebhookEvent], None]):
+        """Registers an event handler
+
+        Arguments:
+            event_type {str} -- the event type (e.g. PAYMENT.CAPTURE.COMPLETED) or ALL_EVENTS
+            handler {Callable[[WebhookEvent], None]} -- the handler
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+
+    def handler(self, *event_types: str) -> Callable:
+        """Decorator registering an event handler for the given event types (every type if none is given)
+        """
+        def register(handler: Callable[[WebhookEvent], None]) -> Callable[[WebhookEvent], None]:
+            for event_type in event_types or (ALL_EVENTS,):
+                self.add_handler(event_type, handler)
+            return handler
+
+        return register
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _claim(self, event_id: str) -> bool:
+        """Marks an event as in flight unless it's in flight or handled already
+        """
+        with self._lock:
+            if event_id in self._in_flight or event_id in self.deduplicator:
+                return False
+
+            self._in_flight.add(event_id)
+            return True
+
+    def _release(self, event_id: str):
+        with self._lock:
+            self._in_flight.discard(event_id)
+
+    def _verify(self, headers: Mapping[str, str], body: bytes) -> bool:
+        signature = signature_from_headers(headers, self.webhook_id)
+
+        if self._client != None:
+            return self._client.verify_webhook_signature(signature, body, self._verifier) == SignatureVerificationStatus.SUCCESS
+
+        try:
+            return self._verifier.verify(signature, body) == SignatureVerificationStatus.SUCCESS
+        except LocalVerificationError:
+            return False
+
+    def receive(self, headers: Mapping[str, str], body: bytes) -> IngestStatus:
+        """Takes a webhook delivery, the answer can be sent right away
+           since the event is handled in the background
+
+        Arguments:
+            headers {Mapping[str, str]} -- the delivery headers
+            body {bytes} -- the raw delivery body, exactly as received
+
+        Returns:
+            IngestStatus -- the delivery outcome, its http_status is the answer for PayPal
+        """
+        self._count('received')
+
+        if self.webhook_id != None and not self._verify(headers, body):
+            self._count('rejected')
+            return IngestStatus.INVALID_SIGNATURE
+
+        try:
+            data = self._codec.loads(body)
+            event_id = data['id']
+        except Exception:
+            self._count('rejected')
+            return IngestStatus.MALFORMED
+
+        if not self._claim(event_id):
+            self._count('duplicates')
+            return IngestStatus.DUPLICATE
+
+        try:
+            self._queue.put_nowait((event_id, data))
+        except queue.Full:
+            self._release(event_id)
+            self._count('overloaded')
+            return IngestStatus.OVERLOADED
+
+        self._count('accepted')
+        return IngestStatus.ACCEPTED
+
+    def dispatch(self, event: WebhookEvent) -> IngestStatus:
+        """Handles an already trusted event (e.g. read from the API) in the calling thread, 
+           skipping it if it was seen before
+
+        Arguments:
+            event {WebhookEvent} -- the event
+
+        Returns:
+            IngestStatus -- ACCEPTED if the event was handled, DUPLICATE otherwise
+        """
+        if not self._claim(event.event_id):
+            self._count('duplicates')
+            return IngestStatus.DUPLICATE
+
+        self._count('accepted')
+        self._handle(event.event_id, event)
+        return IngestStatus.ACCEPTED
+
+    def _handle(self, event_id: str, event: WebhookEvent = None, data: dict = None):
+        """Parses (if needed) & handles an in flight event, its id is registered only if every handler succeeds
+           so redeliveries & backfills of a failed event process it again
+        """
+        try:
+            event = event or WebhookEvent.serialize_from_json(data)
+
+            for handler in self._handlers.get(event.event_type, []) + self._handlers.get(ALL_EVENTS, []):
+                handler(event)
+
+            self.deduplicator.add(event_id)
+            self._count('handled')
+        except Exception as e:
+            self._count('failed')
+            if self._on_error:
+                self._on_error(event, e)
+        finally:
+            self._release(event_id)
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+
+            try:
+                if item is _STOP:
+                    return
+                self._handle(item[0], data=item[1])
+            except Exception:
+                # A failing on_error callback must not stop the worker
+                pass
+            finally:
+                self._queue.task_done()
+
+    def start(self) -> 'WebhookIngestor':
+        """Starts the handler threads
+        """
+        if not self._threads:
+            self._threads = [ threading.Thread(target=self._work, daemon=True) for _ in range(self._workers) ]
+
+            for thread in self._threads:
+                thread.start()
+
+        return self
+
+    def join(self):
+        """Waits until every queued event is handled
+        """
+        self._queue.join()
+
+    def stop(self, wait: bool = True):
+        """Stops the handler threads once the queued events are handled
+
+        Keyword Arguments:
+            wait {bool} -- wait for the threads to finish (default: {True})
+        """
+        for _ in self._threads:
+            self._queue.put(_STOP)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+        self._threads = []
+
+    def stats(self) -> IngestStats:
+        with self._lock:
+            return IngestStats(**self._counters, queued=self._queue.qsize())
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        self.stop()
+
+"""
+    Max page size of the event notifications listing
+"""
+MAX_EVENTS_PAGE_SIZE = 300
+
+class BackfillStats(NamedTuple):
+    """Backfill counters
+    """
+    windows: int
+    resumed: int
+    events: int
+    duplicates: int
+
+class BackfillCheckpoint:
+    """Finished backfill windows, persisted in a json file replaced atomically on every update.
+    """
+    def __init__(self, path: str):
+        """Constructor
+
+        Arguments:
+            path {str} -- the checkpoint file path
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+        try:
+            with open(path) as f:
+                self._done = set(json.load(f).get('windows', []))
+        except (FileNotFoundError, ValueError):
+            self._done = set()
+
+    @staticmethod
+    def _key(window: Tuple[datetime, datetime]) -> str:
+        return '{}/{}'.format(window[0].isoformat(), window[1].isoformat())
+
+    def is_done(self, window: Tuple[datetime, datetime]) -> bool:
+        return self._key(window) in self._done
+
+    def complete(self, window: Tuple[datetime, datetime]):
+        """Marks a window as finished
+
+        Arguments:
+            window {Tuple[datetime, datetime]} -- the (start, end) window
+        """
+        with self._lock:
+            self._done.add(self._key(window))
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({ 'windows': sorted(self._done) }, f)
+                os.replace(tmp_path, self.path)
+            except:
+                os.remove(tmp_path)
+                raise
+
+class EventBackfill:
+    """Replays the webhook events of a time range through an ingestor handlers.
+    """
+    def __init__(
+            self, client: EventClient, ingestor: WebhookIngestor, checkpoint: BackfillCheckpoint = None,
+            window: timedelta = timedelta(hours=1), page_size: int = MAX_EVENTS_PAGE_SIZE, 
+            max_workers: int = 8, event_type: str = None
+        ):
+        """Constructor
+
+        Arguments:
+            client {EventClient} -- the event notifications client
+            ingestor {WebhookIngestor} -- ingestor with the event handlers & the seen events
+
+        Keyword Arguments:
+            checkpoint {BackfillCheckpoint} -- finished windows, every window is read if None (default: {None})
+            window {timedelta} -- size of the windows read at once (default: {timedelta(hours=1)})
+            page_size {int} -- events per page (default: {MAX_EVENTS_PAGE_SIZE})
+            max_workers {int} -- max windows read at once (default: {8})
+            event_type {str} -- event type filter (default: {None})
+        """
+        self.client = client
+        self.ingestor = ingestor
+        self.checkpoint = checkpoint
+        self.window = window
+        self.page_size = min(page_size, MAX_EVENTS_PAGE_SIZE)
+        self.max_workers = max_workers
+        self.event_type = event_type
+
+    def _replay_window(self, window: Tuple[datetime, datetime]) -> Tuple[int, int]:
+        events, duplicates = 0, 0
+
+        for event in self.client.iter_event_notifications(self.page_size, event_type=self.event_type, date=DateRange(*window)):
+            events += 1
+            if self.ingestor.dispatch(event) == IngestStatus.DUPLICATE:
+                duplicates += 1
+
+        if self.checkpoint:
+            self.checkpoint.complete(window)
+
+        return events, duplicates
+
+    def run(self, start: datetime, end: datetime) -> BackfillStats:
+        """Replays the events of a time range, windows are read concurrently & each event 
+           is handled in its window thread, a window is checkpointed once all of its events are handled.
+           Events accepted by the ingestor but never handled (e.g. queued during a crash) aren't 
+           registered as seen, so they're handled now.
+
+        Arguments:
+            start {datetime} -- range start
+            end {datetime} -- range end
+
+        Raises:
+            PageRequestError: If a page can't be read (finished windows are kept in the checkpoint)
+
+        Returns:
+            BackfillStats -- the backfill counters
+        """
+        windows = date_windows(start, end, self.window)
+        pending = [ x for x in windows if not (self.checkpoint and self.checkpoint.is_done(x)) ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._replay_window, pending))
+
+        return BackfillStats(
+            len(windows), len(windows) - len(pending), 
+            sum(x[0] for x in results), sum(x[1] for x in results)
+        )
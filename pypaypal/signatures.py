@@ -0,0 +1,367 @@
+"""Module with local webhook signature verification.
+
+   PayPal signs every webhook delivery with the key of the certificate behind
+   the PAYPAL-CERT-URL header, the signed message is:
+
+        <transmission id>|<transmission time>|<webhook id>|<crc32 of the raw body>
+
+   Certificates are only fetched from PayPal hosts over https, their chain
+   must lead to a trusted root CA (the requests CA bundle by default) & every
+   certificate in it must be within its validity period. Verified certificates
+   are kept in a process wide LRU cache, so after the first delivery a
+   verification is just a local RSA check instead of an API call.
+
+        pip install pypaypal[webhooks]
+"""
+import time
+import zlib
+import base64
+import warnings
+import threading
+import urllib.parse
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, List, Mapping, Sequence, Tuple
+
+import requests
+import requests.certs
+
+try:
+    from cryptography import x509
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+except ImportError: # pragma: no cover
+    x509 = None
+
+from pypaypal.entities.webhooks import WebhookSignature, SignatureVerificationStatus
+
+"""
+    Signature hashes by PAYPAL-AUTH-ALGO
+"""
+_HASHES = {
+    'SHA256withRSA': 'SHA256',
+    'SHA384withRSA': 'SHA384',
+    'SHA512withRSA': 'SHA512'
+}
+
+"""
+    Webhook signature headers by WebhookSignature attribute
+"""
+_SIGNATURE_HEADERS = {
+    'auth_algo': 'paypal-auth-algo',
+    'cert_url': 'paypal-cert-url',
+    'transmission_id': 'paypal-transmission-id',
+    'transmission_sig': 'paypal-transmission-sig',
+    'transmission_time': 'paypal-transmission-time'
+}
+
+class LocalVerificationError(Exception):
+    """
+        The signature can't be checked locally (untrusted or unavailable
+        certificate, unsupported algorithm, etc), it should be verified
+        through the API instead.
+    """
+    pass
+
+def _fetch_certificate(url: str, timeout: float) -> bytes:
+    response = requests.get(url, timeout=timeout)
+    response.raise_for_status()
+    return response.content
+
+def _validity(certificate: 'x509.Certificate') -> Tuple[datetime, datetime]:
+    if hasattr(certificate, 'not_valid_after_utc'):
+        return certificate.not_valid_before_utc, certificate.not_valid_after_utc
+    return certificate.not_valid_before.replace(tzinfo=timezone.utc), certificate.not_valid_after.replace(tzinfo=timezone.utc)
+
+def _is_issued_by(certificate: 'x509.Certificate', issuer: 'x509.Certificate') -> bool:
+    try:
+        certificate.verify_directly_issued_by(issuer)
+        return True
+    except (ValueError, TypeError, InvalidSignature):
+        return False
+
+def _is_ca(certificate: 'x509.Certificate') -> bool:
+    try:
+        return certificate.extensions.get_extension_for_class(x509.BasicConstraints).value.ca
+    except x509.ExtensionNotFound:
+        return False
+
+def _check_validity(certificate: 'x509.Certificate', now: datetime) -> datetime:
+    not_before, not_after = _validity(certificate)
+
+    if not not_before <= now < not_after:
+        raise LocalVerificationError('Certificate outside of its validity period: {}'.format(certificate.subject.rfc4514_string()))
+
+    return not_after
+
+def verify_chain(chain: Sequence['x509.Certificate'], roots: Sequence['x509.Certificate'], now: datetime = None) -> datetime:
+    """Verifies that a certificate chain leads to a trusted root CA
+
+    Arguments:
+        chain {Sequence[x509.Certificate]} -- the leaf certificate followed by its intermediates
+        roots {Sequence[x509.Certificate]} -- the trusted root certificates
+
+    Keyword Arguments:
+        now {datetime} -- verification time, the current time if None (default: {None})
+
+    Raises:
+        LocalVerificationError: If a certificate is outside of its validity period or the chain isn't trusted
+
+    Returns:
+        datetime -- the earliest expiration date in the chain
+    """
+    now = now or datetime.now(timezone.utc)
+    current, intermediates = chain[0], list(chain[1:])
+    expiration = _check_validity(current, now)
+
+    # every hop consumes an intermediate, so the walk always ends
+    while True:
+        root = next((x for x in roots if _is_issued_by(current, x)), None)
+
+        if root != None:
+            return min(expiration, _check_validity(root, now))
+
+        issuer = next((x for x in intermediates if _is_ca(x) and _is_issued_by(current, x)), None)
+
+        if issuer == None:
+            raise LocalVerificationError('Untrusted certificate chain: {}'.format(chain[0].subject.rfc4514_string()))
+
+        intermediates.remove(issuer)
+        expiration = min(expiration, _check_validity(issuer, now))
+        current = issuer
+
+"""
+    Root certificates of the requests CA bundle, loaded on first use
+"""
+_PEM_END = b'-----END CERTIFICATE-----'
+_DEFAULT_ROOTS = None
+_DEFAULT_ROOTS_LOCK = threading.Lock()
+
+def _default_roots() -> List['x509.Certificate']:
+    global _DEFAULT_ROOTS
+
+    with _DEFAULT_ROOTS_LOCK:
+        if _DEFAULT_ROOTS == None:
+            with open(requests.certs.where(), 'rb') as bundle:
+                blocks = bundle.read().split(_PEM_END)[:-1]
+
+            # roots are parsed one by one so a malformed one doesn't discard the whole bundle
+            roots = []
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                for block in blocks:
+                    try:
+                        roots.append(x509.load_pem_x509_certificate(block + _PEM_END))
+                    except ValueError:
+                        continue
+
+            _DEFAULT_ROOTS = roots
+
+        return _DEFAULT_ROOTS
+
+def signature_from_headers(headers: Mapping[str, str], webhook_id: str) -> WebhookSignature:
+    """Builds a webhook signature from the delivery headers
+
+    Arguments:
+        headers {Mapping[str, str]} -- the webhook request headers
+        webhook_id {str} -- the id of the webhook receiving the delivery
+
+    Returns:
+        WebhookSignature -- the signature (without event)
+    """
+    headers = { k.lower(): v for k,v in headers.items() }
+    return WebhookSignature(webhook_id=webhook_id, **{ k: headers.get(v) for k,v in _SIGNATURE_HEADERS.items() })
+
+def signed_message(signature: WebhookSignature, body: bytes) -> bytes:
+    """Builds the message signed by PayPal for a webhook delivery
+
+    Arguments:
+        signature {WebhookSignature} -- the delivery signature
+        body {bytes} -- the raw request body
+
+    Returns:
+        bytes -- the signed message
+    """
+    crc = zlib.crc32(body) & 0xffffffff
+    return '{}|{}|{}|{}'.format(signature.transmission_id, signature.transmission_time, signature.webhook_id, crc).encode('utf-8')
+
+class CertificateCache:
+    """Thread safe LRU cache of signing certificates by url with a time to live,
+       certificates are dropped before their expiration date.
+    """
+    def __init__(self, ttl: float = 86400, max_size: int = 32):
+        """Constructor
+
+        Keyword Arguments:
+            ttl {float} -- seconds to keep a certificate (default: {86400})
+            max_size {int} -- max amount of certificates kept (default: {32})
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._certificates = OrderedDict()
+
+    def get(self, url: str) -> 'x509.Certificate':
+        """Gets a cached certificate
+
+        Arguments:
+            url {str} -- the certificate url
+
+        Returns:
+            x509.Certificate -- the certificate, None if missing or expired
+        """
+        with self._lock:
+            entry = self._certificates.get(url)
+
+            if entry == None:
+                return None
+
+            if entry[0] <= time.monotonic():
+                del self._certificates[url]
+                return None
+
+            self._certificates.move_to_end(url)
+            return entry[1]
+
+    def put(self, url: str, certificate: 'x509.Certificate', ttl: float = None):
+        """Caches a certificate, the least recently used one is dropped if the cache is full
+
+        Arguments:
+            url {str} -- the certificate url
+            certificate {x509.Certificate} -- the certificate
+
+        Keyword Arguments:
+            ttl {float} -- seconds to keep the certificate, the cache ttl if None (default: {None})
+        """
+        with self._lock:
+            self._certificates[url] = (time.monotonic() + (self.ttl if ttl == None else ttl), certificate)
+            self._certificates.move_to_end(url)
+
+            while len(self._certificates) > self.max_size:
+                self._certificates.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._certificates.clear()
+
+    def __len__(self):
+        return len(self._certificates)
+
+class LocalSignatureVerifier:
+    """Verifies webhook signatures with the PayPal signing certificates,
+       trusting only certificates served over https by PayPal hosts whose
+       chain leads to a trusted root CA.
+    """
+    def __init__(self, cache: CertificateCache = None, fetcher: Callable[[str], bytes] = None, timeout: float = 5,
+                 trusted_roots: Sequence['x509.Certificate'] = None):
+        """Constructor
+
+        Keyword Arguments:
+            cache {CertificateCache} -- certificate cache (default: {None})
+            fetcher {Callable[[str], bytes]} -- gets the PEM certificate chain of an url, over https with requests if None (default: {None})
+            timeout {float} -- certificate download timeout in seconds (default: {5})
+            trusted_roots {Sequence[x509.Certificate]} -- trusted root CAs, the requests CA bundle if None (default: {None})
+        """
+        self.cache = cache or CertificateCache()
+        self._roots = trusted_roots
+        self._fetcher = fetcher or (lambda url: _fetch_certificate(url, timeout))
+
+    @staticmethod
+    def is_trusted_url(url: str) -> bool:
+        """Checks if a certificate url belongs to PayPal
+
+        Arguments:
+            url {str} -- the certificate url
+
+        Returns:
+            bool -- True if it's an https url of a paypal.com host
+        """
+        parsed = urllib.parse.urlparse(url or '')
+        host = (parsed.hostname or '').lower()
+        return parsed.scheme == 'https' and (host == 'paypal.com' or host.endswith('.paypal.com'))
+
+    def certificate(self, url: str) -> 'x509.Certificate':
+        """Gets a signing certificate, from the cache if possible
+
+        Arguments:
+            url {str} -- the certificate url
+
+        Raises:
+            LocalVerificationError: If the certificate is untrusted, outside of its validity period or can't be fetched
+
+        Returns:
+            x509.Certificate -- the certificate
+        """
+        if x509 == None:
+            raise LocalVerificationError('Local verification requires cryptography, install it with: pip install cryptography')
+
+        if not self.is_trusted_url(url):
+            raise LocalVerificationError('Untrusted certificate url: {}'.format(url))
+
+        certificate = self.cache.get(url)
+
+        if certificate != None:
+            return certificate
+
+        try:
+            chain = x509.load_pem_x509_certificates(self._fetcher(url))
+        except Exception as e:
+            raise LocalVerificationError('Unable to load the certificate: {}'.format(url)) from e
+
+        now = datetime.now(timezone.utc)
+        expiration = verify_chain(chain, self._roots if self._roots != None else _default_roots(), now)
+
+        certificate = chain[0]
+        self.cache.put(url, certificate, min(self.cache.ttl, (expiration - now).total_seconds()))
+        return certificate
+
+    def verify(self, signature: WebhookSignature, body: bytes) -> SignatureVerificationStatus:
+        """Verifies a webhook delivery signature
+
+        Arguments:
+            signature {WebhookSignature} -- the delivery signature
+            body {bytes} -- the raw request body, exactly as received
+
+        Raises:
+            LocalVerificationError: If the signature can't be checked locally
+
+        Returns:
+            SignatureVerificationStatus -- Verification status
+        """
+        hash_name = _HASHES.get(signature.auth_algo)
+
+        if hash_name == None:
+            raise LocalVerificationError('Unsupported signature algorithm: {}'.format(signature.auth_algo))
+
+        certificate = self.certificate(signature.cert_url)
+
+        try:
+            certificate.public_key().verify(
+                base64.b64decode(signature.transmission_sig or ''), signed_message(signature, body),
+                padding.PKCS1v15(), getattr(hashes, hash_name)()
+            )
+            return SignatureVerificationStatus.SUCCESS
+        except (InvalidSignature, ValueError):
+            return SignatureVerificationStatus.FAILURE
+
+"""
+    Process wide verifier
+"""
+_DEFAULT_VERIFIER = None
+_DEFAULT_VERIFIER_LOCK = threading.Lock()
+
+def default_verifier() -> LocalSignatureVerifier:
+    """Gets the process wide verifier, sharing its certificate cache between clients
+
+    Returns:
+        LocalSignatureVerifier -- the verifier
+    """
+    global _DEFAULT_VERIFIER
+
+    with _DEFAULT_VERIFIER_LOCK:
+        if _DEFAULT_VERIFIER == None:
+            _DEFAULT_VERIFIER = LocalSignatureVerifier()
+
+        return _DEFAULT_VERIFIER
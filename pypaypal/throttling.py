@@ -0,0 +1,269 @@
+"""Module with client side rate limiting for the session requests.
+
+   PayPal throttles each API family separately, a RateLimiter keeps a token
+   bucket & a max in flight requests limit per resource path so a busy family
+   (e.g. reporting jobs) doesn't starve the rest (e.g. checkout) of a shared
+   set of credentials.
+"""
+import time
+import asyncio
+import threading
+import urllib.parse
+
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, NamedTuple
+
+class RateLimit(NamedTuple):
+    """Limits for a family of API resources.
+    """
+    # Sustained requests per second, unlimited if None.
+    rate: float = None
+    # Max requests sent at once after an idle period.
+    burst: int = 1
+    # Max concurrent requests, unlimited if None.
+    max_in_flight: int = None
+
+class ThrottleStats(NamedTuple):
+    """Queue wait statistics for a family of API resources.
+    """
+    requests: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0
+
+class _Slots:
+    """In flight requests counter shared by threads & asyncio tasks (of any event loop).
+
+        Freed slots are handed over to the waiters in arrival order, threads
+        wait on an event & tasks on a future of their own loop.
+    """
+    def __init__(self, size: int):
+        self.size = size
+        self._used = 0
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def acquire(self):
+        with self._lock:
+            if self._used < self.size and not self._waiters:
+                self._used += 1
+                return
+
+            waiter = threading.Event()
+            self._waiters.append(waiter)
+
+        waiter.wait()
+
+    async def acquire_async(self):
+        loop = asyncio.get_event_loop()
+
+        with self._lock:
+            if self._used < self.size and not self._waiters:
+                self._used += 1
+                return
+
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            await waiter[1]
+        except BaseException:
+            with self._lock:
+                queued = waiter in self._waiters
+                if queued:
+                    self._waiters.remove(waiter)
+
+            # A slot handed over to a cancelled future is freed by _hand_over
+            if not queued and waiter[1].done() and not waiter[1].cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        with self._lock:
+            if not self._waiters:
+                self._used -= 1
+                return
+
+            waiter = self._waiters.popleft()
+
+        if isinstance(waiter, threading.Event):
+            waiter.set()
+            return
+
+        loop, future = waiter
+
+        try:
+            loop.call_soon_threadsafe(self._hand_over, future)
+        except RuntimeError:
+            # The waiter loop is closed
+            self.release()
+
+    def _hand_over(self, future: asyncio.Future):
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(None)
+
+class _Throttle:
+    """Token bucket & in flight limit for a single API family, 
+       shared by the blocking & asyncio sessions.
+    """
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._tokens = float(limit.burst)
+        self._updated_at = time.monotonic()
+        self._slots = _Slots(limit.max_in_flight) if limit.max_in_flight else None
+        self._requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _reserve(self) -> float:
+        """Takes a token from the bucket
+
+        Returns:
+            float -- seconds to wait until the reserved token is available
+        """
+        if not self.limit.rate:
+            return 0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.limit.burst, self._tokens + (now - self._updated_at) * self.limit.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return -self._tokens / self.limit.rate if self._tokens < 0 else 0
+
+    def _record(self, wait: float):
+        with self._lock:
+            self._requests += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+    def stats(self) -> ThrottleStats:
+        with self._lock:
+            return ThrottleStats(self._requests, self._total_wait, self._max_wait)
+
+    @contextmanager
+    def acquire(self):
+        start = time.monotonic()
+
+        if self._slots:
+            self._slots.acquire()
+        try:
+            delay = self._reserve()
+            if delay:
+                time.sleep(delay)
+            self._record(time.monotonic() - start)
+            yield
+        finally:
+            if self._slots:
+                self._slots.release()
+
+    async def acquire_async(self):
+        """Async counterpart of acquire, the slot must be freed with release_async
+        """
+        start = time.monotonic()
+
+        if self._slots:
+            await self._slots.acquire_async()
+        try:
+            delay = self._reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        except:
+            self.release_async()
+            raise
+
+        self._record(time.monotonic() - start)
+
+    def release_async(self):
+        if self._slots:
+            self._slots.release()
+
+class _AsyncAcquisition:
+    """Async context manager for a throttle slot
+    """
+    def __init__(self, throttle: _Throttle):
+        self._throttle = throttle
+
+    async def __aenter__(self):
+        if self._throttle:
+            await self._throttle.acquire_async()
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        if self._throttle:
+            self._throttle.release_async()
+
+class RateLimiter:
+    """Rate limiter for the requests of one or many sessions.
+
+        Limits are keyed by resource path prefixes relative to the API host
+        (e.g. '/v2/checkout/orders', '/v1/reporting') so the same limiter
+        serves live & sandbox sessions, the longest matching prefix wins and
+        requests without a match use the default limit. Blocking & asyncio 
+        sessions (on any event loop) can share a limiter, the in flight limits 
+        count the requests of all of them.
+    """
+    def __init__(self, limits: Dict[str, RateLimit] = None, default: RateLimit = None):
+        """Constructor
+
+        Keyword Arguments:
+            limits {Dict[str, RateLimit]} -- limits by resource path prefix (default: {None})
+            default {RateLimit} -- limit for requests without a matching prefix, unlimited if None (default: {None})
+        """
+        self._throttles = { '/' + k.strip('/'): _Throttle(v) for k,v in (limits or {}).items() }
+        self._prefixes = sorted(self._throttles.keys(), key=len, reverse=True)
+        self._default = _Throttle(default) if default else None
+
+    def _key(self, url: str) -> str:
+        path = urllib.parse.urlparse(url).path
+        return next((x for x in self._prefixes if path == x or path.startswith(x + '/')), None)
+
+    def _throttle(self, url: str) -> _Throttle:
+        key = self._key(url)
+        return self._throttles[key] if key else self._default
+
+    @contextmanager
+    def acquire(self, url: str):
+        """Waits until a request to the given url is allowed,
+           holding an in flight slot until the context exits
+
+        Arguments:
+            url {str} -- the request url
+        """
+        throttle = self._throttle(url)
+
+        if not throttle:
+            yield
+            return
+
+        with throttle.acquire():
+            yield
+
+    def acquire_async(self, url: str) -> _AsyncAcquisition:
+        """Async counterpart of acquire, to be used as an async context manager
+
+        Arguments:
+            url {str} -- the request url
+        """
+        return _AsyncAcquisition(self._throttle(url))
+
+    def stats(self) -> Dict[str, ThrottleStats]:
+        """Queue wait statistics by resource path prefix,
+           requests without a matching prefix are reported under the None key.
+
+        Returns:
+            Dict[str, ThrottleStats] -- the statistics by prefix
+        """
+        stats = { k: v.stats() for k,v in self._throttles.items() }
+
+        if self._default:
+            stats[None] = self._default.stats()
+
+        return stats
@@ -0,0 +1,92 @@
+"""Module with fast ISO-8601 timestamp parsing.
+
+   PayPal timestamps come in a handful of fixed shapes (dates, seconds or
+   fractions with a 'Z', '+0000' or '+00:00' offset), those are parsed with
+   a single regex match, anything else falls back to dateutil.
+"""
+import re
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List
+
+import dateutil.parser
+
+"""
+    PayPal timestamp shapes: 2020-01-31, 2020-01-31T10:20:30Z, 2020-01-31T10:20:30.123Z,
+    2020-01-31T10:20:30+0000, 2020-01-31T10:20:30-07:00, etc.
+"""
+_ISO_8601 = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(Z|[+-]\d{2}:?\d{2})?)?$'
+)
+
+"""
+    Parsed utc offsets by their text
+"""
+_TIMEZONES: Dict[str, timezone] = { 'Z': timezone.utc }
+
+def _timezone(offset: str) -> timezone:
+    tz = _TIMEZONES.get(offset)
+
+    if tz is None:
+        digits = offset.replace(':', '')
+        delta = timedelta(hours=int(digits[1:3]), minutes=int(digits[3:5]))
+        tz = _TIMEZONES[offset] = timezone(-delta if digits[0] == '-' else delta)
+
+    return tz
+
+def parse_timestamp(value: str) -> datetime:
+    """Parses an ISO-8601 timestamp, offsets give aware datetimes
+       while dates & timestamps without offset give naive ones
+
+    Arguments:
+        value {str} -- the timestamp
+
+    Raises:
+        ValueError: If the value is not a valid timestamp
+
+    Returns:
+        datetime -- the parsed timestamp
+    """
+    match = _ISO_8601.match(value)
+
+    if match is None:
+        return dateutil.parser.parse(value)
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+
+    if hour is None:
+        return datetime(int(year), int(month), int(day))
+
+    return datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int(fraction.ljust(6, '0')) if fraction else 0, _timezone(offset) if offset else None
+    )
+
+def parse_timestamps(values: Iterable[str]) -> List[datetime]:
+    """Parses a column of timestamps in one pass, empty or invalid values are
+       parsed as None & repeated values (common in exports) are parsed once
+
+    Arguments:
+        values {Iterable[str]} -- the timestamps
+
+    Returns:
+        List[datetime] -- the parsed timestamps
+    """
+    parsed = dict()
+    result = []
+
+    for value in values:
+        if not value:
+            result.append(None)
+            continue
+
+        if value not in parsed:
+            try:
+                parsed[value] = parse_timestamp(value)
+            except (ValueError, OverflowError):
+                parsed[value] = None
+
+        result.append(parsed[value])
+
+    return result
@@ -0,0 +1,250 @@
+"""Module with shared OAuth token stores.
+
+   A token store lets every process of a fleet (web workers, task queues, etc)
+   reuse the same still valid PayPalToken instead of requesting its own one,
+   tokens are keyed by client id & session mode.
+"""
+import os
+import json
+import mmap
+import sqlite3
+import tempfile
+import threading
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, closing
+from datetime import datetime, timedelta
+from typing import Callable
+
+try:
+    import fcntl
+except ImportError: # pragma: no cover
+    fcntl = None
+
+from pypaypal.http import SessionMode, PayPalToken
+from pypaypal.timestamps import parse_timestamp
+
+def _token_key(client_id: str, mode: SessionMode) -> str:
+    return f'{client_id}:{mode.name}'
+
+def _token_to_json(token: PayPalToken) -> dict:
+    data = token._asdict()
+    data['requested_at'] = token.requested_at.isoformat()
+    return data
+
+def _token_from_json(data: dict) -> PayPalToken:
+    return PayPalToken(**{ **data, 'requested_at': parse_timestamp(data['requested_at']) })
+
+class TokenStore(ABC):
+    """Base class for the shared token stores.
+    """
+    def __init__(self, min_ttl: int = 60):
+        """Constructor
+
+        Keyword Arguments:
+            min_ttl {int} -- min seconds of validity left for a stored token to be reused (default: {60})
+        """
+        self.min_ttl = min_ttl
+        self._thread_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, client_id: str, mode: SessionMode) -> PayPalToken:
+        """Gets a stored token
+
+        Arguments:
+            client_id {str} -- paypal client id
+            mode {SessionMode} -- token session mode
+
+        Returns:
+            PayPalToken -- The stored token or None
+        """
+        pass
+
+    @abstractmethod
+    def put(self, client_id: str, mode: SessionMode, token: PayPalToken):
+        """Publishes a token into the store
+
+        Arguments:
+            client_id {str} -- paypal client id
+            mode {SessionMode} -- token session mode
+            token {PayPalToken} -- the token to be stored
+        """
+        pass
+
+    @contextmanager
+    def _exclusive(self):
+        """Exclusive lock between every store user while a token is fetched
+        """
+        with self._thread_lock:
+            yield
+
+    def is_usable(self, token: PayPalToken, min_ttl: int = None) -> bool:
+        """Checks if a token has enough validity left to be reused
+
+        Arguments:
+            token {PayPalToken} -- the token to check
+
+        Keyword Arguments:
+            min_ttl {int} -- min validity in seconds, defaults to the store setting (default: {None})
+
+        Returns:
+            bool -- True if the token can be reused
+        """
+        ttl = self.min_ttl if min_ttl == None else min_ttl
+        return token != None and token.expires_at - timedelta(seconds=ttl) > datetime.now()
+
+    def fetch(self, client_id: str, mode: SessionMode, fetcher: Callable[[], PayPalToken], min_ttl: int = None) -> PayPalToken:
+        """Gets a usable stored token or fetches & publishes a new one.
+           Only one store user fetches at a time, the rest reuse its token.
+
+        Arguments:
+            client_id {str} -- paypal client id
+            mode {SessionMode} -- token session mode
+            fetcher {Callable[[], PayPalToken]} -- function requesting a new token
+
+        Keyword Arguments:
+            min_ttl {int} -- min validity in seconds, defaults to the store setting (default: {None})
+
+        Returns:
+            PayPalToken -- A usable token
+        """
+        token = self.get(client_id, mode)
+
+        if self.is_usable(token, min_ttl):
+            return token
+
+        with self._exclusive():
+            token = self.get(client_id, mode)
+
+            if not self.is_usable(token, min_ttl):
+                token = fetcher()
+                self.put(client_id, mode, token)
+
+            return token
+
+class FileTokenStore(TokenStore):
+    """Token store backed by a json file shared by every process in a host.
+
+        Reads map the file in memory, writes replace it atomically and
+        fetches are serialized with an advisory lock on a sibling lock file.
+    """
+    def __init__(self, path: str, min_ttl: int = 60):
+        """Constructor
+
+        Arguments:
+            path {str} -- the store file path
+
+        Keyword Arguments:
+            min_ttl {int} -- min seconds of validity left for a stored token to be reused (default: {60})
+        """
+        super().__init__(min_ttl)
+        self.path = path
+        self._lock_path = f'{path}.lock'
+
+    @contextmanager
+    def _exclusive(self):
+        with self._thread_lock, open(self._lock_path, 'a') as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self) -> dict:
+        try:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return {}
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return json.loads(mm[:])
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, client_id: str, mode: SessionMode) -> PayPalToken:
+        data = self._read().get(_token_key(client_id, mode))
+        return _token_from_json(data) if data else None
+
+    def put(self, client_id: str, mode: SessionMode, token: PayPalToken):
+        data = self._read()
+        data[_token_key(client_id, mode)] = _token_to_json(token)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)))
+
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except:
+            os.remove(tmp_path)
+            raise
+
+class SqliteTokenStore(TokenStore):
+    """Token store backed by a sqlite database shared by every process in a host.
+
+        Fetches run inside an immediate transaction so concurrent
+        processes wait for the first fetch instead of requesting new tokens.
+    """
+    def __init__(self, path: str, min_ttl: int = 60, timeout: float = 30):
+        """Constructor
+
+        Arguments:
+            path {str} -- the database file path
+
+        Keyword Arguments:
+            min_ttl {int} -- min seconds of validity left for a stored token to be reused (default: {60})
+            timeout {float} -- seconds to wait for the database lock (default: {30})
+        """
+        super().__init__(min_ttl)
+        self.path = path
+        self.timeout = timeout
+
+        with closing(self._connect()) as conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS paypal_tokens (token_key TEXT PRIMARY KEY, token TEXT NOT NULL)')
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+
+    def _get(self, conn: sqlite3.Connection, client_id: str, mode: SessionMode) -> PayPalToken:
+        row = conn.execute('SELECT token FROM paypal_tokens WHERE token_key = ?', (_token_key(client_id, mode),)).fetchone()
+        return _token_from_json(json.loads(row[0])) if row else None
+
+    def _put(self, conn: sqlite3.Connection, client_id: str, mode: SessionMode, token: PayPalToken):
+        conn.execute(
+            'INSERT OR REPLACE INTO paypal_tokens (token_key, token) VALUES (?, ?)',
+            (_token_key(client_id, mode), json.dumps(_token_to_json(token)))
+        )
+
+    def get(self, client_id: str, mode: SessionMode) -> PayPalToken:
+        with closing(self._connect()) as conn:
+            return self._get(conn, client_id, mode)
+
+    def put(self, client_id: str, mode: SessionMode, token: PayPalToken):
+        with closing(self._connect()) as conn:
+            self._put(conn, client_id, mode, token)
+
+    def fetch(self, client_id: str, mode: SessionMode, fetcher: Callable[[], PayPalToken], min_ttl: int = None) -> PayPalToken:
+        token = self.get(client_id, mode)
+
+        if self.is_usable(token, min_ttl):
+            return token
+
+        conn = self._connect()
+
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            token = self._get(conn, client_id, mode)
+
+            if not self.is_usable(token, min_ttl):
+                token = fetcher()
+                self._put(conn, client_id, mode, token)
+
+            conn.execute('COMMIT')
+            return token
+        except:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
@@ -56,6 +56,12 @@ setup(
         'python-dateutil',
         'requests'
     ],
+    extras_require = {
+        'async': [ 'aiohttp' ],
+        'columnar': [ 'pyarrow' ],
+        'fastjson': [ 'orjson' ],
+        'webhooks': [ 'cryptography>=40' ]
+    },
     license="Apache License 2.0",
     classifiers=[
         'License :: OSI Approved :: Apache Software License',
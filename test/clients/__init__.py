@@ -0,0 +1,9 @@
+"""test module for pypaypal.clients.__init__
+"""
+
+import unittest
+
+# TODO: Write tests here
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""test module for pypaypal.clients.base
+"""
+
+import asyncio
+import unittest
+
+from pypaypal.clients.base import ClientBase, AsyncClientBase, api_operation
+from pypaypal.errors import PageRequestError
+from pypaypal.entities.dispute import Dispute
+from pypaypal.entities.base import ActionLink, PaypalPage, LazyEntity
+
+class PagedIterationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ClientBase('https://api.sandbox.paypal.com/v2/', None)
+        self.pages = {
+            'page-2': PaypalPage.success(None, 4, 2, [3, 4], []),
+            'page-1': PaypalPage.success(None, 4, 2, [1, 2], [ActionLink('page-2', 'next', 'GET')])
+        }
+
+    def test_iteration(self):
+        """Elements must be streamed following the next page links"""
+        elements = self.client._iter_elements(lambda: self.pages['page-1'], lambda x: self.pages[x.href])
+        self.assertEqual(list(elements), [1, 2, 3, 4])
+
+    def test_prefetched_iteration(self):
+        """Prefetched pages must keep the element order"""
+        elements = self.client._iter_elements(lambda: self.pages['page-1'], lambda x: self.pages[x.href], True)
+        self.assertEqual(list(elements), [1, 2, 3, 4])
+
+    def test_page_errors(self):
+        """Pages with errors must stop the iteration"""
+        self.pages['page-2'] = PaypalPage.error(None)
+        elements = self.client._iter_elements(lambda: self.pages['page-1'], lambda x: self.pages[x.href])
+        self.assertEqual(next(elements), 1)
+        self.assertEqual(next(elements), 2)
+        self.assertRaises(PageRequestError, next, elements)
+
+class PageFanOutTests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = ClientBase('https://api.sandbox.paypal.com/v2/', None)
+        self.pages = { x: PaypalPage.success(None, 10, 5, [x], []) for x in range(1, 6) }
+
+    def test_ordered_fan_out(self):
+        """Every page must be read once & yielded by index"""
+        pages = self.client._fan_out_pages(lambda: self.pages[1], lambda x: self.pages[x], 2)
+        self.assertEqual([x.elements[0] for x in pages], [1, 2, 3, 4, 5])
+
+    def test_unordered_fan_out(self):
+        """Every page must be read once when yielded as completed"""
+        pages = self.client._fan_out_pages(lambda: self.pages[1], lambda x: self.pages[x], 2, False)
+        self.assertEqual(sorted(x.elements[0] for x in pages), [1, 2, 3, 4, 5])
+
+class _EchoClient(ClientBase):
+
+    @api_operation
+    def echo(self, value: str):
+        response = yield self._request.get(self._base_url, { 'value': value })
+        return response.upper()
+
+    @api_operation
+    def safe_echo(self, value: str):
+        try:
+            return (yield self._request.get(self._base_url, { 'value': value }))
+        except ValueError:
+            return None
+
+class _AsyncEchoClient(AsyncClientBase, _EchoClient):
+    pass
+
+class _EchoSession:
+
+    def get(self, url, params=None, **kwargs):
+        if not params['value']:
+            raise ValueError(url)
+        return params['value']
+
+class _AsyncEchoSession:
+
+    async def get(self, url, params=None, **kwargs):
+        await asyncio.sleep(0)
+        return _EchoSession().get(url, params, **kwargs)
+
+class ApiOperationTests(unittest.TestCase):
+
+    def test_blocking_operation(self):
+        """Blocking clients must perform the session calls in place"""
+        client = _EchoClient('https://api.sandbox.paypal.com/v2/', _EchoSession())
+        self.assertEqual('PING', client.echo('ping'))
+        self.assertIsNone(client.safe_echo(''))
+        self.assertRaises(ValueError, client.echo, '')
+
+    def test_async_operation(self):
+        """Async clients must share the operation, awaiting its session calls"""
+        client = _AsyncEchoClient('https://api.sandbox.paypal.com/v2/', _AsyncEchoSession())
+        self.assertEqual('PING', asyncio.run(client.echo('ping')))
+        self.assertIsNone(asyncio.run(client.safe_echo('')))
+        self.assertRaises(ValueError, asyncio.run, client.echo(''))
+
+class _PageSession:
+
+    def get(self, url, params=None, **kwargs):
+        return _PageResponse()
+
+class _PageResponse:
+    status_code = 200
+
+    def json(self):
+        return { 'items': [{ 'dispute_id': 'PP-D-1', 'status': 'OPEN' }], 'links': [] }
+
+class LazyPageTests(unittest.TestCase):
+
+    def test_lazy_page(self):
+        """Pages must be parsed lazily only when asked by the call"""
+        client = ClientBase('https://api.sandbox.paypal.com/v1/customer/disputes', _PageSession())
+        link = ActionLink(client._base_url, 'self', 'GET')
+
+        lazy = client._page_from_link(link, 'items', Dispute, lazy=True)
+        eager = client._page_from_link(link, 'items', Dispute)
+
+        self.assertIsInstance(lazy.elements[0], LazyEntity)
+        self.assertIsInstance(eager.elements[0], Dispute)
+        self.assertEqual(lazy.elements[0].json_data['dispute_id'], eager.elements[0].dispute_id)
+
+if __name__ == '__main__':
+    unittest.main()
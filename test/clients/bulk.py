@@ -0,0 +1,173 @@
+"""test module for pypaypal.clients.bulk
+"""
+
+import io
+import csv
+import asyncio
+import itertools
+import unittest
+
+from pypaypal.entities.base import Money, PaypalApiResponse
+from pypaypal.clients.payouts import PayoutClient
+from pypaypal.clients.bulk import BulkExecutor, AsyncBulkExecutor, idempotency_key
+from pypaypal.entities.payouts import PayoutItemDetail, SenderBatchHeader
+from pypaypal.entities.rpayouts import ReferenceType, ReferencedPayoutsItem
+from pypaypal.clients.rpayouts import ReferencedPayoutClient, ReferencedPayoutItemClient
+from pypaypal.clients.trackers import TrackersClient
+from pypaypal.entities.trackers import Tracker
+
+class _Response:
+
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        return self.body
+
+class _PayoutSession:
+    """Session double answering every batch payout with its header
+    """
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, body, **kwargs):
+        self.requests.append((body, kwargs['headers']))
+        return _Response(201, { 'batch_header': { 'payout_batch_id': 'PB-' + body['sender_batch_header']['sender_batch_id'] } })
+
+class _ReferencedPayoutSession:
+    """Session double creating referenced payout items & listing them in pages of two
+    """
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, body, **kwargs):
+        self.requests.append((body, kwargs['headers']))
+        failed = body['reference_id'] == 'declined'
+        return _Response(422 if failed else 200, {
+            'item_id': 'I-' + body['reference_id'], 'reference_id': body['reference_id'], 'processing_state': { 'status': 'SUCCESS' }
+        })
+
+    def get(self, url, params=None, **kwargs):
+        page = int(url.rsplit('page=', 1)[-1]) if 'page=' in url else 1
+        links = [ { 'href': 'https://api.sandbox.paypal.com/v1/payments/referenced-payouts/B1?page={}'.format(page + 1), 'rel': 'next' } ] if page < 3 else []
+        return _Response(200, { 'referenced_payouts': [ { 'item_id': 'I{}'.format(page * 2 + x) } for x in range(2) ], 'links': links })
+
+class _TrackersSession:
+    """Session double adding the trackers of every batch but the 'BAD' transactions, 
+       batches with a 'DOWN' transaction fail
+    """
+    def __init__(self):
+        self.requests = []
+
+    def post(self, url, body, **kwargs):
+        self.requests.append((url, body, kwargs['headers']))
+        trackers = body['trackers']
+
+        if any(x['transaction_id'] == 'DOWN' for x in trackers):
+            return _Response(500, { 'name': 'INTERNAL_SERVER_ERROR', 'message': 'An internal server error occurred.' })
+
+        bad = [ i for i,x in enumerate(trackers) if x['transaction_id'] == 'BAD' ]
+        return _Response(200, {
+            'tracker_identifiers': [ { 'transaction_id': x['transaction_id'], 'tracking_number': x['tracking_number'] } for i,x in enumerate(trackers) if i not in bad ],
+            'errors': [ {
+                'name': 'INVALID_REQUEST', 'message': 'Request is not well-formed.',
+                'details': [ { 'field': '/trackers/{}/transaction_id'.format(i), 'issue': 'INVALID_TRANSACTION_ID' } for i in bad ]
+            } ] if bad else []
+        })
+
+def capture_payment_for_order(order_id: str, request_id: str = None, note: str = None) -> PaypalApiResponse:
+    if order_id == 'boom':
+        raise ConnectionError('Connection reset')
+    return PaypalApiResponse(order_id == 'declined', None, (order_id, request_id, note))
+
+class BulkExecutorTests(unittest.TestCase):
+
+    def test_bulk_run(self):
+        executor = BulkExecutor(max_workers=3, namespace='settlement')
+        items = [ 'o{}'.format(i) for i in range(20) ] + [ 'declined', 'boom', { 'order_id': 'o1', 'note': 'again' } ]
+        results = list(executor.run(capture_payment_for_order, items, 'order_id', ordered=True))
+        summary = executor.summary
+
+        self.assertEqual(items, [ x.input for x in results ])
+        self.assertEqual(idempotency_key('settlement', 'capture_payment_for_order', 'o0'), results[0].response.parsed_response[1])
+        self.assertNotEqual(results[1].request_id, results[-1].request_id)
+        self.assertEqual(results[-1].request_id, next(executor.run(capture_payment_for_order, items[-1:], 'order_id')).request_id)
+        self.assertEqual('again', results[-1].response.parsed_response[2])
+        self.assertIsInstance(results[21].error, ConnectionError)
+        self.assertEqual((23, 21, 2, 1), (summary.total, summary.succeeded, summary.failed, summary.errors))
+
+    def test_namespace_required(self):
+        self.assertRaises(TypeError, BulkExecutor, 4)
+        self.assertRaises(ValueError, AsyncBulkExecutor, namespace='')
+
+    def test_async_bulk_run(self):
+        async def capture(order_id: str, request_id: str = None):
+            await asyncio.sleep(0)
+            return capture_payment_for_order(order_id, request_id)
+
+        async def run():
+            executor = AsyncBulkExecutor(max_workers=4, namespace='settlement')
+            return [ x async for x in executor.run(capture, [ 'o1', 'boom', 'o2' ], 'order_id') ], executor.summary
+
+        results, summary = asyncio.run(run())
+        self.assertEqual({ 'o1', 'o2', 'boom' }, { x.input for x in results })
+        self.assertEqual((3, 2, 1), (summary.total, summary.succeeded, summary.errors))
+
+    def test_chunked_payouts(self):
+        session = _PayoutSession()
+        client = PayoutClient('https://api.sandbox.paypal.com/v1/payments/payouts', session)
+        header = SenderBatchHeader.create('weekly', email_subject='Payout', email_message='Thanks')
+        items = ( PayoutItemDetail.create(amount=Money('USD', '1.00'), receiver='r{}'.format(i)) for i in range(7) )
+
+        result = BulkExecutor(max_workers=2, namespace='payouts').create_batch_payouts(client, header, items, 'run-1', batch_size=3)
+
+        self.assertEqual(['PB-weekly-0', 'PB-weekly-1', 'PB-weekly-2'], [ x.payout_batch_id for x in result.headers ])
+        self.assertEqual([3, 3, 1], sorted(len(x[0]['items']) for x in session.requests)[::-1])
+        self.assertIn(idempotency_key('run-1', 'create_batch_payout', '2'), [ x[1]['PayPal-Request-Id'] for x in session.requests ])
+        self.assertEqual({ 'currency_code': 'USD', 'value': '1.00' }, session.requests[0][0]['items'][0]['amount'])
+        self.assertEqual([], result.failed)
+
+    def test_referenced_payouts(self):
+        session = _ReferencedPayoutSession()
+        client = ReferencedPayoutItemClient('https://api.sandbox.paypal.com/v1/payments/referenced-payouts-items', session)
+        items = [ ReferencedPayoutsItem.create(reference_id=x, reference_type=ReferenceType.TRANSACTION_ID) for x in ('T1', 'T2', 'declined') ]
+        executor = BulkExecutor(max_workers=2, namespace='partner-run')
+
+        results = list(executor.create_referenced_payout_items(client, items, partner_attribution_id='BN-CODE', ordered=True))
+
+        self.assertEqual([True, True, False], [ x.succeeded for x in results ])
+        self.assertEqual('SUCCESS', results[0].response.parsed_response.processing_state.status)
+        self.assertTrue(all(x.elapsed >= 0 for x in results))
+        self.assertEqual(
+            idempotency_key('partner-run', 'create_referenced_payout_item', 'TRANSACTION_ID:T2'), 
+            session.requests[1][1]['PayPal-Request-Id']
+        )
+        self.assertEqual({ 'BN-CODE' }, { x[1]['PayPal-Partner-Attribution-Id'] for x in session.requests })
+
+    def test_referenced_batch_items(self):
+        client = ReferencedPayoutClient('https://api.sandbox.paypal.com/v1/payments/referenced-payouts', _ReferencedPayoutSession())
+        items = client.iter_referenced_batch_payout_items('B1')
+        self.assertEqual(['I2', 'I3', 'I4', 'I5', 'I6', 'I7'], [ x.item_id for x in items ])
+
+    def test_tracker_upload(self):
+        rows = [ 'transaction_id,tracking_number,status,carrier,notify_buyer,carrier_name_other' ]
+        rows += [ 'BAD,45,SHIPPED,FEDEX,false,' ] + [ 'T{0},{0},SHIPPED,FEDEX,true,'.format(i) for i in range(45) ] + [ 'DOWN,46,SHIPPED,OTHER,,Local' ]
+        trackers = itertools.chain(csv.DictReader(io.StringIO('\n'.join(rows))), [ Tracker('T47', '47', 'SHIPPED', 'UPS') ])
+        session = _TrackersSession()
+        client = TrackersClient('https://api.sandbox.paypal.com/v1/shipping/trackers', session)
+
+        report = BulkExecutor(max_workers=2, namespace='trackers').add_trackers(client, trackers)
+
+        self.assertEqual({ 'https://api.sandbox.paypal.com/v1/shipping/trackers-batch' }, { x[0] for x in session.requests })
+        self.assertEqual([20, 20, 8], sorted((len(x[1]['trackers']) for x in session.requests), reverse=True))
+        self.assertIn(
+            { 'transaction_id': 'T0', 'tracking_number': '0', 'status': 'SHIPPED', 'carrier': 'FEDEX', 'notify_buyer': True }, 
+            [ x for r in session.requests for x in r[1]['trackers'] ]
+        )
+        self.assertEqual((48, 39, 3, 1, 9), (report.total, report.added, report.batches, report.failed_batches, report.rejected))
+        self.assertEqual('INVALID_TRANSACTION_ID', next(x.issue for x in report.errors if x.name == 'INVALID_REQUEST'))
+        self.assertEqual('45', next(x.tracker['tracking_number'] for x in report.errors if x.name == 'INVALID_REQUEST'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""test module for pypaypal.clients.payouts
+"""
+
+import asyncio
+import unittest
+
+from pypaypal.errors import PageRequestError
+from pypaypal.entities.payouts import PayoutItem
+from pypaypal.clients.payouts import PayoutClient, AsyncPayoutClient, PayoutItemStatus
+
+class _Response:
+
+    def __init__(self, status_code: int, body: dict):
+        self.status_code = status_code
+        self.body = body
+
+    def json(self):
+        return self.body
+
+class _BatchSession:
+    """Session double serving the pages of a payout batch with the given amount of items
+    """
+    def __init__(self, total_items: int, failed_page: int = None):
+        self.total_items = total_items
+        self.failed_page = failed_page
+        self.pages = []
+
+    def get(self, url, params=None, **kwargs):
+        page, page_size = params['page'], params['page_size']
+        self.pages.append(page)
+
+        if page == self.failed_page:
+            return _Response(500, { 'name': 'INTERNAL_SERVER_ERROR' })
+
+        return _Response(200, {
+            'total_items': self.total_items,
+            'batch_header': { 'payout_batch_id': url.rsplit('/', 1)[-1] },
+            'items': [
+                { 'payout_item_id': 'I{}'.format(x), 'transaction_status': 'SUCCESS', 'payout_item': { 'amount': { 'value': '1.00', 'currency': 'USD' } } }
+                for x in range((page - 1) * page_size, min(page * page_size, self.total_items))
+            ]
+        })
+
+class _AsyncBatchSession(_BatchSession):
+
+    async def get(self, url, params=None, **kwargs):
+        await asyncio.sleep(0)
+        return super().get(url, params, **kwargs)
+
+_URL = 'https://api.sandbox.paypal.com/v1/payments/payouts'
+
+class PayoutItemReaderTests(unittest.TestCase):
+
+    def test_parallel_items(self):
+        session = _BatchSession(25)
+        items = list(PayoutClient(_URL, session).iter_payout_batch_items('B1', page_size=10, max_workers=2, ordered=True))
+
+        self.assertEqual(['I{}'.format(x) for x in range(25)], [ x.payout_item_id for x in items ])
+        self.assertIsInstance(items[0], PayoutItem)
+        self.assertEqual([1, 2, 3], sorted(session.pages))
+
+    def test_compact_items(self):
+        items = PayoutClient(_URL, _BatchSession(3)).iter_payout_batch_items('B1', compact=True)
+        self.assertEqual(PayoutItemStatus('I0', 'SUCCESS', '1.00', 'USD'), next(items))
+
+    def test_page_errors(self):
+        items = PayoutClient(_URL, _BatchSession(25, failed_page=3)).iter_payout_batch_items('B1', page_size=10, ordered=True)
+        self.assertRaises(PageRequestError, list, items)
+
+    def test_async_items(self):
+        async def read():
+            client = AsyncPayoutClient(_URL, _AsyncBatchSession(25))
+            return [ x async for x in client.iter_payout_batch_items('B1', page_size=10, compact=True) ]
+
+        items = asyncio.run(read())
+        self.assertEqual(sorted('I{}'.format(x) for x in range(25)), sorted(x.payout_item_id for x in items))
+
+if __name__ == '__main__':
+    unittest.main()
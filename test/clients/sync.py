@@ -0,0 +1,92 @@
+"""test module for pypaypal.clients.sync
+"""
+
+import time
+import asyncio
+import unittest
+
+from datetime import datetime, timedelta
+
+from pypaypal.clients.sync import SyncClient, AsyncSyncClient, date_windows, MAX_QUERY_WINDOW
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, body: dict):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+class _WindowSession:
+    """Session double serving a single page with a single transaction per window
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        time.sleep(0.01)
+        return _Response({ 'transaction_details': [{ 'window': params['start_date'] }], 'total_pages': 1 })
+
+class _AsyncWindowSession(_WindowSession):
+
+    async def get(self, url, params=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return _Response({ 'transaction_details': [{ 'window': params['start_date'] }], 'total_pages': 1 })
+
+_URL = 'https://api.sandbox.paypal.com/v1/reporting/transactions'
+
+class DateWindowTests(unittest.TestCase):
+
+    def test_windows(self):
+        """Windows must cover the whole range without overlapping or exceeding the API limit"""
+        start, end = datetime(2020, 1, 1), datetime(2020, 12, 31, 23, 59, 59)
+        windows = date_windows(start, end)
+
+        self.assertEqual(windows[0][0], start)
+        self.assertEqual(windows[-1][1], end)
+
+        for (s, e), (next_start, _) in zip(windows, windows[1:]):
+            self.assertLessEqual(e - s, MAX_QUERY_WINDOW)
+            self.assertEqual(next_start - e, timedelta(seconds=1))
+
+    def test_single_window(self):
+        """Short ranges must be queried at once"""
+        start = datetime(2020, 1, 1)
+        self.assertEqual(date_windows(start, start + timedelta(days=3)), [(start, start + timedelta(days=3))])
+
+class ExportCancellationTests(unittest.TestCase):
+
+    def setUp(self):
+        self.start, self.end = datetime(2020, 1, 1), datetime(2020, 12, 31)
+
+    def test_closed_export(self):
+        """Windows still queued when the export is closed must not be requested"""
+        session = _WindowSession()
+        details = SyncClient(_URL, session).export_transactions(self.start, self.end, max_workers=1, raw=True)
+
+        next(details)
+        details.close()
+        time.sleep(0.2)
+
+        self.assertLess(session.calls, len(date_windows(self.start, self.end)))
+
+    def test_closed_async_export(self):
+        """Closing an async export must stop every window producer"""
+        session = _AsyncWindowSession()
+
+        async def read_first():
+            details = AsyncSyncClient(_URL, session).export_transactions(self.start, self.end, max_workers=2, raw=True)
+            first = await details.__anext__()
+            await details.aclose()
+            return first, [ x for x in asyncio.all_tasks() if x is not asyncio.current_task() ]
+
+        first, running = asyncio.run(read_first())
+
+        self.assertIn('window', first)
+        self.assertEqual(running, [])
+
+if __name__ == '__main__':
+    unittest.main()
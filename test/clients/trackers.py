@@ -0,0 +1,48 @@
+"""test module for pypaypal.clients.trackers
+"""
+
+import unittest
+
+from pypaypal.entities.base import compact_mode
+from pypaypal.entities.trackers import Tracker
+from pypaypal.clients.trackers import TrackersClient
+
+class _Response:
+    status_code = 204
+
+class _TrackerSession:
+    """Session double recording the tracker updates
+    """
+    def __init__(self):
+        self.requests = []
+
+    def put(self, url, body, **kwargs):
+        self.requests.append((url, body))
+        return _Response()
+
+_TRACKER = {
+    'transaction_id': '8MC585209K746392H', 'tracking_number': '443844607820', 'status': 'SHIPPED', 'carrier': 'FEDEX',
+    'shipment_date': '2020-01-20', 'links': [
+        { 'href': 'https://api.sandbox.paypal.com/v1/shipping/trackers/8MC585209K746392H-443844607820', 'rel': 'replace', 'method': 'PUT' }
+    ]
+}
+
+class TrackersClientTests(unittest.TestCase):
+
+    def test_compact_update(self):
+        """Updates must send the tracker properties even if the json response isn't kept"""
+        session = _TrackerSession()
+        client = TrackersClient('https://api.sandbox.paypal.com/v1/shipping/trackers', session)
+
+        with compact_mode():
+            tracker = Tracker.serialize_from_json(_TRACKER)
+
+        tracker.status = 'DELIVERED'
+        self.assertEqual(False, client.update_tracking_info_by_entity(tracker).has_errors)
+        self.assertEqual((_TRACKER['links'][0]['href'], {
+            'transaction_id': '8MC585209K746392H', 'tracking_number': '443844607820', 
+            'status': 'DELIVERED', 'carrier': 'FEDEX', 'shipment_date': '2020-01-20'
+        }), session.requests[0])
+
+if __name__ == '__main__':
+    unittest.main()
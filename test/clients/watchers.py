@@ -0,0 +1,68 @@
+"""test module for pypaypal.clients.watchers
+"""
+
+import unittest
+
+from pypaypal.errors import PayoutWatchError
+from pypaypal.entities.base import PaypalApiResponse
+from pypaypal.entities.payouts import BatchStatus, PagedPayout
+from pypaypal.clients.watchers import PollBackoff, PayoutBatchWatcher
+
+class _PayoutClient:
+    """Payouts client double replaying a status history per batch
+    """
+    def __init__(self, history: dict):
+        self.history = history
+        self.calls = []
+
+    def show_payout_batch_details(self, payout_batch_id, page=1, page_size=1000, fields=None, total_required=True):
+        self.calls.append((payout_batch_id, fields))
+        steps = self.history[payout_batch_id]
+
+        if not steps:
+            return PaypalApiResponse.error(None)
+
+        status, items = steps.pop(0) if len(steps) > 1 else steps[0]
+        return PaypalApiResponse.success(None, PagedPayout.serialize_from_json({
+            'batch_header': { 'payout_batch_id': payout_batch_id, 'batch_status': status },
+            'items': [ { 'payout_item_id': k, 'transaction_status': v } for k,v in items.items() ]
+        }))
+
+class PayoutBatchWatcherTests(unittest.TestCase):
+
+    def test_watch(self):
+        client = _PayoutClient({
+            'B1': [ ('PENDING', { 'I1': 'PENDING', 'I2': 'PENDING' }), ('PROCESSING', { 'I1': 'SUCCESS', 'I2': 'PENDING' }),
+                    ('PROCESSING', { 'I1': 'SUCCESS', 'I2': 'PENDING' }), ('SUCCESS', { 'I1': 'SUCCESS', 'I2': 'UNCLAIMED' }) ],
+            'B2': []
+        })
+        updates = []
+        backoff = PollBackoff(initial=0.001, max_delay=0.01, max_errors=2)
+
+        with PayoutBatchWatcher(client, backoff, track_items=True) as watcher:
+            done = watcher.watch('B1', updates.append)
+            failed = watcher.watch('B2')
+            final = done.result(timeout=5)
+            self.assertRaises(PayoutWatchError, failed.result, 5)
+
+        self.assertEqual(BatchStatus.SUCCESS, final.batch_status)
+        self.assertEqual(3, len(updates))
+        self.assertEqual([ ('I1', 'PENDING', 'SUCCESS') ], [ (x.payout_item_id, x.previous_status, x.status) for x in updates[1].changes ])
+        self.assertEqual([ ('I2', 'PENDING', 'UNCLAIMED') ], [ (x.payout_item_id, x.previous_status, x.status) for x in final.changes ])
+
+    def test_header_polls(self):
+        client = _PayoutClient({ 'B1': [ ('PROCESSING', {}), ('DENIED', {}) ] })
+
+        with PayoutBatchWatcher(client, PollBackoff(initial=0.001)) as watcher:
+            self.assertTrue(watcher.watch('B1').result(timeout=5).is_final)
+
+        self.assertEqual([ ('B1', 'batch_header') ] * 2, client.calls)
+
+    def test_backoff(self):
+        backoff = PollBackoff(initial=1, factor=3, max_delay=5)
+        self.assertEqual(3, backoff.next_delay(1, False))
+        self.assertEqual(5, backoff.next_delay(3, False))
+        self.assertEqual(1, backoff.next_delay(5, True))
+
+if __name__ == '__main__':
+    unittest.main()
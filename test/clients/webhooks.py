@@ -0,0 +1,246 @@
+"""test module for pypaypal.clients.webhooks
+"""
+
+import os
+import base64
+import tempfile
+import unittest
+
+from datetime import datetime, timedelta
+
+from pypaypal.clients.webhooks import EventClient, VerifySignatureClient
+from pypaypal.entities.webhooks import WebhookEvent, SignatureVerificationStatus
+
+from pypaypal.ingestion import (
+    IngestStatus,
+    EventBackfill,
+    WebhookIngestor,
+    BackfillCheckpoint,
+    SqliteDeduplicator
+)
+from pypaypal.signatures import (
+    CertificateCache,
+    LocalSignatureVerifier,
+    LocalVerificationError,
+    signed_message,
+    signature_from_headers
+)
+
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa, padding
+except ImportError:
+    x509 = None
+
+_CERT_URL = 'https://api.sandbox.paypal.com/v1/notifications/certs/CERT-360caa42-fca2a594-1d93a270'
+
+_BODY = b'{"id":"WH-2WR32451HC0233532-67976317FL4543714","event_type":"PAYMENT.CAPTURE.COMPLETED"}'
+
+def _certificate(key, common_name: str, issuer=None, issuer_key=None, ca: bool = False, days: int = 30):
+    name = x509.Name([ x509.NameAttribute(NameOID.COMMON_NAME, common_name) ])
+    now = datetime.utcnow()
+    return x509.CertificateBuilder().subject_name(name).issuer_name(issuer.subject if issuer else name).public_key(
+        key.public_key()
+    ).serial_number(x509.random_serial_number()).not_valid_before(now - timedelta(days=1)).not_valid_after(
+        now + timedelta(days=days)
+    ).add_extension(x509.BasicConstraints(ca=ca, path_length=None), critical=True).sign(issuer_key or key, hashes.SHA256())
+
+def _pem(*certificates) -> bytes:
+    return b''.join(x.public_bytes(serialization.Encoding.PEM) for x in certificates)
+
+@unittest.skipIf(x509 == None, 'cryptography is not installed')
+class LocalSignatureTests(unittest.TestCase):
+
+    def setUp(self):
+        self.fetched = []
+        self.key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.root_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.ca_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        self.root = _certificate(self.root_key, 'Test Root CA', ca=True, days=365)
+        self.ca = _certificate(self.ca_key, 'Test Intermediate CA', self.root, self.root_key, ca=True)
+        pem = _pem(_certificate(self.key, 'messageverificationcerts.paypal.com', self.ca, self.ca_key), self.ca)
+        self.verifier = self._verifier(pem)
+
+    def _verifier(self, pem: bytes) -> LocalSignatureVerifier:
+        return LocalSignatureVerifier(fetcher=lambda url: self.fetched.append(url) or pem, trusted_roots=[self.root])
+
+    def _signature(self, body: bytes):
+        signature = signature_from_headers({
+            'PAYPAL-AUTH-ALGO': 'SHA256withRSA', 'PAYPAL-CERT-URL': _CERT_URL,
+            'Paypal-Transmission-Id': '69cd13f0-d67a-11e5-baa3-778b53f4ae55',
+            'paypal-transmission-time': '2016-02-18T20:01:35Z'
+        }, '1JE4291016473214C')
+        signature.transmission_sig = base64.b64encode(
+            self.key.sign(signed_message(signature, body), padding.PKCS1v15(), hashes.SHA256())
+        ).decode()
+        return signature
+
+    def test_local_verification(self):
+        signature = self._signature(_BODY)
+        client = VerifySignatureClient('https://api.sandbox.paypal.com/v1/notifications/verify-webhook-signature', None)
+
+        self.assertEqual(SignatureVerificationStatus.SUCCESS, client.verify_webhook_signature(signature, _BODY, self.verifier))
+        self.assertEqual(SignatureVerificationStatus.FAILURE, self.verifier.verify(signature, _BODY + b' '))
+        self.assertEqual([_CERT_URL], self.fetched)
+
+        signature.cert_url = 'https://paypal.com.example.org/cert'
+        self.assertRaises(LocalVerificationError, self.verifier.verify, signature, _BODY)
+
+    def test_untrusted_certificates(self):
+        signature = self._signature(_BODY)
+        leaf = _certificate(self.key, 'messageverificationcerts.paypal.com', self.ca, self.ca_key)
+        expired_ca = _certificate(self.ca_key, 'Test Intermediate CA', self.root, self.root_key, ca=True, days=-1)
+        leaf_issuer = _certificate(self.ca_key, 'Test Intermediate CA', self.root, self.root_key)
+
+        untrusted = [
+            # self signed
+            _pem(_certificate(self.key, 'messageverificationcerts.paypal.com')),
+            # missing intermediate
+            _pem(leaf),
+            # expired intermediate
+            _pem(leaf, expired_ca),
+            # intermediate that isn't a CA
+            _pem(leaf, leaf_issuer),
+            # expired leaf
+            _pem(_certificate(self.key, 'messageverificationcerts.paypal.com', self.ca, self.ca_key, days=-1), self.ca)
+        ]
+
+        for pem in untrusted:
+            verifier = self._verifier(pem)
+            self.assertRaises(LocalVerificationError, verifier.verify, signature, _BODY)
+            self.assertEqual(0, len(verifier.cache))
+
+    def test_certificate_cache(self):
+        cache = CertificateCache(max_size=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+        cache.put('d', 4, ttl=0)
+        self.assertIsNone(cache.get('d'))
+
+    def test_ingestion(self):
+        headers = self._signature(_BODY).to_dict()
+        headers = { 'paypal-' + k.replace('_', '-'): v for k,v in headers.items() if k != 'webhook_id' }
+        ingestor = WebhookIngestor('1JE4291016473214C', workers=2, verifier=self.verifier)
+        events = []
+
+        @ingestor.handler('PAYMENT.CAPTURE.COMPLETED')
+        def handle(event):
+            events.append(event)
+            if len(events) == 1:
+                raise ValueError('Handler failure')
+
+        with ingestor:
+            self.assertEqual(IngestStatus.ACCEPTED, ingestor.receive(headers, _BODY))
+            ingestor.join()
+            # failed events are processed again on redelivery
+            self.assertEqual(IngestStatus.ACCEPTED, ingestor.receive(headers, _BODY))
+            ingestor.join()
+            self.assertEqual(IngestStatus.DUPLICATE, ingestor.receive(headers, _BODY))
+            self.assertEqual(IngestStatus.INVALID_SIGNATURE, ingestor.receive(headers, _BODY.replace(b'WH-2', b'WH-3')))
+
+        stats = ingestor.stats()
+        self.assertEqual(['WH-2WR32451HC0233532-67976317FL4543714'] * 2, [ x.event_id for x in events ])
+        self.assertEqual((4, 2, 1, 1, 1, 1), (stats.received, stats.accepted, stats.duplicates, stats.rejected, stats.handled, stats.failed))
+
+    def test_sqlite_deduplicator(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'events.db')
+            dedupe = SqliteDeduplicator(path, cache_size=1)
+            self.assertTrue(dedupe.add('a'))
+            self.assertTrue(dedupe.add('b'))
+            self.assertFalse(dedupe.add('a'))
+            dedupe.discard('b')
+            dedupe.close()
+
+            dedupe = SqliteDeduplicator(path)
+            self.assertFalse(dedupe.add('a'))
+            self.assertTrue(dedupe.add('b'))
+            dedupe.close()
+
+class WebhookIngestorTests(unittest.TestCase):
+
+    def test_malformed_event(self):
+        """A malformed event must fail alone, without stopping the workers"""
+        handled, errors = [], []
+        ingestor = WebhookIngestor(None, workers=1, on_error=lambda event, e: errors.append(event))
+        ingestor.add_handler('PAYMENT.CAPTURE.COMPLETED', lambda e: handled.append(e.event_id))
+
+        with ingestor:
+            for i in range(3):
+                ingestor.receive({}, '{{"id": "WH-bad-{}", "event_type": "PAYMENT.CAPTURE.COMPLETED", "resource": "oops"}}'.format(i).encode())
+            self.assertEqual(IngestStatus.ACCEPTED, ingestor.receive({}, _BODY))
+            ingestor.join()
+            # failed events aren't registered as seen
+            self.assertEqual(IngestStatus.ACCEPTED, ingestor.receive({}, b'{"id": "WH-bad-0", "event_type": "PAYMENT.CAPTURE.COMPLETED"}'))
+            ingestor.join()
+
+        self.assertEqual(['WH-2WR32451HC0233532-67976317FL4543714', 'WH-bad-0'], handled)
+        self.assertEqual([None] * 3, errors)
+        self.assertEqual((3, 2), (ingestor.stats().failed, ingestor.stats().handled))
+
+class _WindowEventClient(EventClient):
+    """Event client listing an event per hour, failing the windows after the given date
+    """
+    def __init__(self, fail_after: datetime = None):
+        super().__init__('https://api.sandbox.paypal.com/v1/notifications/webhooks-events', None)
+        self.fail_after = fail_after
+
+    def iter_event_notifications(self, page_size=10, transaction_id=None, event_type=None, date=None, prefetch=False):
+        if self.fail_after and date.start >= self.fail_after:
+            raise IOError('Outage')
+        yield WebhookEvent.serialize_from_json({ 'id': 'WH-{:%H}'.format(date.start), 'event_type': 'PAYMENT.CAPTURE.COMPLETED' })
+        yield WebhookEvent.serialize_from_json({ 'id': 'WH-live', 'event_type': 'PAYMENT.CAPTURE.COMPLETED' })
+
+class EventBackfillTests(unittest.TestCase):
+
+    def test_resumed_backfill(self):
+        start = datetime(2020, 1, 1)
+        end = start + timedelta(hours=5, minutes=59)
+        ingestor = WebhookIngestor(None)
+        handled = []
+        ingestor.add_handler('PAYMENT.CAPTURE.COMPLETED', lambda e: handled.append(e.event_id))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'backfill.json')
+            backfill = EventBackfill(_WindowEventClient(start + timedelta(hours=3)), ingestor, BackfillCheckpoint(path), max_workers=2)
+            self.assertRaises(IOError, backfill.run, start, end)
+
+            backfill = EventBackfill(_WindowEventClient(), ingestor, BackfillCheckpoint(path), max_workers=2)
+            stats = backfill.run(start, end)
+
+        self.assertEqual((6, 3, 6), (stats.windows, stats.resumed, stats.events))
+        self.assertEqual(['WH-00', 'WH-01', 'WH-02', 'WH-03', 'WH-04', 'WH-05', 'WH-live'], sorted(handled))
+
+    def test_backfill_after_crash(self):
+        """Events accepted but never handled must be recovered by a backfill"""
+        start = datetime(2020, 1, 1)
+        handled = []
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'events.db')
+            dedupe = SqliteDeduplicator(path)
+            # the process dies with the event queued
+            crashed = WebhookIngestor(None, deduplicator=dedupe)
+            self.assertEqual(IngestStatus.ACCEPTED, crashed.receive({}, b'{"id": "WH-00", "event_type": "PAYMENT.CAPTURE.COMPLETED"}'))
+            dedupe.close()
+
+            dedupe = SqliteDeduplicator(path)
+            ingestor = WebhookIngestor(None, deduplicator=dedupe)
+            ingestor.add_handler('PAYMENT.CAPTURE.COMPLETED', lambda e: handled.append(e.event_id))
+            stats = EventBackfill(_WindowEventClient(), ingestor).run(start, start + timedelta(minutes=30))
+            dedupe.close()
+
+        self.assertEqual(['WH-00', 'WH-live'], handled)
+        self.assertEqual(0, stats.duplicates)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,16 @@
 """test module for pypaypal.entities.base
 """
 
+import threading
 import unittest
 
-from pypaypal.entities.base import ApplicationContext
+from concurrent.futures import ThreadPoolExecutor
+
+from pypaypal.entities.dispute import Dispute
+from pypaypal.entities.base import (
+    ApplicationContext, Money, PaypalName, PaypalMerchant, 
+    LazyEntity, PayPalEntity, compact_mode, in_context, parse_entities, _DECODERS, _to_json_value
+)
 
 # TODO: Write tests here
 class ApplicationContextTests(unittest.TestCase):
@@ -29,5 +36,117 @@ class ApplicationContextTests(unittest.TestCase):
         """Create factory method should not raise errors with keyword args"""
         ApplicationContext.create(**self.sample_data)
 
+class EntitySerializationTests(unittest.TestCase):
+
+    def test_to_dict(self):
+        """to_dict should serialize children without sharing state with the entity"""
+        data = { 'email': 'a@b.com', 'merchant_id': 'M', 'name': 'John' }
+        merchant = PaypalMerchant.serialize_from_json(data)
+        merchant.tags = [Money('USD', '1.00'), 'x']
+        d = merchant.to_dict()
+
+        self.assertEqual(d['name'], 'John')
+        self.assertEqual(d['tags'], [{ 'value': '1.00', 'currency_code': 'USD' }, 'x'])
+        self.assertNotIn('_json_response', d)
+        d['tags'].append('y')
+        self.assertEqual(len(merchant.tags), 2)
+
+    def test_slotted_to_dict(self):
+        """Slotted entities should serialize their slots & keep no instance dict"""
+        name = PaypalName.serialize_from_json({ 'given_name': 'John', 'surname': 'Doe' })
+
+        self.assertFalse(hasattr(name, '__dict__'))
+        self.assertEqual(name.to_dict(), { 'surname': 'Doe', 'given_name': 'John' })
+
+    def test_compact_mode(self):
+        """Entities built in compact mode should not retain their json"""
+        data = { 'currency_code': 'USD', 'value': '1.00' }
+
+        with compact_mode():
+            money = Money.serialize_from_json(data)
+
+        self.assertEqual(money.value, '1.00')
+        self.assertEqual(dict(money.json_data), {})
+        self.assertEqual(Money.serialize_from_json(data).json_data, data)
+
+    def test_compact_mode_scope(self):
+        """compact_mode should only apply to the current context & the calls bound to it"""
+        data = { 'currency_code': 'USD', 'value': '1.00' }
+        parsed = []
+
+        with compact_mode():
+            thread = threading.Thread(target=lambda: parsed.append(Money.serialize_from_json(data)))
+            thread.start()
+            thread.join()
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                bound = executor.submit(in_context(Money.serialize_from_json), data).result()
+
+        self.assertEqual(parsed[0].json_data, data)
+        self.assertEqual(dict(bound.json_data), {})
+
+    def test_build_args(self):
+        """_build_args should decode child entities with a decoder compiled once per class"""
+        entity_types, array_types = { 'amount': Money }, { 'fees': Money }
+        data = { 'id': 'A', 'amount': { 'currency_code': 'USD', 'value': '1.00' }, 'fees': [{ 'currency_code': 'USD', 'value': '0.10' }], 'empty': None }
+
+        args = Money._build_args(data, entity_types, array_types)
+        decoder = _DECODERS[Money]
+        Money._build_args(data, entity_types, array_types)
+
+        self.assertIs(decoder, _DECODERS[Money])
+        self.assertEqual(args['id'], 'A')
+        self.assertIsNone(args['empty'])
+        self.assertEqual(args['amount'].value, '1.00')
+        self.assertEqual(args['fees'][0].value, '0.10')
+
+    def test_json_data_read_only(self):
+        """json_data should be a read only view of the response"""
+        data = { 'currency_code': 'USD', 'value': '1.00' }
+        money = Money.serialize_from_json(data)
+
+        self.assertEqual(money.json_data, data)
+        with self.assertRaises(TypeError):
+            money.json_data['value'] = '2.00'
+
+class LazyEntityTests(unittest.TestCase):
+
+    def setUp(self):
+        self.sample_data = [
+            {
+                'dispute_id': f'PP-D-{i}', 'status': 'UNDER_REVIEW', 'create_time': '2019-04-11T04:18:00.000Z', 
+                'links': [{ 'href': f'https://api.paypal.com/v1/customer/disputes/PP-D-{i}', 'rel': 'self', 'method': 'GET' }]
+            } for i in range(3)
+        ]
+
+    def test_equivalence(self):
+        """Lazy proxies should expose the same values as eagerly parsed entities"""
+        eager = parse_entities(Dispute, self.sample_data)
+        lazy = parse_entities(Dispute, self.sample_data, lazy=True)
+
+        for e, l in zip(eager, lazy):
+            self.assertIsInstance(l, LazyEntity)
+            self.assertEqual(e.dispute_id, l.dispute_id)
+            self.assertEqual(e.create_time, l.create_time)
+            self.assertEqual(e.to_dict(), l.to_dict())
+
+    def test_entity_dispatch(self):
+        """Lazy proxies should be handled as entities wherever entities are dispatched on"""
+        eager = parse_entities(Dispute, self.sample_data)
+        lazy = parse_entities(Dispute, self.sample_data, lazy=True)
+
+        self.assertTrue(all(isinstance(x, PayPalEntity) for x in lazy))
+        self.assertEqual(_to_json_value(eager), _to_json_value(lazy))
+
+    def test_partial_decoding(self):
+        """Once a class was fully parsed plain attributes & children shouldn't need a full parse"""
+        parse_entities(Dispute, self.sample_data[:1], lazy=True)[0].materialize()
+        lazy = parse_entities(Dispute, self.sample_data[1:], lazy=True)[0]
+
+        self.assertEqual(lazy.status, 'UNDER_REVIEW')
+        self.assertEqual(lazy.links[0].rel, 'self')
+        self.assertIs(lazy.links, lazy.links)
+        self.assertIsNone(lazy._entity)
+
 if __name__ == '__main__':
     unittest.main()
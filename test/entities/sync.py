@@ -1,9 +1,110 @@
 """test module for pypaypal.entities.sync
 """
 
+import io
+import csv
 import unittest
 
-# TODO: Write tests here
+from datetime import datetime, timedelta, timezone
+
+from pypaypal.timestamps import parse_timestamp, parse_timestamps
+from pypaypal.entities.base import compact_mode, parse_entities
+from pypaypal.entities.sync import (
+    TransactionDetails,
+    CsvTransactionSink, 
+    ArrowTransactionSink
+)
+
+_DETAILS = {
+    'transaction_info': {
+        'transaction_id': '5TY05013RG002845M',
+        'transaction_initiation_date': '2014-07-11T04:03:52+0000',
+        'transaction_amount': { 'currency_code': 'USD', 'value': '465.00' },
+        'fee_amount': { 'currency_code': 'USD', 'value': '-13.79' }
+    },
+    'payer_info': { 'email_address': 'buyer@example.com', 'payer_name': { 'given_name': 'Jane' } },
+    'cart_info': {
+        'item_details': [
+            { 'item_code': 'A', 'item_quantity': '1', 'tax_amounts': [{ 'tax_amount': { 'currency_code': 'USD', 'value': '1.00' } }] },
+            { 'item_code': 'B', 'item_unit_price': { 'currency_code': 'USD', 'value': '3.00' } }
+        ]
+    }
+}
+
+class TransactionSinkTests(unittest.TestCase):
+
+    def test_csv_sink(self):
+        out = io.StringIO()
+
+        with CsvTransactionSink(out, chunk_size=2) as sink:
+            sink.write_all([_DETAILS, TransactionDetails.serialize_from_json(_DETAILS), {}])
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+
+        self.assertEqual(3, sink.rows)
+        self.assertEqual(3, len(rows))
+        self.assertEqual('5TY05013RG002845M', rows[1]['transaction_info.transaction_id'])
+        self.assertEqual('-13.79', rows[0]['transaction_info.fee_amount.value'])
+        self.assertEqual('Jane', rows[0]['payer_info.payer_name.given_name'])
+        self.assertEqual('', rows[2]['transaction_info.transaction_id'])
+
+    def test_entity_inputs(self):
+        """Lazy proxies must be written like their json, compact entities must be rejected"""
+        out = io.StringIO()
+
+        with CsvTransactionSink(out) as sink:
+            sink.write_all(parse_entities(TransactionDetails, [_DETAILS], lazy=True))
+            sink.write(TransactionDetails.serialize_from_json(_DETAILS).json_data)
+
+            with compact_mode(True):
+                compact = TransactionDetails.serialize_from_json(_DETAILS)
+
+            self.assertRaises(ValueError, sink.write, compact)
+
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+
+        self.assertEqual(2, len(rows))
+        self.assertEqual(rows[0], rows[1])
+        self.assertEqual('5TY05013RG002845M', rows[0]['transaction_info.transaction_id'])
+        self.assertEqual('buyer@example.com', rows[0]['payer_info.email_address'])
+
+    def test_arrow_sink_items(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest('pyarrow is not installed')
+
+        sink = ArrowTransactionSink(chunk_size=1, items=True)
+        sink.write(_DETAILS)
+        table = sink.to_table()
+
+        self.assertEqual(2, len(sink.batches))
+        self.assertEqual(['A', 'B'], table.column('cart_info.item_details.item_code').to_pylist())
+        self.assertEqual([None, '3.00'], table.column('cart_info.item_details.item_unit_price.value').to_pylist())
+        self.assertEqual(['USD', 'USD'], table.column('transaction_info.transaction_amount.currency_code').to_pylist())
+        self.assertIn('1.00', table.column('cart_info.item_details.tax_amounts').to_pylist()[0])
+
+        sink = ArrowTransactionSink(parse_dates=True)
+        sink.write_all([_DETAILS, {}])
+        dates = sink.to_table().column('transaction_info.transaction_initiation_date').to_pylist()
+        self.assertEqual([datetime(2014, 7, 11, 4, 3, 52, tzinfo=timezone.utc), None], dates)
+
+    def test_timestamps(self):
+        utc = datetime(2014, 7, 11, 4, 3, 52, tzinfo=timezone.utc)
+
+        for value in ('2014-07-11T04:03:52Z', '2014-07-11T04:03:52+0000', '2014-07-10T21:03:52-07:00', 'Jul 11 2014 04:03:52 UTC'):
+            self.assertEqual(utc, parse_timestamp(value))
+
+        self.assertEqual(datetime(2014, 7, 11), parse_timestamp('2014-07-11'))
+        self.assertEqual(timedelta(hours=-7), parse_timestamp('2014-07-10T21:03:52-0700').utcoffset())
+        self.assertEqual(utc.replace(microsecond=123000), parse_timestamp('2014-07-11T04:03:52.123Z'))
+        self.assertEqual([utc, None, None, utc], parse_timestamps(['2014-07-11T04:03:52Z', '', 'invalid', '2014-07-11T04:03:52Z']))
+
+        info = TransactionDetails.serialize_from_json(_DETAILS).transaction_info
+        self.assertIs(info.transaction_initiation_date, info.transaction_initiation_date)
+        info._transaction_initiation_date = 'invalid'
+        self.assertIsNone(info.transaction_initiation_date)
+        self.assertNotIn('_timestamps', info.to_dict())
 
 if __name__ == '__main__':
     unittest.main()
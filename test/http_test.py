@@ -4,20 +4,38 @@
 """
 
 import os
+import time
+import asyncio
+import tempfile
+import threading
 import unittest
 
+from unittest import mock
+from datetime import datetime, timedelta
+from requests.exceptions import ConnectionError as TransportError
+
 from pypaypal.errors import IdentityError, ExpiredSessionError
 
 from pypaypal.http import ( 
     AuthType,
     parse_url,
     SessionMode,
+    PayPalToken,
+    RetryPolicy,
     PayPalSession,
     SessionStatus,
+    _RefreshableSession,
+    TransportOptions,
+    MIN_REFRESH_DELAY,
     authenticate, 
     session_from_token
 )
 
+from pypaypal import aio
+from pypaypal.codec import JsonResponse, MsgspecCodec, OrjsonCodec, StdlibCodec, default_codec, encode_body
+from pypaypal.tokens import FileTokenStore, SqliteTokenStore
+from pypaypal.throttling import RateLimit, RateLimiter
+
 _MODE = SessionMode.SANDBOX
 
 def test_disposability(session :PayPalSession):
@@ -188,6 +206,52 @@ class TestRefreshableSession(unittest.TestCase):
     def test_delete(self):
         pass
 
+class _FakeResponse:
+
+    def __init__(self, status: int, headers: dict):
+        self.status_code = self.status = status
+        self.headers = headers
+        self.url = 'https://api.sandbox.paypal.com'
+        self.reason = ''
+
+    def close(self):
+        pass
+
+    async def read(self) -> bytes:
+        return b''
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+class _FakeTransport:
+    """Transport double replaying a list of responses (status, headers) or exceptions
+    """
+    def __init__(self, outcomes: list):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def request(self, method: str, url: str, **kwargs):
+        self.calls.append((method, url, kwargs))
+        outcome = self.outcomes.pop(0)
+
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+        return _FakeResponse(*outcome)
+
+    def close(self):
+        pass
+
+class _FakeAsyncTransport(_FakeTransport):
+
+    closed = False
+
+    async def close(self):
+        self.closed = True
+
 class TestModuleMethods(unittest.TestCase):
 
     def test_parse_url(self):
@@ -197,5 +261,252 @@ class TestModuleMethods(unittest.TestCase):
         actual = parse_url('https://api.sandbox.paypal.com/v2', 'billing', '/subscriptions')
         self.assertEqual(expected, actual)
 
+    def test_transport_options(self):
+        """pooled transport creation with custom settings
+        """
+        transport = TransportOptions(pool_maxsize=32, keep_alive=False).create_transport()
+        adapter = transport.get_adapter('https://api.sandbox.paypal.com')
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(transport.headers['Connection'], 'close')
+
+    def test_transport_disposal(self):
+        """the session transport must be released on disposal
+        """
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+        session = session_from_token(token, _MODE)
+        self.assertIsNotNone(session._transport)
+        with session:
+            pass
+        self.assertIsNone(session._transport)
+
+    def test_refresh_limit(self):
+        """expired refreshable sessions without refreshes left must not reach the token endpoint
+        """
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 60, 'nonce', datetime.now() - timedelta(minutes=5))
+        self.assertEqual(token.expires_at, token.requested_at + timedelta(seconds=60))
+
+        with _RefreshableSession(_MODE, token, 'client', 'secret', 0, refresh_margin=30) as session:
+            self.assertIsNone(session._refresh_timer)
+            self.assertRaises(ExpiredSessionError, session.get, 'https://api.sandbox.paypal.com/v2/payments/refunds/1')
+
+    def test_refresh_schedule(self):
+        """background refreshes must keep a min delay & replace the pending one
+        """
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 60, 'nonce', datetime.now())
+
+        with _RefreshableSession(_MODE, token, 'client', 'secret', refresh_margin=120) as session:
+            timer = session._refresh_timer
+            self.assertEqual(timer.interval, MIN_REFRESH_DELAY)
+
+            session._schedule_refresh()
+            self.assertTrue(timer.finished.is_set())
+            self.assertIsNot(timer, session._refresh_timer)
+
+    def test_retry_policy(self):
+        """writes must only be retried with an idempotency key
+        """
+        self.assertNotIn('PayPal-Request-Id', RetryPolicy().prepare_headers('POST', { 'Prefer': 'return=minimal' }))
+
+        policy = RetryPolicy(jitter=False, generate_request_ids=True)
+        headers = policy.prepare_headers('POST', { 'Prefer': 'return=minimal' })
+
+        self.assertIn('PayPal-Request-Id', headers)
+        self.assertEqual(policy.prepare_headers('POST', headers), headers)
+        self.assertTrue(policy.can_retry('POST', headers))
+        self.assertFalse(policy.can_retry('POST', { 'Prefer': 'return=minimal' }))
+        self.assertFalse(policy.can_retry('PATCH', headers))
+        self.assertTrue(policy.can_retry('GET'))
+        self.assertEqual([policy.backoff(x) for x in (1, 2, 3)], [0.5, 1, 2])
+
+    def _retry_session(self, outcomes: list, policy: RetryPolicy):
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+        session = session_from_token(token, _MODE, retry_policy=policy)
+        session._transport.close()
+        session._transport = _FakeTransport(outcomes)
+        return session
+
+    def test_retry_loop(self):
+        """blocking retries must keep the request id, honor Retry-After & respect the attempts limit
+        """
+        url = 'https://api.sandbox.paypal.com/v2/checkout/orders'
+        policy = RetryPolicy(max_attempts=4, jitter=False, generate_request_ids=True)
+        session = self._retry_session([TransportError(), (429, { 'Retry-After': '7' }), (201, {})], policy)
+
+        with mock.patch('pypaypal.http.time.sleep') as sleep:
+            response = session.post(url, { 'intent': 'CAPTURE' })
+
+        request_ids = [ x[2]['headers']['PayPal-Request-Id'] for x in session._transport.calls ]
+        self.assertEqual(201, response.status_code)
+        self.assertEqual(3, len(request_ids))
+        self.assertEqual(1, len(set(request_ids)))
+        self.assertEqual([mock.call(0.5), mock.call(7.0)], sleep.call_args_list)
+
+        # patch requests & post requests without an id are sent once
+        for method, outcomes, call, policy in (
+            ('PATCH', [(503, {})], lambda s: s.patch(url, []), RetryPolicy(generate_request_ids=True)),
+            ('POST', [(503, {})], lambda s: s.post(url, {}), RetryPolicy())
+        ):
+            session = self._retry_session(outcomes, policy)
+            with mock.patch('pypaypal.http.time.sleep'):
+                self.assertEqual(503, call(session).status_code)
+            self.assertEqual([method], [ x[0] for x in session._transport.calls ])
+
+        session = self._retry_session([(503, {})] * 3, RetryPolicy(max_attempts=3))
+        with mock.patch('pypaypal.http.time.sleep'):
+            self.assertEqual(503, session.get(url).status_code)
+        self.assertEqual(3, len(session._transport.calls))
+
+        session = self._retry_session([TransportError()] * 3, RetryPolicy(max_attempts=2))
+        with mock.patch('pypaypal.http.time.sleep'):
+            self.assertRaises(TransportError, session.get, url)
+        self.assertEqual(2, len(session._transport.calls))
+
+    def test_async_retry_loop(self):
+        """asyncio retries must keep the request id, honor Retry-After & respect the attempts limit
+        """
+        url = 'https://api.sandbox.paypal.com/v2/checkout/orders'
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+        delays = []
+
+        async def sleep(delay):
+            delays.append(delay)
+
+        async def send(outcomes: list, policy: RetryPolicy, method: str, *args):
+            session = aio.session_from_token(token, _MODE, retry_policy=policy)
+            session._transport = _FakeAsyncTransport(outcomes)
+            response = await getattr(session, method)(url, *args)
+            return response, session._transport.calls
+
+        with mock.patch('pypaypal.aio.asyncio.sleep', sleep):
+            policy = RetryPolicy(max_attempts=4, jitter=False, generate_request_ids=True)
+            response, calls = asyncio.run(send([asyncio.TimeoutError(), (429, { 'Retry-After': '7' }), (201, {})], policy, 'post', {}))
+            request_ids = [ x[2]['headers']['PayPal-Request-Id'] for x in calls ]
+
+            self.assertEqual(201, response.status_code)
+            self.assertEqual(3, len(request_ids))
+            self.assertEqual(1, len(set(request_ids)))
+            self.assertEqual([0.5, 7.0], delays)
+
+            response, calls = asyncio.run(send([(503, {})], RetryPolicy(generate_request_ids=True), 'patch', []))
+            self.assertEqual((503, 1), (response.status_code, len(calls)))
+
+            response, calls = asyncio.run(send([(503, {})], RetryPolicy(), 'post', {}))
+            self.assertEqual((503, 1), (response.status_code, len(calls)))
+            self.assertNotIn('PayPal-Request-Id', calls[0][2]['headers'])
+
+            response, calls = asyncio.run(send([(503, {})] * 3, RetryPolicy(max_attempts=3), 'get'))
+            self.assertEqual((503, 3), (response.status_code, len(calls)))
+
+            self.assertRaises(TransportError, asyncio.run, send([TransportError()] * 3, RetryPolicy(max_attempts=2), 'get'))
+
+    def test_rate_limiter(self):
+        """requests must be throttled by the longest matching resource prefix
+        """
+        limiter = RateLimiter({ 'v2/checkout': RateLimit(rate=1000), '/v2/checkout/orders': RateLimit(rate=20, max_in_flight=1) })
+
+        for _ in range(3):
+            with limiter.acquire('https://api.paypal.com/v2/checkout/orders/5O190127TN364715T'):
+                pass
+        with limiter.acquire('https://api.paypal.com/v1/reporting/transactions'):
+            pass
+
+        stats = limiter.stats()
+        self.assertEqual(stats['/v2/checkout/orders'].requests, 3)
+        self.assertEqual(stats['/v2/checkout'].requests, 0)
+        self.assertGreaterEqual(stats['/v2/checkout/orders'].total_wait, 0.09)
+
+    def test_shared_rate_limiter(self):
+        """blocking & asyncio requests must share the in flight limit
+        """
+        limiter = RateLimiter(default=RateLimit(max_in_flight=1))
+        url = 'https://api.paypal.com/v2/checkout/orders'
+        events = []
+
+        async def request(name: str):
+            async with limiter.acquire_async(url):
+                events.append(name)
+
+        def blocking_request():
+            with limiter.acquire(url):
+                events.append('thread')
+
+        with limiter.acquire(url):
+            thread = threading.Thread(target=blocking_request)
+            thread.start()
+            time.sleep(0.05)
+            waiting = threading.Thread(target=asyncio.run, args=(request('task'),))
+            waiting.start()
+            time.sleep(0.1)
+            events.append('held')
+
+        thread.join(1)
+        waiting.join(1)
+        asyncio.run(request('other loop'))
+
+        self.assertEqual(events, ['held', 'thread', 'task', 'other loop'])
+
+    def test_token_stores(self):
+        """shared stores must reuse valid tokens & fetch expiring ones
+        """
+        fetched = []
+
+        def fetcher():
+            fetched.append(1)
+            return PayPalToken('scope', f'token{len(fetched)}', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+
+        with tempfile.TemporaryDirectory() as folder:
+            for store in (FileTokenStore(os.path.join(folder, 'tokens.json')), SqliteTokenStore(os.path.join(folder, 'tokens.db'))):
+                fetched.clear()
+                self.assertEqual(store.fetch('client', _MODE, fetcher).access_token, 'token1')
+                self.assertEqual(store.fetch('client', _MODE, fetcher).access_token, 'token1')
+                self.assertIsNone(store.get('client', SessionMode.LIVE))
+                self.assertEqual(store.fetch('client', _MODE, fetcher, min_ttl=3600).access_token, 'token2')
+
+    def test_async_session(self):
+        """asyncio session params, buffered responses & lazy transport disposal
+        """
+        self.assertEqual(aio._query_params({ 'page': 1, 'total_required': True, 'fields': None }), { 'page': 1, 'total_required': 'True' })
+        self.assertEqual(aio.AsyncResponse(200, { 'paypal-debug-id': 'id' }, b'{"id": "1"}').json(), { 'id': '1' })
+
+        async def dispose():
+            token = PayPalToken('scope', 'token', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+            session = aio.session_from_token(token, _MODE)
+            self.assertIsNotNone(session._get_transport())
+            async with session:
+                pass
+            return session
+
+        session = asyncio.run(dispose())
+        self.assertIsNone(session._transport)
+        self.assertEqual(session.status, SessionStatus.DISPOSED)
+
+    def test_json_codecs(self):
+        """codec round trips, body encoding & single response parsing
+        """
+        body = { 'name': 'Café', 'items': [1, 2.5, None, True] }
+
+        for codec_type in (StdlibCodec, OrjsonCodec, MsgspecCodec):
+            try:
+                codec = codec_type()
+            except ImportError:
+                continue
+            self.assertIsInstance(codec.dumps(body), bytes)
+            self.assertEqual(codec.loads(codec.dumps(body)), body)
+
+        codec = StdlibCodec()
+        self.assertEqual(encode_body(codec, body), b'{"name":"Caf\xc3\xa9","items":[1,2.5,null,true]}')
+        self.assertEqual(encode_body(codec, 'grant_type=client_credentials'), 'grant_type=client_credentials')
+
+        raw = aio.AsyncResponse(200, {}, b'{"id": "1"}')
+        response = JsonResponse(raw, codec)
+        self.assertIs(response.json(), response.json())
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.raw_response, raw)
+
+        token = PayPalToken('scope', 'token', 'Bearer', 'app', 3600, 'nonce', datetime.now())
+        with session_from_token(token, _MODE, codec=codec) as session:
+            self.assertIs(session.codec, codec)
+        self.assertIsInstance(aio.session_from_token(token, _MODE).codec, type(default_codec()))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file